@@ -1,7 +1,9 @@
 """Central configuration: URLs, paths, constants."""
 
 import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
@@ -23,49 +25,57 @@ DEFAULT_CACHE_DIR = Path(
 RAW_DIR = "raw"
 EXTRACTED_DIR = "extracted"
 PARQUET_DIR = "parquet"
+JINJA_BYTECODE_DIR = "jinja_bytecode"  # compiled template cache, reused across restarts
 
 # Electoral period -> year used in ZIP filenames on psp.cz
-PERIOD_YEARS: dict[int, str] = {
-    10: "2025",
-    9: "2021",
-    8: "2017",
-    7: "2013",
-    6: "2010",
-    5: "2006",
-    4: "2002",
-    3: "1998",
-    2: "1996",
-    1: "1993",
-}
+# (the period tables are read-only views so no caller can mutate them)
+PERIOD_YEARS: Mapping[int, str] = MappingProxyType(
+    {
+        10: "2025",
+        9: "2021",
+        8: "2017",
+        7: "2013",
+        6: "2010",
+        5: "2006",
+        4: "2002",
+        3: "1998",
+        2: "1996",
+        1: "1993",
+    }
+)
 
 # Electoral period -> human-readable label (start–end)
-PERIOD_LABELS: dict[int, str] = {
-    10: "2025–present",
-    9: "2021–2025",
-    8: "2017–2021",
-    7: "2013–2017",
-    6: "2010–2013",
-    5: "2006–2010",
-    4: "2002–2006",
-    3: "1998–2002",
-    2: "1996–1998",
-    1: "1993–1996",
-}
+PERIOD_LABELS: Mapping[int, str] = MappingProxyType(
+    {
+        10: "2025–present",
+        9: "2021–2025",
+        8: "2017–2021",
+        7: "2013–2017",
+        6: "2010–2013",
+        5: "2006–2010",
+        4: "2002–2006",
+        3: "1998–2002",
+        2: "1996–1998",
+        1: "1993–1996",
+    }
+)
 
 # Electoral period -> organ ID in psp.cz database
 # (id_obdobi in poslanec table uses organ IDs, not period numbers)
-PERIOD_ORGAN_IDS: dict[int, int] = {
-    10: 174,
-    9: 173,
-    8: 172,
-    7: 171,
-    6: 170,
-    5: 169,
-    4: 168,
-    3: 167,
-    2: 166,
-    1: 165,
-}
+PERIOD_ORGAN_IDS: Mapping[int, int] = MappingProxyType(
+    {
+        10: 174,
+        9: 173,
+        8: 172,
+        7: 171,
+        6: 170,
+        5: 169,
+        4: 168,
+        3: 167,
+        2: 166,
+        1: 165,
+    }
+)
 
 DEFAULT_PERIOD = 10
 
@@ -83,6 +93,7 @@ TISKY_META_DIR = "tisky_meta"
 PSP_TISKT_URL_TEMPLATE = "https://www.psp.cz/sqw/text/tiskt.sqw?o={period}&ct={ct}&ct1=0"
 PSP_HISTORIE_URL_TEMPLATE = "https://www.psp.cz/sqw/historie.sqw?o={period}&t={ct}"
 TISKY_HISTORIE_DIR = "tisky_historie"
+TISKY_HISTORIES_PARQUET = "histories.parquet"  # per-period snapshot of all histories
 
 # Legislative evolution: law changes, related bills, sub-tisk versions
 PSP_LAW_CHANGES_URL_TEMPLATE = "https://www.psp.cz/sqw/historie.sqw?o={period}&t={ct}&snzp=1"
@@ -92,7 +103,9 @@ TISKY_LAW_CHANGES_DIR = "tisky_law_changes"
 TISKY_RELATED_BILLS_DIR = "related_bills"
 TISKY_VERSION_DIFFS_DIR = "tisky_version_diffs"
 PSP_ORIG2_BASE_URL = "https://www.psp.cz/sqw/text/orig2.sqw"
+PSP_HOST = "www.psp.cz"
 PSP_REQUEST_DELAY = 1.0  # seconds between requests to psp.cz
+HTTP_CACHE_DIR = "http_cache"  # conditional-GET page cache for psp.cz scrapers
 
 # LLM provider selection: "ollama" (default) or "openai" (any OpenAI-compatible API)
 LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "ollama")
@@ -110,6 +123,8 @@ TISK_SHORTENER = os.environ.get("TISK_SHORTENER", "0") == "1"
 LLM_TIMEOUT = 300.0  # per-request (generous for CPU inference)
 LLM_HEALTH_TIMEOUT = 5.0  # connectivity check
 LLM_EMPTY_RETRIES = int(os.environ.get("LLM_EMPTY_RETRIES", "2"))
+# Tisky classified concurrently (1 = sequential; raise for hosted/batched backends)
+LLM_CONCURRENCY = max(1, int(os.environ.get("LLM_CONCURRENCY", "1")))
 LLM_MAX_TEXT_CHARS = int(
     os.environ.get("LLM_MAX_TEXT_CHARS", "240000")
 )  # ~80k tokens @ 3 chars/tok (Czech text)
@@ -135,6 +150,12 @@ DAILY_REFRESH_HOUR = int(os.environ.get("DAILY_REFRESH_HOUR", "3"))
 
 # Server port (overridable for Docker and deployment)
 PORT = int(os.environ.get("PORT", "8000"))
+# Threads for request-time Polars analyses (Polars releases the GIL, so use the cores)
+COMPUTE_WORKERS = max(
+    1, int(os.environ.get("PSPCZ_COMPUTE_WORKERS", str(max(2, (os.cpu_count() or 2) - 1))))
+)
+# Processes for chart rendering (matplotlib holds the GIL; each worker costs ~100 MB)
+CHART_WORKERS = max(1, int(os.environ.get("PSPCZ_CHART_WORKERS", str(min(4, os.cpu_count() or 1)))))
 
 # Amendment voting analysis — steno record parsing
 AMENDMENTS_ENABLED = os.environ.get("AMENDMENTS_ENABLED", "1") == "1"
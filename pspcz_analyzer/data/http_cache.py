@@ -0,0 +1,117 @@
+"""On-disk HTTP page cache with conditional-GET revalidation.
+
+Pages are stored under ``{cache_dir}/http_cache/`` keyed by the SHA-1 of the
+URL: the raw body in ``{key}.body`` and its validators (ETag, Last-Modified,
+encoding) in ``{key}.json``. Re-fetches send ``If-None-Match`` /
+``If-Modified-Since``; on ``304 Not Modified`` the stored body is returned
+without downloading it again.
+
+Responses without validators are not stored — they could never be
+revalidated, only blindly trusted.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+from loguru import logger
+
+from pspcz_analyzer.config import HTTP_CACHE_DIR
+
+
+@dataclass
+class CachedPage:
+    """A fetched page body and whether it came from the on-disk cache."""
+
+    content: bytes
+    encoding: str
+    not_modified: bool = False
+    status_code: int = 200
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+def _cache_paths(url: str, cache_dir: Path) -> tuple[Path, Path]:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = cache_dir / HTTP_CACHE_DIR
+    return base / f"{key}.body", base / f"{key}.json"
+
+
+def _load_meta(meta_path: Path) -> dict | None:
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def fetch_page(
+    client: httpx.Client,
+    url: str,
+    cache_dir: Path | None,
+    *,
+    raise_for_status: bool = True,
+) -> CachedPage:
+    """GET a page, revalidating against the on-disk copy when one exists.
+
+    Without ``cache_dir`` this is a plain GET. Raises ``httpx.HTTPError`` on
+    network failures and error statuses, like ``client.get(url).raise_for_status()``
+    would; with ``raise_for_status=False`` error statuses are returned as an
+    uncached page carrying ``status_code`` instead, for callers probing pages
+    that may not exist.
+    """
+    body_path = meta_path = None
+    meta = None
+    if cache_dir is not None:
+        body_path, meta_path = _cache_paths(url, cache_dir)
+        meta = _load_meta(meta_path) if body_path.exists() else None
+
+    headers: dict[str, str] = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = client.get(url, headers=headers)
+    if resp.status_code == 304 and meta and body_path is not None:
+        logger.debug("HTTP cache hit (304): {}", url)
+        try:
+            return CachedPage(body_path.read_bytes(), meta["encoding"], not_modified=True)
+        except OSError:
+            # Cached body vanished — fetch it again unconditionally
+            resp = client.get(url)
+    if raise_for_status:
+        resp.raise_for_status()
+
+    page = CachedPage(resp.content, resp.encoding or "utf-8", status_code=resp.status_code)
+    if body_path is None or meta_path is None or not resp.is_success:
+        return page
+    etag = resp.headers.get("etag")
+    last_modified = resp.headers.get("last-modified")
+    if etag or last_modified:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(page.content)
+        meta_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "encoding": page.encoding,
+                }
+            ),
+            encoding="utf-8",
+        )
+    return page
+
+
+def fetch_text(client: httpx.Client, url: str, cache_dir: Path | None = None) -> str:
+    """GET a page's text, through the on-disk cache when ``cache_dir`` is given.
+
+    Raises ``httpx.HTTPError`` on network failures and error statuses.
+    """
+    return fetch_page(client, url, cache_dir).text
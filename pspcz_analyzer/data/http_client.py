@@ -0,0 +1,108 @@
+"""Shared pooled HTTP client for all psp.cz downloads and scraping.
+
+Every ZIP, PDF, and HTML fetch against psp.cz goes through one keep-alive
+connection pool instead of opening a fresh TCP+TLS connection per URL.
+``httpx.Client`` is thread-safe, so pipeline worker threads share it too.
+Request pacing is shared the same way, through per-host ``RateLimiter``s.
+
+HTTP/2 is negotiated when the optional ``h2`` package is installed
+(``httpx[http2]``); otherwise the pool speaks HTTP/1.1 keep-alive.
+"""
+
+import atexit
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from pspcz_analyzer.config import PSP_REQUEST_DELAY
+
+# Default per-request timeout; callers downloading large files pass their own
+PSP_TIMEOUT = 30.0
+# Download chunk size — large enough that multi-MB files take few Python iterations
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HEADERS = {"User-Agent": "pspcz-analyzer (+https://github.com/tadeasf/pspcz_analyzer)"}
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide psp.cz client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    timeout=PSP_TIMEOUT,
+                    follow_redirects=True,
+                    http2=_HTTP2,
+                    headers=_HEADERS,
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                )
+    return _client
+
+
+def close_clients() -> None:
+    """Close the shared client and drop its pooled connections."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def download_to(url: str, dest: Path, timeout: float = PSP_TIMEOUT) -> None:
+    """Stream a GET response body to ``dest`` in ``DOWNLOAD_CHUNK_SIZE`` chunks.
+
+    Raises ``httpx.HTTPError`` on network failures and error statuses; a
+    partially written ``dest`` is left for the caller to clean up.
+    """
+    with get_client().stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        with open(dest, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+
+class RateLimiter:
+    """Spaces request starts at least ``delay`` seconds apart across threads."""
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_host_limiters: dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_limiter(host: str, delay: float = PSP_REQUEST_DELAY) -> RateLimiter:
+    """Return the process-wide limiter for a host, creating it on first use.
+
+    Every scraper and downloader hitting the same host paces against the same
+    limiter, so concurrently running pipelines share one request budget
+    instead of each sleeping independently. ``delay`` only applies on creation.
+    """
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _host_limiters[host] = RateLimiter(delay)
+        return limiter
+
+
+atexit.register(close_clients)
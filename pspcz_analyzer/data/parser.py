@@ -20,12 +20,16 @@ def parse_unl(
     and a trailing pipe on each line (producing an extra empty column).
     """
     raw_bytes = file_path.read_bytes()
-    if not raw_bytes.strip():
+    # isspace() scans in place; strip() would copy the whole buffer
+    if not raw_bytes or raw_bytes.isspace():
         logger.info("Skipping empty file {}", file_path.name)
         return pl.DataFrame({c: pl.Series([], dtype=pl.Utf8) for c in columns})
 
-    text = raw_bytes.decode(UNL_ENCODING)
-    utf8_bytes = text.encode("utf-8")
+    # ASCII is identical in Windows-1250 and UTF-8, so the big numeric-only
+    # files (e.g. per-MP vote rows) skip the decode/re-encode round trip
+    utf8_bytes = (
+        raw_bytes if raw_bytes.isascii() else raw_bytes.decode(UNL_ENCODING).encode("utf-8")
+    )
 
     # UNL has trailing pipe -> extra column
     all_columns = columns + ["_trailing"]
@@ -43,9 +47,7 @@ def parse_unl(
         quote_char=None,
     )
 
-    df = pl.read_csv(utf8_bytes, **csv_kwargs)
-
-    df = df.drop("_trailing")
+    df = pl.read_csv(utf8_bytes, **csv_kwargs).drop("_trailing")
 
     # Cast typed columns
     if dtypes:
@@ -76,7 +78,9 @@ def parse_unl_multi(
     dfs = [df for df in dfs if df.height > 0]
     if not dfs:
         return pl.DataFrame({c: pl.Series([], dtype=pl.Utf8) for c in columns})
-    result = pl.concat(dfs)
+    # Skip the contiguation copy: the result goes straight to a parquet
+    # cache, which writes chunked frames as-is
+    result = pl.concat(dfs, rechunk=False)
     logger.info(
         "Parsed {} files ({}): {} total rows",
         len(files),
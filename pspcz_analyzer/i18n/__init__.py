@@ -9,19 +9,21 @@ from pspcz_analyzer.i18n.translations import TRANSLATIONS
 SUPPORTED_LANGUAGES: tuple[str, ...] = ("cs", "en")
 DEFAULT_LANGUAGE: str = "cs"
 
-_locale_var: contextvars.ContextVar[str] = contextvars.ContextVar(
-    "locale", default=DEFAULT_LANGUAGE
+# The locale is stored together with its translation table, so gettext —
+# called many times per template render — needs a single dict lookup
+_locale_var: contextvars.ContextVar[tuple[str, dict[str, str]]] = contextvars.ContextVar(
+    "locale", default=(DEFAULT_LANGUAGE, TRANSLATIONS.get(DEFAULT_LANGUAGE, {}))
 )
 
 
 def get_locale() -> str:
     """Return the current request's locale from the ContextVar."""
-    return _locale_var.get()
+    return _locale_var.get()[0]
 
 
 def set_locale(lang: str) -> None:
     """Set the current request's locale in the ContextVar."""
-    _locale_var.set(lang)
+    _locale_var.set((lang, TRANSLATIONS.get(lang, {})))
 
 
 def gettext(key: str) -> str:
@@ -29,8 +31,7 @@ def gettext(key: str) -> str:
 
     Falls back to the key itself if no translation is found.
     """
-    locale = get_locale()
-    return TRANSLATIONS.get(locale, {}).get(key, key)
+    return _locale_var.get()[1].get(key, key)
 
 
 def ngettext(singular: str, plural: str, n: int) -> str:
@@ -4,12 +4,14 @@ Intercepts all standard-library logging (from uvicorn, httpx, etc.)
 and routes it through loguru for consistent colorful output.
 """
 
-import inspect
 import logging
 import sys
 
 from loguru import logger
 
+_LOGGING_FILE = logging.__file__
+_FROZEN_IMPORTLIB = "<frozen importlib._bootstrap"
+
 
 class _InterceptHandler(logging.Handler):
     """Redirect standard logging messages to loguru."""
@@ -20,12 +22,12 @@ class _InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        frame, depth = inspect.currentframe(), 0
+        # Skip logging-module (and import machinery) frames to find the caller.
+        # Starts from emit's caller via sys._getframe, the cheapest frame access.
+        frame, depth = sys._getframe(1), 1
         while frame:
             filename = frame.f_code.co_filename
-            is_logging = filename == logging.__file__
-            is_frozen = "importlib" in filename and "_bootstrap" in filename
-            if depth > 0 and not (is_logging or is_frozen):
+            if filename != _LOGGING_FILE and not filename.startswith(_FROZEN_IMPORTLIB):
                 break
             frame = frame.f_back
             depth += 1
@@ -1,5 +1,6 @@
 """Backend entrypoint — admin dashboard with pipeline management."""
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -23,6 +24,9 @@ from pspcz_analyzer.services.runtime_config import (
 
 setup_logging()
 
+# Upper bound on waiting for background tasks when the server stops
+_SHUTDOWN_TIMEOUT = 10.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -51,12 +55,26 @@ async def lifespan(app: FastAPI):
     refresh_svc.start()
     app.state.refresh = refresh_svc
 
-    yield
-
-    # Graceful shutdown
-    await refresh_svc.stop()
-    await svc.tisk_pipeline.cancel_all()
-    log_broadcaster.stop()
+    try:
+        yield
+    finally:
+        # Graceful shutdown — stop both concurrently, and don't let a
+        # straggler (e.g. a mid-download refresh) hold up exit or reload
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    refresh_svc.stop(),
+                    svc.tisk_pipeline.cancel_all(),
+                    return_exceptions=True,
+                ),
+                timeout=_SHUTDOWN_TIMEOUT,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.opt(exception=result).warning("Error during shutdown")
+        except TimeoutError:
+            logger.warning("Shutdown tasks still running after {}s, exiting", _SHUTDOWN_TIMEOUT)
+        log_broadcaster.stop()
 
 
 app = FastAPI(
@@ -1,40 +1,109 @@
-"""Security headers middleware and computation timeout helper."""
+"""Security headers middleware, static file serving, and computation timeout helper."""
 
 import asyncio
 import contextvars
+import multiprocessing
+import os
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
 from typing import Any
 
 from fastapi import HTTPException
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
+from starlette.staticfiles import PathLike, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-_compute_pool = ThreadPoolExecutor(max_workers=2)
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' https://unpkg.com 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'"
-        )
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), payment=()"
-        )
+from pspcz_analyzer.config import CHART_WORKERS, COMPUTE_WORKERS
+
+# CPU-bound analyses and blocking scrapes get separate pools, so a slow
+# upstream site can never occupy the slots that Polars work needs
+_compute_pool = ThreadPoolExecutor(max_workers=COMPUTE_WORKERS, thread_name_prefix="pspcz-compute")
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pspcz-io")
+# GIL-bound pure-Python work (chart rendering) gets real parallelism in
+# worker processes. Spawned rather than forked: forking a process that
+# already runs Polars and pool threads can deadlock the child.
+_process_pool = ProcessPoolExecutor(
+    max_workers=CHART_WORKERS, mp_context=multiprocessing.get_context("spawn")
+)
+
+
+# Applied to every response, pre-encoded as raw ASGI header pairs
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (
+        b"content-security-policy",
+        b"default-src 'self'; "
+        b"script-src 'self' https://unpkg.com 'unsafe-inline'; "
+        b"style-src 'self' 'unsafe-inline'; "
+        b"img-src 'self' data:; "
+        b"font-src 'self'; "
+        b"connect-src 'self'; "
+        b"frame-ancestors 'none'",
+    ),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"permissions-policy", b"camera=(), microphone=(), geolocation=(), payment=()"),
+)
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS)
+
+
+class SecurityHeadersMiddleware:
+    """Add security headers to every HTTP response.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``: pre-encoded headers are
+    injected into the ``http.response.start`` message, without the extra task
+    and body stream that ``BaseHTTPMiddleware`` adds to every request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Static assets are only ever loaded as subresources of an HTML page,
+        # whose CSP already governs them; ``VersionedStaticFiles`` sets nosniff
+        if scope["type"] != "http" or scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Replace (not duplicate) any of these a route set itself
+                message["headers"] = [
+                    *(
+                        h
+                        for h in message.get("headers", ())
+                        if h[0].lower() not in _SECURITY_HEADER_NAMES
+                    ),
+                    *_SECURITY_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class VersionedStaticFiles(StaticFiles):
+    """``StaticFiles`` that lets browsers cache version-stamped assets forever.
+
+    Templates link assets through the ``static_url`` global, which appends a
+    content hash as ``?v=``; such URLs change whenever the file does, so they
+    are served ``immutable``. Unversioned requests keep the default
+    ETag/Last-Modified revalidation.
+    """
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["x-content-type-options"] = "nosniff"
+        if scope.get("query_string", b"").startswith(b"v="):
+            response.headers["cache-control"] = "public, max-age=31536000, immutable"
         return response
 
 
@@ -43,19 +112,46 @@ async def run_with_timeout(
     *args: Any,
     timeout: float = 15.0,
     label: str = "computation",
+    io_bound: bool = False,
 ) -> Any:
     """Run a sync function in a bounded thread pool with timeout.
 
-    Propagates ContextVars (incl. locale) into the worker thread.
+    Propagates ContextVars (incl. locale) into the worker thread. Pass
+    ``io_bound=True`` for blocking network work (scrapes) so it runs on the
+    I/O pool instead of the compute pool.
     Returns the result or raises HTTP 503 on timeout.
     """
     loop = asyncio.get_running_loop()
     ctx = contextvars.copy_context()
     try:
         return await asyncio.wait_for(
-            loop.run_in_executor(_compute_pool, partial(ctx.run, fn, *args)),
+            loop.run_in_executor(
+                _io_pool if io_bound else _compute_pool, partial(ctx.run, fn, *args)
+            ),
             timeout=timeout,
         )
     except TimeoutError as err:
         logger.warning("Timeout after {}s for {}", timeout, label)
         raise HTTPException(503, detail=f"{label} timed out after {timeout}s") from err
+
+
+async def run_in_process(
+    fn: Callable[..., Any],
+    *args: Any,
+    timeout: float = 15.0,
+    label: str = "computation",
+) -> Any:
+    """Run a picklable module-level function in the worker process pool with timeout.
+
+    ContextVars (incl. locale) do not cross the process boundary, so resolve
+    translated strings first and pass them in ``args``.
+    Returns the result or raises HTTP 503 on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(
+            loop.run_in_executor(_process_pool, fn, *args), timeout=timeout
+        )
+    except TimeoutError as err:
+        logger.warning("Timeout after {}s for {}", timeout, label)
+        raise HTTPException(503, detail=f"{label} timed out after {timeout}s") from err
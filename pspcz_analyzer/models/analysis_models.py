@@ -0,0 +1,63 @@
+"""Row types returned by the per-MP voting analyses.
+
+Slotted dataclasses rather than dicts: templates read them as ``row.field``,
+which Jinja2 resolves with a plain ``getattr`` instead of a failed attribute
+lookup followed by a ``__getitem__`` fallback.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class AttendanceRow:
+    """Vote participation counts for one MP (see ``compute_attendance``)."""
+
+    jmeno: str | None
+    prijmeni: str | None
+    party: str | None
+    active: int
+    yes_votes: int
+    no_votes: int
+    abstained: int
+    passive: int
+    absent: int
+    excused: int
+    attendance_pct: float
+
+
+@dataclass(slots=True)
+class RebellionVote:
+    """A single vote in which an MP went against their party's majority."""
+
+    id_hlasovani: int
+    datum: str
+    nazev_dlouhy: str
+    mp_vote: str
+    party_direction: str
+    schuze: int | None
+    bod: int | None
+    tisk_url: str | None
+
+
+@dataclass(slots=True)
+class LoyaltyRow:
+    """Rebellion rate for one MP, with the rebellions themselves newest first."""
+
+    jmeno: str | None
+    prijmeni: str | None
+    party: str | None
+    active_votes: int
+    rebellions: int
+    rebellion_pct: float
+    rebellion_votes: list[RebellionVote]
+
+
+@dataclass(slots=True)
+class SimilarPair:
+    """Two MPs from different parties and the cosine similarity of their votes."""
+
+    mp1_name: str
+    mp1_party: str
+    mp2_name: str
+    mp2_party: str
+    similarity: float
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import polars as pl
 
 from pspcz_analyzer.config import PERIOD_LABELS, PERIOD_YEARS
+from pspcz_analyzer.utils.text import normalize_czech
 
 if TYPE_CHECKING:
     from pspcz_analyzer.models.amendment_models import BillAmendmentData
     from pspcz_analyzer.services.tisk.io.history_scraper import TiskHistory
+    from pspcz_analyzer.services.tisk.io.law_changes_scraper import ProposedLawChange
 
 
 @dataclass
@@ -43,7 +46,7 @@ class TiskInfo:
     summary: str = ""
     summary_en: str = ""
     history: TiskHistory | None = None
-    law_changes: list[dict] = field(default_factory=list)
+    law_changes: list[ProposedLawChange] = field(default_factory=list)
     sub_versions: list[dict] = field(default_factory=list)
 
     @property
@@ -77,6 +80,17 @@ class PeriodData:
     _amendment_vote_index: dict[int, tuple[int, int, str, bool]] = field(
         default_factory=dict, repr=False
     )
+    # Reverse index: ct -> TiskInfo (first tisk_lookup entry per ct)
+    _tisk_ct_index: dict[int, TiskInfo] = field(default_factory=dict, repr=False)
+    # Reverse index: ct -> every (schuze, bod) key it is listed under
+    _tisk_ct_keys: dict[int, list[tuple[int, int]]] = field(default_factory=dict, repr=False)
+    # Sorted topic labels per language, built on first use
+    _topic_labels_cache: dict[str, list[str]] = field(default_factory=dict, repr=False)
+    # (schuze, bod) keys of tisky per Czech topic label, built on first use
+    _topic_keys_cache: dict[str, pl.DataFrame] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        self.build_tisk_ct_index()
 
     def get_amendments(self, schuze: int, bod: int) -> BillAmendmentData | None:
         """Get amendment data for a vote given its session and agenda item."""
@@ -116,8 +130,34 @@ class PeriodData:
         """
         return self._amendment_vote_index.get(vote_id)
 
-    @property
+    @cached_property
+    def browsable_votes(self) -> pl.DataFrame:
+        """Non-void votes, newest first, as listed by the votes browser.
+
+        Null titles are filled with "" and ``search_text`` holds both titles
+        lowercased without diacritics, so a page request only filters and
+        slices this frame. Frames are never replaced, so computed once.
+        """
+        void_ids = self.void_votes.get_column("id_hlasovani")
+        votes = (
+            self.votes.filter(~pl.col("id_hlasovani").is_in(void_ids))
+            .with_columns(
+                pl.col("nazev_dlouhy").fill_null(""),
+                pl.col("nazev_kratky").fill_null(""),
+            )
+            .sort("id_hlasovani", descending=True)
+        )
+        search_text = [
+            f"{normalize_czech(dlouhy)}\x00{normalize_czech(kratky)}"
+            for dlouhy, kratky in zip(
+                votes.get_column("nazev_dlouhy"), votes.get_column("nazev_kratky"), strict=True
+            )
+        ]
+        return votes.with_columns(pl.Series("search_text", search_text, dtype=pl.Utf8))
+
+    @cached_property
     def stats(self) -> dict:
+        """Period summary for the index page; frames are never replaced, so computed once."""
         date_col = self.votes.get_column("datum")
         dates = date_col.drop_nulls().str.strip_chars()
         parsed = dates.str.to_date("%d.%m.%Y", strict=False).drop_nulls()
@@ -144,17 +184,63 @@ class PeriodData:
         """Get tisk info for a vote given its session and agenda item numbers."""
         return self.tisk_lookup.get((schuze, bod))
 
+    def build_tisk_ct_index(self) -> None:
+        """Build reverse indexes mapping ct to its TiskInfo and its lookup keys.
+
+        Should be called whenever tisk_lookup entries are added or replaced.
+        """
+        self._tisk_ct_index.clear()
+        self._tisk_ct_keys.clear()
+        for key, tisk in self.tisk_lookup.items():
+            self._tisk_ct_index.setdefault(tisk.ct, tisk)
+            self._tisk_ct_keys.setdefault(tisk.ct, []).append(key)
+
+    def get_tisk_by_ct(self, ct: int) -> TiskInfo | None:
+        """Get tisk info by print number (ct)."""
+        return self._tisk_ct_index.get(ct)
+
+    def get_tisk_keys_by_ct(self, ct: int) -> list[tuple[int, int]]:
+        """Get every (schuze, bod) agenda item a print number (ct) was debated under."""
+        return self._tisk_ct_keys.get(ct, [])
+
     def get_all_topic_labels(self, lang: str = "cs") -> list[str]:
         """Collect all unique topic labels across all tisky, sorted.
 
+        Cached per language until ``invalidate_topic_labels`` is called.
+
         Args:
             lang: Language code ('cs' or 'en'). Uses English labels when
                   available and lang == 'en', otherwise Czech.
         """
+        cached = self._topic_labels_cache.get(lang)
+        if cached is not None:
+            return cached
         labels: set[str] = set()
         for tisk in self.tisk_lookup.values():
             if lang == "en" and tisk.topics_en:
                 labels.update(tisk.topics_en)
             else:
                 labels.update(tisk.topics)
-        return sorted(labels)
+        result = self._topic_labels_cache[lang] = sorted(labels)
+        return result
+
+    def get_topic_keys(self, topic: str) -> pl.DataFrame:
+        """Return the (schuze, bod) keys of tisky tagged with a Czech topic label.
+
+        Cached per topic until ``invalidate_topic_labels`` is called, so the
+        votes browser joins against a ready frame instead of scanning
+        ``tisk_lookup`` on every filtered request.
+        """
+        cached = self._topic_keys_cache.get(topic)
+        if cached is not None:
+            return cached
+        keys = [key for key, tisk in self.tisk_lookup.items() if topic in tisk.topics]
+        result = self._topic_keys_cache[topic] = pl.DataFrame(
+            keys, schema={"schuze": pl.Int64, "bod": pl.Int64}, orient="row"
+        )
+        return result
+
+    def invalidate_topic_labels(self) -> None:
+        """Drop cached topic labels and keys; call after any TiskInfo topics change."""
+        self._topic_labels_cache.clear()
+        self._topic_keys_cache.clear()
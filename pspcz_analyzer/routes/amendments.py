@@ -1,20 +1,17 @@
 """HTMX partial endpoints — amendments and amendment coalitions."""
 
-from pathlib import Path
-
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from pspcz_analyzer.config import DEFAULT_PERIOD
 from pspcz_analyzer.rate_limit import limiter
 from pspcz_analyzer.routes.utils import validate_period
 from pspcz_analyzer.services.amendment_service import list_amendment_bills
 from pspcz_analyzer.services.amendments.coalition_service import compute_amendment_coalitions
-from pspcz_analyzer.services.analysis_cache import analysis_cache
+from pspcz_analyzer.services.analysis_cache import analysis_cache, cache_key
+from pspcz_analyzer.templating import templates
 
 router = APIRouter(tags=["Amendments"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
 
 @router.get("/amendments", response_class=HTMLResponse)
@@ -29,7 +26,7 @@ async def amendments_api(
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
     lang = getattr(request.state, "lang", "cs")
-    key = f"amendments:{period}:{search}:{page}:{lang}"
+    key = cache_key("amendments", period, search, page, lang)
     result = analysis_cache.get_or_compute(
         key,
         lambda: list_amendment_bills(pd, search=search, page=page),
@@ -56,7 +53,7 @@ async def amendment_coalitions_api(
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
     lang = getattr(request.state, "lang", "cs")
-    key = f"amendment-coalitions:{period}:{lang}"
+    key = cache_key("amendment-coalitions", period, lang)
     result = analysis_cache.get_or_compute(
         key,
         lambda: compute_amendment_coalitions(pd),
@@ -1,39 +1,74 @@
-"""Chart image endpoints — seaborn renders to PNG, served as StreamingResponse."""
+"""Chart image endpoints — seaborn renders to PNG in worker processes."""
 
-import io
+from collections.abc import Awaitable, Callable
+from typing import Any
 
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import StreamingResponse
-from matplotlib.figure import Figure
+from fastapi.responses import Response
 
 from pspcz_analyzer.config import DEFAULT_PERIOD
 from pspcz_analyzer.i18n import gettext as _
-from pspcz_analyzer.middleware import run_with_timeout
+from pspcz_analyzer.middleware import run_in_process
 from pspcz_analyzer.rate_limit import limiter
-from pspcz_analyzer.routes.utils import validate_period
-from pspcz_analyzer.services.analysis_cache import analysis_cache
+from pspcz_analyzer.routes.utils import (
+    cached_analysis,
+    cached_loyalty,
+    single_flight,
+    validate_period,
+)
+from pspcz_analyzer.services.analysis_cache import analysis_cache, cache_key
 from pspcz_analyzer.services.attendance_service import compute_attendance
-from pspcz_analyzer.services.loyalty_service import compute_loyalty
+from pspcz_analyzer.services.chart_service import render_barh_png, render_pca_png
 from pspcz_analyzer.services.similarity_service import compute_pca_coords
 
-matplotlib.use("Agg")  # Non-interactive backend
-
 router = APIRouter(tags=["Charts"])
 
-# Light institutional style
-sns.set_theme(style="whitegrid", palette="deep")
-
 
-def _fig_to_png(fig: Figure) -> io.BytesIO:
-    """Render a matplotlib figure to a PNG BytesIO buffer."""
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="#FFFFFF")
-    buf.seek(0)
-    plt.close(fig)
-    return buf
+async def _cached_png(
+    request: Request,
+    key: str,
+    render_fn: Callable[..., bytes],
+    build_args: Callable[[], Awaitable[tuple[Any, ...]]],
+    *,
+    timeout: float,
+    label: str,
+) -> Response:
+    """Serve a chart PNG, rendering it in the process pool only on a cache miss.
+
+    Labels are localized, so the PNG lives in ``analysis_cache`` under
+    ``png:{lang}:{key}`` (a namespace no ``cache_key`` analysis key can
+    produce) and is dropped together with the analysis results on data
+    reload. ``build_args`` (rows plus translated labels) is only
+    awaited on a miss.
+    """
+    png_key = f"png:{getattr(request.state, 'lang', 'cs')}:{key}"
+    png = analysis_cache.get(png_key)
+    if not isinstance(png, bytes):
+
+        async def render() -> bytes:
+            args = await build_args()
+            return await run_in_process(render_fn, *args, timeout=timeout, label=label)
+
+        png = await single_flight(png_key, render)
+        analysis_cache.set(png_key, png)
+    # PNGs are already deflated; the explicit encoding keeps GZipMiddleware
+    # from recompressing the cached bytes on every request
+    return Response(png, media_type="image/png", headers={"Content-Encoding": "identity"})
+
+
+_ATTENDANCE_CHARTS: dict[str, tuple[str, str, str]] = {
+    # sort_key: (data_field, chart_key_prefix, palette)
+    "worst": ("attendance_pct", "chart.attendance.worst", "RdYlGn"),
+    "best": ("attendance_pct", "chart.attendance.best", "RdYlGn"),
+    "most_active": ("active", "chart.attendance.most_active", "viridis"),
+    "least_active": ("active", "chart.attendance.least_active", "viridis"),
+    "most_abstained": ("abstained", "chart.attendance.most_abstained", "YlOrRd"),
+    "most_excused": ("excused", "chart.attendance.most_excused", "PuBuGn"),
+    "most_passive": ("passive", "chart.attendance.most_passive", "OrRd"),
+    "most_absent": ("absent", "chart.attendance.most_absent", "Reds"),
+    "most_yes": ("yes_votes", "chart.attendance.most_yes", "Greens"),
+    "most_no": ("no_votes", "chart.attendance.most_no", "Blues"),
+}
 
 
 @router.get("/loyalty.png")
@@ -46,33 +81,28 @@ async def loyalty_chart(
     validate_period(period)
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
-    key = f"loyalty:{period}:{top}"
-    rows = await run_with_timeout(
-        lambda: analysis_cache.get_or_compute(key, lambda: compute_loyalty(pd, top=top)),
-        timeout=20.0,
-        label="loyalty chart",
-    )
-
-    # Resolve labels in request context (ContextVar propagated by run_with_timeout)
-    xlabel = _("chart.loyalty.xlabel")
-    title = _("chart.loyalty.title")
-
-    fig, ax = plt.subplots(figsize=(12, max(6, len(rows) * 0.35)))
-    fig.patch.set_facecolor("#FFFFFF")
-    ax.set_facecolor("#F7F7F7")
+    key = cache_key("loyalty", period, top)
 
-    names = [f"{r['jmeno']} {r['prijmeni']} ({r['party'] or '?'})" for r in rows]
-    values = [r["rebellion_pct"] for r in rows]
-
-    colors = sns.color_palette("coolwarm", len(rows))
-    ax.barh(names[::-1], values[::-1], color=colors)
-    ax.set_xlabel(xlabel, color="#333333")
-    ax.set_title(title, color="#333333", fontsize=14)
-    ax.tick_params(colors="#333333")
-    for spine in ax.spines.values():
-        spine.set_color("#D9D9D9")
+    async def build_args() -> tuple[Any, ...]:
+        rows = await cached_analysis(
+            key,
+            lambda: cached_loyalty(pd, top),
+            timeout=20.0,
+            label="loyalty chart",
+        )
+        names = [f"{r.jmeno} {r.prijmeni} ({r.party or '?'})" for r in rows]
+        values = [r.rebellion_pct for r in rows]
+        return (
+            names,
+            values,
+            "coolwarm",
+            _("chart.loyalty.xlabel"),
+            _("chart.loyalty.title"),
+        )
 
-    return StreamingResponse(_fig_to_png(fig), media_type="image/png")
+    return await _cached_png(
+        request, key, render_barh_png, build_args, timeout=20.0, label="loyalty chart render"
+    )
 
 
 @router.get("/attendance.png")
@@ -87,52 +117,25 @@ async def attendance_chart(
     validate_period(period)
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
-    key = f"attendance:{period}:{top}:{sort}:{party}"
-    rows = await run_with_timeout(
-        lambda: analysis_cache.get_or_compute(
+    key = cache_key("attendance", period, top, sort, party)
+
+    async def build_args() -> tuple[Any, ...]:
+        rows = await cached_analysis(
             key,
             lambda: compute_attendance(pd, top=top, sort=sort, party_filter=party or None),
-        ),
-        timeout=20.0,
-        label="attendance chart",
-    )
+            timeout=20.0,
+            label="attendance chart",
+        )
+        names = [f"{r.jmeno} {r.prijmeni} ({r.party or '?'})" for r in rows]
+        field, chart_key, palette = _ATTENDANCE_CHARTS.get(
+            sort, ("attendance_pct", "chart.attendance.worst", "RdYlGn")
+        )
+        values = [getattr(r, field) for r in rows]
+        return (names, values, palette, _(f"{chart_key}.xlabel"), _(f"{chart_key}.title"))
 
-    fig, ax = plt.subplots(figsize=(12, max(6, len(rows) * 0.35)))
-    fig.patch.set_facecolor("#FFFFFF")
-    ax.set_facecolor("#F7F7F7")
-
-    names = [f"{r['jmeno']} {r['prijmeni']} ({r['party'] or '?'})" for r in rows]
-
-    chart_meta: dict[str, tuple[str, str, str]] = {
-        # sort_key: (data_field, chart_key_prefix, palette)
-        "worst": ("attendance_pct", "chart.attendance.worst", "RdYlGn"),
-        "best": ("attendance_pct", "chart.attendance.best", "RdYlGn"),
-        "most_active": ("active", "chart.attendance.most_active", "viridis"),
-        "least_active": ("active", "chart.attendance.least_active", "viridis"),
-        "most_abstained": ("abstained", "chart.attendance.most_abstained", "YlOrRd"),
-        "most_excused": ("excused", "chart.attendance.most_excused", "PuBuGn"),
-        "most_passive": ("passive", "chart.attendance.most_passive", "OrRd"),
-        "most_absent": ("absent", "chart.attendance.most_absent", "Reds"),
-        "most_yes": ("yes_votes", "chart.attendance.most_yes", "Greens"),
-        "most_no": ("no_votes", "chart.attendance.most_no", "Blues"),
-    }
-    field, chart_key, palette = chart_meta.get(
-        sort, ("attendance_pct", "chart.attendance.worst", "RdYlGn")
+    return await _cached_png(
+        request, key, render_barh_png, build_args, timeout=20.0, label="attendance chart render"
     )
-    xlabel = _(f"{chart_key}.xlabel")
-    title = _(f"{chart_key}.title")
-
-    values = [r[field] for r in rows]
-    colors = sns.color_palette(palette, len(rows))
-    ax.barh(names[::-1], values[::-1], color=colors)
-    ax.set_xlabel(xlabel, color="#333333")
-    ax.set_title(title, color="#333333", fontsize=14)
-
-    ax.tick_params(colors="#333333")
-    for spine in ax.spines.values():
-        spine.set_color("#D9D9D9")
-
-    return StreamingResponse(_fig_to_png(fig), media_type="image/png")
 
 
 @router.get("/similarity.png")
@@ -141,53 +144,22 @@ async def similarity_chart(request: Request, period: int = DEFAULT_PERIOD):
     validate_period(period)
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
-    key = f"similarity_pca:{period}"
-    coords = await run_with_timeout(
-        lambda: analysis_cache.get_or_compute(key, lambda: compute_pca_coords(pd)),
-        timeout=30.0,
-        label="similarity chart",
-    )
+    key = cache_key("similarity_pca", period)
 
-    # Assign colors per party
-    parties = sorted({c["party"] for c in coords})
-    palette = dict(zip(parties, sns.color_palette("husl", len(parties)), strict=False))
-
-    fig, ax = plt.subplots(figsize=(14, 10))
-    fig.patch.set_facecolor("#FFFFFF")
-    ax.set_facecolor("#F7F7F7")
-
-    for party in parties:
-        pts = [c for c in coords if c["party"] == party]
-        ax.scatter(
-            [p["x"] for p in pts],
-            [p["y"] for p in pts],
-            label=party,
-            color=palette[party],
-            s=60,
-            alpha=0.8,
-            edgecolors="#333333",
-            linewidths=0.5,
+    async def build_args() -> tuple[Any, ...]:
+        coords = await cached_analysis(
+            key,
+            lambda: compute_pca_coords(pd),
+            timeout=30.0,
+            label="similarity chart",
+        )
+        return (
+            coords,
+            _("chart.similarity.xlabel"),
+            _("chart.similarity.ylabel"),
+            _("chart.similarity.title"),
         )
 
-    ax.set_xlabel(_("chart.similarity.xlabel"), color="#333333")
-    ax.set_ylabel(_("chart.similarity.ylabel"), color="#333333")
-    ax.set_title(
-        _("chart.similarity.title"),
-        color="#333333",
-        fontsize=14,
+    return await _cached_png(
+        request, key, render_pca_png, build_args, timeout=30.0, label="similarity chart render"
     )
-    ax.tick_params(colors="#333333")
-    for spine in ax.spines.values():
-        spine.set_color("#D9D9D9")
-
-    legend = ax.legend(
-        loc="upper right",
-        fontsize=9,
-        framealpha=0.9,
-        facecolor="#FFFFFF",
-        edgecolor="#D9D9D9",
-    )
-    for text in legend.get_texts():
-        text.set_color("#333333")
-
-    return StreamingResponse(_fig_to_png(fig), media_type="image/png")
@@ -1,20 +1,18 @@
 """HTMX partial endpoints — user feedback submission."""
 
 import asyncio
-from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from pspcz_analyzer.config import GITHUB_FEEDBACK_ENABLED
 from pspcz_analyzer.i18n import gettext as _t
 from pspcz_analyzer.rate_limit import limiter
 from pspcz_analyzer.services.feedback_service import GitHubFeedbackClient
+from pspcz_analyzer.templating import templates
 
 router = APIRouter(tags=["Feedback"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
 
 def _validate_origin(request: Request) -> bool:
@@ -4,7 +4,7 @@ import asyncio
 import time
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from pspcz_analyzer.config import LLM_PROVIDER
 from pspcz_analyzer.rate_limit import limiter
@@ -13,12 +13,22 @@ from pspcz_analyzer.services.llm import create_llm_client
 router = APIRouter(tags=["Health"])
 
 
+# Serialized health body, reused until the set of loaded periods changes
+_health_body: tuple[tuple[int, ...], bytes] | None = None
+
+
 @router.get("/health", response_class=JSONResponse)
 @limiter.limit("120/minute")
-async def health(request: Request):
+async def health(request: Request) -> Response:
     """Health check endpoint."""
-    data_svc = request.app.state.data
-    return {"status": "ok", "periods_loaded": list(data_svc.loaded_periods)}
+    global _health_body
+    periods = tuple(request.app.state.data.loaded_periods)
+    cached = _health_body
+    if cached is None or cached[0] != periods:
+        body = JSONResponse({"status": "ok", "periods_loaded": list(periods)}).body
+        cached = _health_body = (periods, bytes(body))
+    # Returning a Response skips FastAPI's jsonable_encoder pass on every probe
+    return Response(cached[1], media_type="application/json")
 
 
 # ── LLM diagnostic constants ─────────────────────────────────────────────
@@ -1,19 +1,16 @@
 """HTMX partial endpoints — laws/bills listing."""
 
-from pathlib import Path
-
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from pspcz_analyzer.config import DEFAULT_PERIOD
 from pspcz_analyzer.rate_limit import limiter
 from pspcz_analyzer.routes.utils import validate_period
-from pspcz_analyzer.services.analysis_cache import analysis_cache
+from pspcz_analyzer.services.analysis_cache import analysis_cache, cache_key
 from pspcz_analyzer.services.law_service import list_laws
+from pspcz_analyzer.templating import templates
 
 router = APIRouter(tags=["Laws"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
 
 @router.get("/laws", response_class=HTMLResponse)
@@ -31,7 +28,7 @@ async def laws_api(
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
     lang = getattr(request.state, "lang", "cs")
-    key = f"laws:{period}:{search}:{status_filter}:{topic}:{page}:{lang}"
+    key = cache_key("laws", period, search, status_filter, topic, page, lang)
     result = analysis_cache.get_or_compute(
         key,
         lambda: list_laws(
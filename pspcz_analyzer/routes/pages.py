@@ -1,11 +1,9 @@
 """HTML page routes (full-page renders)."""
 
-from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
 from pspcz_analyzer.config import DEFAULT_PERIOD, GITHUB_FEEDBACK_ENABLED
@@ -17,9 +15,9 @@ from pspcz_analyzer.services.amendment_service import amendment_detail
 from pspcz_analyzer.services.law_service import get_all_status_labels
 from pspcz_analyzer.services.law_service import law_detail as get_law_detail
 from pspcz_analyzer.services.votes_service import vote_detail
+from pspcz_analyzer.templating import templates
 
 router = APIRouter(tags=["Pages"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
 
 def _ctx(request: Request, period: int, **kwargs) -> dict:
@@ -1,31 +1,36 @@
 """HTMX partial endpoints — tisk text, evolution, and related bills."""
 
 import html as html_mod
-from dataclasses import asdict
-from pathlib import Path
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TextIO
 
+import markupsafe
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, StreamingResponse
 
 from pspcz_analyzer.config import (
     DEFAULT_CACHE_DIR,
     DEFAULT_PERIOD,
     GITHUB_FEEDBACK_ENABLED,
-    TISKY_TEXT_DIR,
 )
 from pspcz_analyzer.i18n import gettext as _t
 from pspcz_analyzer.middleware import run_with_timeout
 from pspcz_analyzer.rate_limit import limiter
-from pspcz_analyzer.routes.utils import _safe_url, validate_period
+from pspcz_analyzer.routes.utils import single_flight, validate_period
 from pspcz_analyzer.services.tisk.io import (
+    RelatedBill,
     load_related_bills_json,
     save_related_bills_json,
     scrape_related_bills,
 )
+from pspcz_analyzer.templating import templates
 
 router = APIRouter(tags=["Tisk"])
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
+
+_TEXT_CHUNK_CHARS = 64 * 1024
+# Placeholder rendered in place of the text to split the partial around it
+_TEXT_MARKER = "\x00text\x00"
 
 
 @router.get("/tisk-text", response_class=HTMLResponse)
@@ -41,27 +46,53 @@ async def tisk_text_api(
     When ct1 >= 0, loads sub-tisk text ({ct}_{ct1}.txt) instead of main text.
     """
     validate_period(period)
-    data_svc = request.app.state.data
-    if ct1 >= 0:
-        text_path = data_svc.cache_dir / TISKY_TEXT_DIR / str(period) / f"{ct}_{ct1}.txt"
-        text = text_path.read_text(encoding="utf-8") if text_path.exists() else None
-    else:
-        text = data_svc.tisk_text.get_text(period, ct)
-    if text is None:
-        return HTMLResponse(
-            '<article style="background: #fff3cd; padding: 1rem;">'
-            f"<p>{html_mod.escape(_t('tisk.no_text'))}</p>"
-            "</article>"
+    text_svc = request.app.state.data.tisk_text
+    text_file = await run_with_timeout(
+        text_svc.open_text,
+        period,
+        ct,
+        ct1 if ct1 >= 0 else None,
+        timeout=5.0,
+        label="tisk text open",
+        io_bound=True,
+    )
+    if text_file is None:
+        return templates.TemplateResponse(
+            "partials/tisk_text.html", {"request": request, "text": None}
         )
-    escaped = html_mod.escape(text)
-    return HTMLResponse(
-        '<article style="max-height: 60vh; overflow-y: auto; background: #f8f9fa; '
-        'padding: 1rem; border: 1px solid #dee2e6; border-radius: 0.5rem;">'
-        f'<pre style="white-space: pre-wrap; word-wrap: break-word; font-size: 0.85rem;">{escaped}</pre>'
-        "</article>"
+    # Texts can be several MB — escape and send them chunk by chunk rather
+    # than holding the raw and escaped copies in memory at once. The explicit
+    # encoding keeps GZipMiddleware from compressing and re-buffering chunks.
+    head, tail = _tisk_text_frame()
+    return StreamingResponse(
+        _stream_escaped(text_file, head, tail),
+        media_type="text/html",
+        headers={"Content-Encoding": "identity"},
     )
 
 
+def _tisk_text_frame() -> tuple[str, str]:
+    """Markup the tisk-text partial puts before and after the text itself."""
+    html = templates.get_template("partials/tisk_text.html").render(text=_TEXT_MARKER)
+    head, _, tail = html.partition(_TEXT_MARKER)
+    return head, tail
+
+
+def _stream_escaped(text_file: TextIO, head: str, tail: str) -> Iterator[str]:
+    """Yield ``head``, the file's text HTML-escaped in chunks, then ``tail``.
+
+    A plain generator, so Starlette runs the blocking reads in a worker thread.
+    """
+    try:
+        yield head
+        while chunk := text_file.read(_TEXT_CHUNK_CHARS):
+            # markupsafe's C escape is ~2x faster than html.escape on large chunks
+            yield str(markupsafe.escape(chunk))
+        yield tail
+    finally:
+        text_file.close()
+
+
 @router.get("/tisk-evolution", response_class=HTMLResponse)
 @limiter.limit("120/minute")
 async def tisk_evolution_api(
@@ -73,12 +104,7 @@ async def tisk_evolution_api(
     validate_period(period)
     data_svc = request.app.state.data
     pd = data_svc.get_period(period)
-    tisk = None
-    if pd:
-        for t in pd.tisk_lookup.values():
-            if t.ct == ct:
-                tisk = t
-                break
+    tisk = pd.get_tisk_by_ct(ct) if pd else None
 
     law_changes = tisk.law_changes if tisk else []
     sub_versions = tisk.sub_versions if tisk else []
@@ -97,6 +123,20 @@ async def tisk_evolution_api(
     )
 
 
+@lru_cache(maxsize=1024)
+def _load_or_scrape_related_bills(idsb: int) -> list[RelatedBill]:
+    """Cached related bills for a law, scraping and caching them on a miss.
+
+    Memoized in-process on top of the JSON cache, which never expires either.
+    Blocking (file reads and psp.cz requests) — run via ``run_with_timeout``.
+    """
+    bills = load_related_bills_json(idsb, DEFAULT_CACHE_DIR)
+    if bills is None:
+        bills = scrape_related_bills(idsb)
+        save_related_bills_json(bills, idsb, DEFAULT_CACHE_DIR)
+    return bills
+
+
 @router.get("/related-bills", response_class=HTMLResponse)
 @limiter.limit("30/minute")
 async def related_bills_api(
@@ -107,48 +147,18 @@ async def related_bills_api(
     if idsb <= 0:
         return HTMLResponse(f"<p>{html_mod.escape(_t('related.invalid'))}</p>")
 
-    cache_dir = DEFAULT_CACHE_DIR
-    cached = load_related_bills_json(idsb, cache_dir)
-    if cached is not None:
-        bills = [asdict(b) for b in cached]
-    else:
-        raw_bills = await run_with_timeout(
-            scrape_related_bills,
+    # Simultaneous first views of one law share a single scrape
+    bills = await single_flight(
+        f"related-bills:{idsb}",
+        lambda: run_with_timeout(
+            _load_or_scrape_related_bills,
             idsb,
             timeout=15.0,
             label="related bills scrape",
-        )
-        save_related_bills_json(raw_bills, idsb, cache_dir)
-        bills = [asdict(b) for b in raw_bills]
-
-    if not bills:
-        return HTMLResponse(
-            '<p style="color: #6c757d; font-size: 0.85rem;">'
-            f"{html_mod.escape(_t('related.no_bills'))}</p>"
-        )
+            io_bound=True,
+        ),
+    )
 
-    rows_html = ""
-    for b in bills:
-        raw_url = _safe_url(b.get("url", ""))
-        cislo = html_mod.escape(str(b.get("cislo", "?")))
-        if raw_url:
-            safe_href = html_mod.escape(raw_url)
-            link = f'<a href="{safe_href}" target="_blank" rel="noopener">{cislo}</a>'
-        else:
-            link = cislo
-        nazev = html_mod.escape(str(b.get("kratky_nazev", "")))
-        typ = html_mod.escape(str(b.get("typ_tisku", "")))
-        stav = html_mod.escape(str(b.get("stav", "")))
-        rows_html += f"<tr><td>{link}</td><td>{nazev}</td><td>{typ}</td><td>{stav}</td></tr>"
-
-    return HTMLResponse(
-        '<table style="font-size: 0.85rem; margin: 0.5rem 0;">'
-        "<thead><tr>"
-        f"<th>{html_mod.escape(_t('related.th.tisk'))}</th>"
-        f"<th>{html_mod.escape(_t('related.th.title'))}</th>"
-        f"<th>{html_mod.escape(_t('related.th.type'))}</th>"
-        f"<th>{html_mod.escape(_t('related.th.status'))}</th>"
-        "</tr></thead>"
-        f"<tbody>{rows_html}</tbody>"
-        "</table>"
+    return templates.TemplateResponse(
+        "partials/related_bills.html", {"request": request, "bills": bills}
     )
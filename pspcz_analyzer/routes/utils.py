@@ -1,10 +1,20 @@
 """Shared route utilities."""
 
-from urllib.parse import urlparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 from fastapi import HTTPException
+from loguru import logger
 
 from pspcz_analyzer.config import PERIOD_YEARS
+from pspcz_analyzer.middleware import run_with_timeout
+from pspcz_analyzer.models.analysis_models import LoyaltyRow
+from pspcz_analyzer.models.tisk_models import PeriodData
+from pspcz_analyzer.services.analysis_cache import analysis_cache, cache_key
+from pspcz_analyzer.services.attendance_service import compute_attendance
+from pspcz_analyzer.services.loyalty_service import compute_loyalty, rebellion_table
+from pspcz_analyzer.services.similarity_service import compute_cross_party_similarity
 
 
 def validate_period(period: int) -> int:
@@ -13,14 +23,104 @@ def validate_period(period: int) -> int:
     return period
 
 
-def _safe_url(url: str) -> str:
-    """Return url only if scheme is http/https, else empty string."""
-    if not url:
-        return ""
+# Cold-cache computations currently running, so concurrent requests for the
+# same key await one result instead of each taking a worker-pool slot
+_inflight: dict[str, asyncio.Future[Any]] = {}
+
+
+async def single_flight(key: str, run: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``run()``, sharing one in-flight call among concurrent callers of ``key``.
+
+    Only deduplicates calls that overlap in time; callers that need the
+    result to persist cache it themselves.
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    # Mark a failure as retrieved even when no other request was waiting
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight[key] = future
     try:
-        parsed = urlparse(url)
-        if parsed.scheme in ("http", "https"):
-            return url
-    except ValueError:
-        pass
-    return ""
+        result = await run()
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+        if not future.done():
+            future.cancel()
+
+
+async def cached_analysis(
+    key: str, compute_fn: Callable[[], Any], *, timeout: float, label: str
+) -> Any:
+    """Return a cached analysis result, computing it on the compute pool on a miss.
+
+    Cache hits are served on the event loop without a thread hop; concurrent
+    misses for the same key share a single computation.
+    """
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        return cached
+    return await single_flight(
+        key,
+        lambda: run_with_timeout(
+            lambda: analysis_cache.get_or_compute(key, compute_fn), timeout=timeout, label=label
+        ),
+    )
+
+
+def cached_loyalty(pd: PeriodData, top: int, party_filter: str | None = None) -> list[LoyaltyRow]:
+    """``compute_loyalty`` over the period's cached rebellion table.
+
+    The table doesn't depend on ``top`` or the party filter, so it is built
+    once per period and shared by every page, filter and chart request.
+    """
+    rebellions = analysis_cache.get_or_compute(
+        cache_key("loyalty", pd.period, "rebellions"), lambda: rebellion_table(pd)
+    )
+    return compute_loyalty(pd, top=top, party_filter=party_filter, rebellions=rebellions)
+
+
+async def warm_period_analyses(pd: PeriodData) -> None:
+    """Precompute a period's default (unfiltered) analysis pages into the cache.
+
+    Uses the same keys as the voting routes with their default parameters,
+    so the first visitor after startup or a data reload gets a cache hit.
+    The analyses run side by side on the compute pool, and a request that
+    arrives meanwhile joins the in-flight computation. Failures are logged,
+    not raised.
+    """
+    p = pd.period
+    results = await asyncio.gather(
+        cached_analysis(
+            cache_key("loyalty", p, 30, ""),
+            lambda: cached_loyalty(pd, 30),
+            timeout=60.0,
+            label="loyalty warm-up",
+        ),
+        cached_analysis(
+            cache_key("attendance", p, 30, "worst", ""),
+            lambda: compute_attendance(pd, top=30, sort="worst"),
+            timeout=60.0,
+            label="attendance warm-up",
+        ),
+        cached_analysis(
+            cache_key("similarity", p, 20),
+            lambda: compute_cross_party_similarity(pd, top=20),
+            timeout=60.0,
+            label="similarity warm-up",
+        ),
+        run_with_timeout(lambda: pd.browsable_votes, timeout=60.0, label="votes warm-up"),
+        return_exceptions=True,
+    )
+    failures = [r for r in results if isinstance(r, BaseException)]
+    for exc in failures:
+        logger.opt(exception=exc).warning("Analysis warm-up failed for period {}", p)
+    if not failures:
+        logger.info("Warmed default analyses for period {}", p)
@@ -53,7 +53,7 @@ def _download_amendment_pdf(
 
     # Fallback: iterate sub-tisk versions
     try:
-        versions = scrape_all_subtisk_documents(period, ct)
+        versions = scrape_all_subtisk_documents(period, ct, cache_dir=cache_dir)
     except Exception:
         logger.warning("[amendment pipeline] Failed to scrape sub-tisk versions for ct={}", ct)
         return ""
@@ -152,6 +152,11 @@ _SUBMITTER_NAVRH_RE = re.compile(
 )
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+# Separators in letter/name lists: "A, B a C"
+_LIST_SEP_RE = re.compile(r",\s*|\s+a\s+")
+
+
 @dataclass
 class _ParseBlock:
     """Intermediate representation of a text block between votes."""
@@ -182,7 +187,7 @@ def _clean_html(html: str) -> str:
     text = HTMLParser(html).text(separator=" ", strip=True) or ""
     text = html_unescape(text)
     text = text.replace("\xa0", " ")
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
@@ -228,7 +233,7 @@ def _parse_letter_groups(letter_str: str) -> tuple[str, list[str]]:
         Tuple of (primary_letter, grouped_with_letters).
     """
     # Split on " a " and ", "
-    parts = re.split(r"\s+a\s+|,\s*", letter_str.strip())
+    parts = _LIST_SEP_RE.split(letter_str.strip())
     parts = [p.strip() for p in parts if p.strip()]
     if not parts:
         return letter_str.strip(), []
@@ -406,7 +411,7 @@ def _parse_block(block_text: str) -> _ParseBlock:
                 plural_match = _SUBMITTER_PLURAL_RE.search(block_text)
                 if plural_match:
                     raw_names = plural_match.group(1)
-                    parts = re.split(r",\s*|\s+a\s+", raw_names)
+                    parts = _LIST_SEP_RE.split(raw_names)
                     pb.submitter_names = [p.strip() for p in parts if p.strip()]
 
     return pb
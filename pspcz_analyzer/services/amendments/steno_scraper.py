@@ -17,7 +17,6 @@ This module handles:
 """
 
 import re
-import time
 from enum import StrEnum
 from html import unescape as html_unescape
 from pathlib import Path
@@ -28,9 +27,10 @@ from selectolax.parser import HTMLParser
 
 from pspcz_analyzer.config import (
     PERIOD_YEARS,
-    PSP_REQUEST_DELAY,
+    PSP_HOST,
     UNL_ENCODING,
 )
+from pspcz_analyzer.data.http_client import get_client, host_limiter
 
 
 class StenoFailure(StrEnum):
@@ -166,11 +166,11 @@ def _download_cached(
         return content
 
     try:
-        resp = httpx.get(url, timeout=30.0, follow_redirects=True)
+        host_limiter(PSP_HOST).wait()
+        resp = get_client().get(url)
         resp.raise_for_status()
         html = _detect_decode(resp.content)
         cache_file.write_text(html, encoding="utf-8")
-        time.sleep(PSP_REQUEST_DELAY)
         return html
     except httpx.HTTPError:
         logger.warning("[amendment pipeline] Failed to fetch: {}", url)
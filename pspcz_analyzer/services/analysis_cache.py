@@ -4,33 +4,88 @@ import threading
 import time
 from collections.abc import Callable
 from typing import Any
+from urllib.parse import quote
 
 from loguru import logger
 
 
+def cache_key(namespace: str, *params: object) -> str:
+    """Build an ``analysis_cache`` key from a namespace and request parameters.
+
+    Parameters are percent-encoded, so free-form values (search text, party
+    names) can never contain the ``:`` separator: distinct parameter tuples
+    always give distinct keys, and a key prefix such as ``amendments:10:``
+    only matches that namespace and period.
+    """
+    return ":".join([namespace, *(quote(str(p), safe="") for p in params)])
+
+
 class AnalysisCache:
-    """Thread-safe dict cache with TTL expiry."""
+    """Thread-safe dict cache with TTL expiry and a least-recently-used size cap.
 
-    def __init__(self, ttl: int = 3600):
+    The cap matters because rendered partials are keyed by free-form
+    request parameters (e.g. vote search text), so the key space is unbounded.
+    """
+
+    def __init__(self, ttl: int = 3600, max_entries: int = 2048):
         self._ttl = ttl
+        self._max_entries = max_entries
         self._store: dict[str, tuple[float, Any]] = {}
         self._lock = threading.Lock()
+        # Per-key locks held while a value is being computed
+        self._key_locks: dict[str, threading.Lock] = {}
 
-    def get_or_compute(self, key: str, compute_fn: Callable[[], Any]) -> Any:
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
         now = time.monotonic()
         with self._lock:
             if key in self._store:
                 ts, value = self._store[key]
                 if now - ts < self._ttl:
                     logger.debug("Cache HIT: {}", key)
+                    # Re-insert so dict order tracks recency of use
+                    self._store[key] = self._store.pop(key)
                     return value
                 del self._store[key]
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, restarting its TTL."""
+        with self._lock:
+            self._put(key, value)
+
+    def _put(self, key: str, value: Any) -> None:
+        """Store under ``key`` as most recent, evicting the oldest past the cap (lock held)."""
+        self._store.pop(key, None)
+        self._store[key] = (time.monotonic(), value)
+        while len(self._store) > self._max_entries:
+            del self._store[next(iter(self._store))]
+
+    def get_or_compute(self, key: str, compute_fn: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it on a miss.
 
-        logger.debug("Cache MISS: {}", key)
-        value = compute_fn()
+        Single-flight per key: concurrent misses wait for the one thread
+        already computing and then read its result, instead of repeating
+        the same work.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
 
         with self._lock:
-            self._store[key] = (time.monotonic(), value)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is not None:
+                return value
+            logger.debug("Cache MISS: {}", key)
+            try:
+                value = compute_fn()
+                with self._lock:
+                    self._put(key, value)
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
         return value
 
     def invalidate(self, prefix: str = "") -> int:
@@ -2,6 +2,7 @@
 
 import polars as pl
 
+from pspcz_analyzer.models.analysis_models import AttendanceRow
 from pspcz_analyzer.models.enums import VoteResult
 from pspcz_analyzer.models.tisk_models import PeriodData
 
@@ -11,7 +12,7 @@ def compute_attendance(
     top: int = 30,
     sort: str = "worst",
     party_filter: str | None = None,
-) -> list[dict]:
+) -> list[AttendanceRow]:
     """Compute attendance rates for MPs.
 
     Categories:
@@ -67,7 +68,7 @@ def compute_attendance(
     col, desc = sort_config.get(sort, ("attendance_pct", False))
     result = result.sort(col, descending=desc).head(top)
 
-    return result.select(
+    rows = result.select(
         "jmeno",
         "prijmeni",
         "party",
@@ -79,4 +80,5 @@ def compute_attendance(
         "absent",
         "excused",
         "attendance_pct",
-    ).to_dicts()
+    ).iter_rows()
+    return [AttendanceRow(*row) for row in rows]
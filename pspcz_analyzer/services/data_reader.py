@@ -2,6 +2,9 @@
 
 import asyncio
 import contextlib
+import functools
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 import polars as pl
@@ -57,6 +60,20 @@ from pspcz_analyzer.services.tisk import (
 _WATCH_INTERVAL_S = 30
 
 
+@functools.lru_cache(maxsize=32)
+def _index_dir(directory: Path, mtime_ns: int) -> dict[str, Path]:
+    """Map lowercased file names in a directory tree to their paths.
+
+    ``mtime_ns`` only keys the cache: re-extraction touches the directory,
+    so a refreshed tree gets a fresh index. The first match wins.
+    """
+    index: dict[str, Path] = {}
+    for root, _dirs, files in os.walk(directory):
+        for name in files:
+            index.setdefault(name.lower(), Path(root) / name)
+    return index
+
+
 def _collect_parquet_mtimes(cache_dir: Path) -> dict[str, float]:
     """Collect mtime of all parquet files in cache dir."""
     parquet_dir = cache_dir / "parquet"
@@ -89,6 +106,8 @@ class DataReader:
         self._periods: dict[int, PeriodData] = {}
         self.tisk_text = TiskTextService(cache_dir)
         self._cache_mgr = TiskCacheManager(cache_dir)
+        # Topic map last applied per period — a new object means a re-read parquet
+        self._applied_topic_maps: dict[int, dict[int, list[str]]] = {}
 
         # Shared tables (not period-specific)
         self._persons: pl.DataFrame | None = None
@@ -106,6 +125,8 @@ class DataReader:
         self._last_mtimes: dict[str, float] = {}
         self._last_amendment_mtimes: dict[int, float] = {}
         self._watcher_task: asyncio.Task | None = None
+        # Called with each period the file watcher reloaded, after the analysis cache is cleared
+        self.on_period_reloaded: Callable[[PeriodData], None] | None = None
 
     @property
     def available_periods(self) -> list[dict]:
@@ -146,6 +167,9 @@ class DataReader:
         law_changes_map = self._cache_mgr.load_law_changes_cache(period)
         subtisk_map = self._cache_mgr.load_subtisk_versions_cache(period)
         diffs_map, diffs_en_map = self._cache_mgr.load_version_diffs_cache(period)
+        if topic_map is not self._applied_topic_maps.get(period):
+            self._applied_topic_maps[period] = topic_map
+            pd.invalidate_topic_labels()
         for tisk in pd.tisk_lookup.values():
             tisk.topics = topic_map.get(tisk.ct, [])
             tisk.summary = summary_map.get(tisk.ct, "")
@@ -377,13 +401,12 @@ class DataReader:
 
     def _find_file(self, directory: Path, filename: str) -> Path:
         """Find a file in directory tree (case-insensitive search)."""
-        for f in directory.rglob(filename):
-            return f
-        for f in directory.rglob("*"):
-            if f.name.lower() == filename.lower():
-                return f
-        msg = f"File {filename} not found in {directory}"
-        raise FileNotFoundError(msg)
+        index = _index_dir(directory, directory.stat().st_mtime_ns)
+        try:
+            return index[filename.lower()]
+        except KeyError:
+            msg = f"File {filename} not found in {directory}"
+            raise FileNotFoundError(msg) from None
 
     # ── File watcher ─────────────────────────────────────────────
 
@@ -446,6 +469,9 @@ class DataReader:
                 "[file-watcher] Invalidated analysis cache for {} periods",
                 len(periods_to_reload),
             )
+            if self.on_period_reloaded is not None:
+                for period in periods_to_reload:
+                    self.on_period_reloaded(self._periods[period])
 
     def _check_amendment_updates(self) -> None:
         """Check for changed amendment parquets and reload affected periods."""
@@ -18,7 +18,6 @@ from pspcz_analyzer.config import (
     DEV_SKIP_AMENDMENTS,
     PERIOD_ORGAN_IDS,
 )
-from pspcz_analyzer.data.cache import invalidate_parquet
 from pspcz_analyzer.data.downloader import (
     download_poslanci_data,
     download_schuze_data,
@@ -59,11 +58,7 @@ class DataService(DataReader):
             logger.warning("[tisk pipeline] Cannot start: tisky table not loaded")
             return False
 
-        organ_id = PERIOD_ORGAN_IDS[period]
-        period_tisky = self._tisky.filter(
-            (pl.col("id_obdobi") == organ_id) & pl.col("ct").is_not_null()
-        )
-        ct_numbers = sorted(period_tisky.get_column("ct").unique().to_list())
+        ct_numbers = self._tisk_ct_numbers([period]).get(period, [])
         if not ct_numbers:
             logger.warning("[tisk pipeline] Cannot start: no ct numbers for period {}", period)
             return False
@@ -92,6 +87,32 @@ class DataService(DataReader):
         self.tisk_pipeline.start_period(period, ct_numbers, on_complete=_on_complete, mode=mode)
         return True
 
+    def _tisk_ct_numbers(self, periods: list[int]) -> dict[int, list[int]]:
+        """Sorted unique tisk numbers per period from the shared tisky table.
+
+        One lazy pass: the filter and group-by only touch the ``id_obdobi``
+        and ``ct`` columns instead of materializing a filtered copy of the
+        whole table per period.
+        """
+        assert self._tisky is not None
+        organ_to_period = {PERIOD_ORGAN_IDS[p]: p for p in periods}
+        grouped = (
+            self._tisky.lazy()
+            .select("id_obdobi", "ct")
+            .filter(pl.col("id_obdobi").is_in(list(organ_to_period)) & pl.col("ct").is_not_null())
+            .group_by("id_obdobi")
+            .agg(pl.col("ct").unique().sort())
+            .collect()
+        )
+        return {
+            organ_to_period[organ_id]: cts
+            for organ_id, cts in zip(
+                grouped.get_column("id_obdobi").to_list(),
+                grouped.get_column("ct").to_list(),
+                strict=True,
+            )
+        }
+
     def start_amendment_pipeline(
         self, period: int, mode: AmendmentMode = AmendmentMode.FULL
     ) -> bool:
@@ -173,15 +194,11 @@ class DataService(DataReader):
         if self._tisky is None:
             return
 
-        period_ct: list[tuple[int, list[int]]] = []
-        for period in sorted(PERIOD_ORGAN_IDS.keys(), reverse=True):
-            organ_id = PERIOD_ORGAN_IDS[period]
-            period_tisky = self._tisky.filter(
-                (pl.col("id_obdobi") == organ_id) & pl.col("ct").is_not_null()
-            )
-            ct_numbers = sorted(period_tisky.get_column("ct").unique().to_list())
-            if ct_numbers:
-                period_ct.append((period, ct_numbers))
+        periods = sorted(PERIOD_ORGAN_IDS.keys(), reverse=True)
+        ct_by_period = self._tisk_ct_numbers(periods)
+        period_ct: list[tuple[int, list[int]]] = [
+            (period, ct_by_period[period]) for period in periods if ct_by_period.get(period)
+        ]
 
         if not period_ct:
             return
@@ -240,17 +257,8 @@ class DataService(DataReader):
         self._bod_schuze = None
         self._tisky = None
 
-        for table in (
-            "osoby",
-            "poslanec",
-            "organy",
-            "zarazeni",
-            "schuze",
-            "bod_schuze",
-            "tisky",
-        ):
-            invalidate_parquet(table, self.cache_dir)
-
+        # Parquet caches follow the extracted dirs' mtimes, which only move
+        # when a re-downloaded ZIP's content actually changed
         download_poslanci_data(self.cache_dir, force=True)
         download_schuze_data(self.cache_dir, force=True)
         download_tisky_data(self.cache_dir, force=True)
@@ -258,13 +266,6 @@ class DataService(DataReader):
 
     def _force_reload_period(self, period: int) -> None:
         """Re-download and re-parse voting data for a single period."""
-        for table in (
-            f"hl_hlasovani_{period}",
-            f"hl_poslanec_{period}",
-            f"zmatecne_{period}",
-        ):
-            invalidate_parquet(table, self.cache_dir)
-
         download_voting_data(period, self.cache_dir, force=True)
         if period in self._periods:
             self._load_period(period)
@@ -1,5 +1,7 @@
 """Service functions for the laws/bills (zákony) page."""
 
+import polars as pl
+
 from pspcz_analyzer.models.tisk_models import PeriodData, TiskInfo
 
 
@@ -205,42 +207,39 @@ def _find_votes_for_ct(data: PeriodData, ct: int) -> list[dict]:
     Returns:
         List of vote dicts with id, session, number, date, description, result.
     """
-    # Collect (schuze, bod) pairs for this ct
-    schuze_bod_pairs: set[tuple[int, int]] = set()
-    for (schuze, bod), tisk in data.tisk_lookup.items():
-        if tisk.ct == ct:
-            schuze_bod_pairs.add((schuze, bod))
-
-    if not schuze_bod_pairs:
+    keys = data.get_tisk_keys_by_ct(ct)
+    if not keys:
         return []
 
-    votes_list: list[dict] = []
-    for _, row in enumerate(data.votes.iter_rows(named=True)):
-        key = (row.get("schuze"), row.get("bod"))
-        if key in schuze_bod_pairs:
-            vysledek = row.get("vysledek", "")
-            match vysledek:
-                case "A":
-                    result_label = "passed"
-                case "R":
-                    result_label = "rejected"
-                case "Z":
-                    result_label = "void"
-                case _:
-                    result_label = vysledek
-            votes_list.append(
-                {
-                    "id_hlasovani": row.get("id_hlasovani"),
-                    "schuze": row.get("schuze"),
-                    "cislo": row.get("cislo"),
-                    "datum": row.get("datum"),
-                    "nazev_dlouhy": row.get("nazev_dlouhy", ""),
-                    "result": result_label,
-                }
-            )
+    key_df = pl.DataFrame(keys, schema={"schuze": pl.Int64, "bod": pl.Int64}, orient="row")
+    matched = (
+        data.votes.join(key_df, on=["schuze", "bod"], how="semi")
+        .sort("id_hlasovani", descending=True, nulls_last=True)
+        .select("id_hlasovani", "schuze", "cislo", "datum", "nazev_dlouhy", "vysledek")
+    )
 
-    # Sort by id_hlasovani descending
-    votes_list.sort(key=lambda v: v.get("id_hlasovani", 0) or 0, reverse=True)
+    votes_list: list[dict] = []
+    for row in matched.iter_rows(named=True):
+        vysledek = row["vysledek"]
+        match vysledek:
+            case "A":
+                result_label = "passed"
+            case "R":
+                result_label = "rejected"
+            case "Z":
+                result_label = "void"
+            case _:
+                result_label = vysledek
+        votes_list.append(
+            {
+                "id_hlasovani": row["id_hlasovani"],
+                "schuze": row["schuze"],
+                "cislo": row["cislo"],
+                "datum": row["datum"],
+                "nazev_dlouhy": row["nazev_dlouhy"],
+                "result": result_label,
+            }
+        )
     return votes_list
 
 
@@ -259,13 +258,7 @@ def law_detail(
     Returns:
         Dict with full bill info, or None if ct not found.
     """
-    # Find TiskInfo by ct
-    tisk: TiskInfo | None = None
-    for t in data.tisk_lookup.values():
-        if t.ct == ct:
-            tisk = t
-            break
-
+    tisk = data.get_tisk_by_ct(ct)
     if tisk is None:
         return None
 
@@ -2,21 +2,22 @@
 
 import polars as pl
 
+from pspcz_analyzer.models.analysis_models import LoyaltyRow, RebellionVote
 from pspcz_analyzer.models.enums import VoteResult
 from pspcz_analyzer.models.tisk_models import PeriodData
 
 
-def compute_loyalty(
-    data: PeriodData,
-    top: int = 30,
-    party_filter: str | None = None,
-) -> list[dict]:
-    """Compute rebellion rates for MPs.
+def rebellion_table(data: PeriodData) -> pl.DataFrame:
+    """Flag every active MP vote that went against the MP's party majority.
 
     For each vote, determine the party's majority direction (YES vs NO).
     An MP "rebels" when they actively vote against that majority.
 
-    Returns a list of dicts sorted by rebellion rate descending.
+    This is the expensive, filter-independent part of the loyalty analysis,
+    so callers can build it once per period and pass it to ``compute_loyalty``.
+
+    Returns one row per active vote with a party majority: id_poslanec,
+    id_hlasovani, vysledek, party_direction, is_rebellion.
     """
     # Exclude void votes
     void_ids = data.void_votes.get_column("id_hlasovani")
@@ -59,49 +60,29 @@ def compute_loyalty(
     )
 
     # Flag rebellions
-    with_direction = with_direction.with_columns(
-        (pl.col("vysledek") != pl.col("party_direction")).alias("is_rebellion")
+    return with_direction.select(
+        "id_poslanec",
+        "id_hlasovani",
+        "vysledek",
+        "party_direction",
+        (pl.col("vysledek") != pl.col("party_direction")).alias("is_rebellion"),
     )
 
-    # Collect rebellion vote details before aggregating
-    rebellions_df = (
-        with_direction.filter(pl.col("is_rebellion"))
-        .join(
-            data.votes.select("id_hlasovani", "datum", "nazev_dlouhy", "schuze", "bod"),
-            on="id_hlasovani",
-            how="left",
-        )
-        .select(
-            "id_poslanec",
-            "id_hlasovani",
-            "datum",
-            "nazev_dlouhy",
-            "schuze",
-            "bod",
-            pl.col("vysledek").alias("mp_vote"),
-            "party_direction",
-        )
-    )
 
-    # Build per-MP rebellion vote lists
-    rebellion_map: dict[int, list[dict]] = {}
-    for row in rebellions_df.iter_rows(named=True):
-        mp_id = row["id_poslanec"]
-        schuze = row["schuze"]
-        bod = row["bod"]
-        tisk = data.get_tisk(schuze, bod) if schuze and bod else None
-        rebellion_map.setdefault(mp_id, []).append(
-            {
-                "id_hlasovani": row["id_hlasovani"],
-                "datum": row["datum"] or "",
-                "nazev_dlouhy": row["nazev_dlouhy"] or "",
-                "mp_vote": row["mp_vote"],
-                "party_direction": row["party_direction"],
-                "schuze": schuze,
-                "bod": bod,
-                "tisk_url": tisk.url if tisk else None,
-            }
-        )
+def compute_loyalty(
+    data: PeriodData,
+    top: int = 30,
+    party_filter: str | None = None,
+    rebellions: pl.DataFrame | None = None,
+) -> list[LoyaltyRow]:
+    """Compute rebellion rates for MPs.
+
+    Args:
+        rebellions: Precomputed ``rebellion_table(data)``; built here when omitted.
+
+    Returns rows sorted by rebellion rate descending.
+    """
+    with_direction = rebellions if rebellions is not None else rebellion_table(data)
 
     # Aggregate per MP
     per_mp = with_direction.group_by("id_poslanec").agg(
@@ -119,9 +100,10 @@ def compute_loyalty(
     if party_filter:
         result = result.filter(pl.col("party").str.to_uppercase() == party_filter.upper())
 
-    result = result.sort("rebellion_pct", descending=True).head(top)
+    # id tie-break keeps equal rates in a stable order (group_by order is random)
+    result = result.sort(["rebellion_pct", "id_poslanec"], descending=[True, False]).head(top)
 
-    rows = result.select(
+    top_mps = result.select(
         "id_poslanec",
         "jmeno",
         "prijmeni",
@@ -129,13 +111,51 @@ def compute_loyalty(
         "active_votes",
         "rebellions",
         "rebellion_pct",
-    ).to_dicts()
+    )
 
-    # Attach rebellion vote details to each row
-    for row in rows:
-        votes = rebellion_map.get(row["id_poslanec"], [])
-        votes.sort(key=lambda v: v["id_hlasovani"], reverse=True)
-        row["rebellion_votes"] = votes
-        del row["id_poslanec"]
+    # Rebellion vote details, built only for the MPs actually returned
+    rebellions_df = (
+        with_direction.filter(
+            pl.col("is_rebellion") & pl.col("id_poslanec").is_in(result.get_column("id_poslanec"))
+        )
+        .join(
+            data.votes.select("id_hlasovani", "datum", "nazev_dlouhy", "schuze", "bod"),
+            on="id_hlasovani",
+            how="left",
+        )
+        .sort("id_hlasovani", descending=True)
+        .select(
+            "id_poslanec",
+            "id_hlasovani",
+            "datum",
+            "nazev_dlouhy",
+            "schuze",
+            "bod",
+            pl.col("vysledek").alias("mp_vote"),
+            "party_direction",
+        )
+    )
+
+    rebellion_map: dict[int, list[RebellionVote]] = {}
+    for row in rebellions_df.iter_rows(named=True):
+        schuze = row["schuze"]
+        bod = row["bod"]
+        tisk = data.get_tisk(schuze, bod) if schuze and bod else None
+        rebellion_map.setdefault(row["id_poslanec"], []).append(
+            RebellionVote(
+                id_hlasovani=row["id_hlasovani"],
+                datum=row["datum"] or "",
+                nazev_dlouhy=row["nazev_dlouhy"] or "",
+                mp_vote=row["mp_vote"],
+                party_direction=row["party_direction"],
+                schuze=schuze,
+                bod=bod,
+                tisk_url=tisk.url if tisk else None,
+            )
+        )
 
-    return rows
+    # Attach rebellion vote details to each row, newest first
+    return [
+        LoyaltyRow(*fields, rebellion_votes=rebellion_map.get(id_poslanec, []))
+        for id_poslanec, *fields in top_mps.iter_rows()
+    ]
@@ -3,6 +3,7 @@
 import numpy as np
 import polars as pl
 
+from pspcz_analyzer.models.analysis_models import SimilarPair
 from pspcz_analyzer.models.enums import VoteResult
 from pspcz_analyzer.models.tisk_models import PeriodData
 
@@ -72,7 +73,7 @@ def compute_pca_coords(data: PeriodData) -> list[dict]:
     ]
 
 
-def compute_cross_party_similarity(data: PeriodData, top: int = 20) -> list[dict]:
+def compute_cross_party_similarity(data: PeriodData, top: int = 20) -> list[SimilarPair]:
     """Find the most similar cross-party MP pairs.
 
     Uses cosine similarity on the vote matrix.
@@ -88,21 +89,22 @@ def compute_cross_party_similarity(data: PeriodData, top: int = 20) -> list[dict
     names = (mp_info.get_column("jmeno") + " " + mp_info.get_column("prijmeni")).to_list()
     parties = mp_info.get_column("party").to_list()
 
-    # Find top cross-party pairs
-    n = len(names)
-    pairs = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            if parties[i] and parties[j] and parties[i] != parties[j]:
-                pairs.append(
-                    {
-                        "mp1_name": names[i],
-                        "mp1_party": parties[i],
-                        "mp2_name": names[j],
-                        "mp2_party": parties[j],
-                        "similarity": float(similarity[i, j]),
-                    }
-                )
-
-    pairs.sort(key=lambda p: p["similarity"], reverse=True)
-    return pairs[:top]
+    # Find top cross-party pairs: select on the matrix, build rows only for the winners
+    party_codes: dict[str, int] = {}
+    codes = np.array([party_codes.setdefault(p, len(party_codes)) if p else -1 for p in parties])
+    cross_party = (codes[:, None] != codes[None, :]) & (codes[:, None] >= 0) & (codes[None, :] >= 0)
+    rows, cols = np.nonzero(np.triu(cross_party, k=1))
+    scores = similarity[rows, cols]
+    # Stable sort keeps (i, j) row-major order among equal similarities
+    best = np.argsort(-scores, kind="stable")[:top]
+
+    return [
+        SimilarPair(
+            mp1_name=names[rows[k]],
+            mp1_party=parties[rows[k]],
+            mp2_name=names[cols[k]],
+            mp2_party=parties[cols[k]],
+            similarity=float(scores[k]),
+        )
+        for k in best
+    ]
@@ -8,12 +8,17 @@ from loguru import logger
 
 from pspcz_analyzer.config import (
     TISKY_HISTORIE_DIR,
+    TISKY_HISTORIES_PARQUET,
     TISKY_LAW_CHANGES_DIR,
     TISKY_META_DIR,
     TISKY_VERSION_DIFFS_DIR,
 )
 from pspcz_analyzer.services.llm import deserialize_topics
-from pspcz_analyzer.services.tisk.io import load_history_json
+from pspcz_analyzer.services.tisk.io import (
+    ProposedLawChange,
+    load_histories_parquet,
+    load_history_json,
+)
 
 
 class TiskCacheManager:
@@ -66,12 +71,16 @@ class TiskCacheManager:
         """
         meta_path = self.cache_dir / TISKY_META_DIR / str(period) / "topic_classifications.parquet"
         if not meta_path.exists():
+            # Hand back the same empty map on every call: callers detect a
+            # re-read parquet by identity, so a fresh dict would look like one
+            if period in self._topic_cache and self._topic_cache_mtime.get(period) == 0:
+                return self._topic_cache[period]
             self._topic_cache[period] = {}
             self._topic_en_cache[period] = {}
             self._summary_cache[period] = {}
             self._summary_en_cache[period] = {}
             self._topic_cache_mtime[period] = 0
-            return {}
+            return self._topic_cache[period]
 
         # Check if we need to re-read (new file or modified since last load)
         current_mtime = meta_path.stat().st_mtime
@@ -116,27 +125,26 @@ class TiskCacheManager:
         return topics
 
     def load_history_cache(self, period: int) -> dict:
-        """Load legislative history JSON files for a period.
+        """Load legislative histories for a period.
 
-        Returns {ct: TiskHistory} dict. Caches in memory.
+        Reads the period's parquet snapshot when present, falling back to the
+        per-tisk JSON files. Returns {ct: TiskHistory} dict. Caches in memory.
         """
         if period in self._history_cache:
             return self._history_cache[period]
 
-        hist_dir = self.cache_dir / TISKY_META_DIR / str(period) / TISKY_HISTORIE_DIR
-        histories: dict = {}
-        if not hist_dir.exists():
-            self._history_cache[period] = histories
-            return histories
-
-        for json_path in hist_dir.glob("*.json"):
-            try:
-                ct = int(json_path.stem)
-            except ValueError:
-                continue
-            h = load_history_json(json_path)
-            if h:
-                histories[ct] = h
+        meta_dir = self.cache_dir / TISKY_META_DIR / str(period)
+        histories: dict = load_histories_parquet(meta_dir / TISKY_HISTORIES_PARQUET)
+        hist_dir = meta_dir / TISKY_HISTORIE_DIR
+        if not histories and hist_dir.exists():
+            for json_path in hist_dir.glob("*.json"):
+                try:
+                    ct = int(json_path.stem)
+                except ValueError:
+                    continue
+                h = load_history_json(json_path)
+                if h:
+                    histories[ct] = h
 
         self._history_cache[period] = histories
         if histories:
@@ -147,15 +155,15 @@ class TiskCacheManager:
             )
         return histories
 
-    def load_law_changes_cache(self, period: int) -> dict[int, list[dict]]:
+    def load_law_changes_cache(self, period: int) -> dict[int, list[ProposedLawChange]]:
         """Load law changes JSON files for a period.
 
         Always reads from disk (no in-memory cache) so incremental pipeline
         results are visible immediately in the UI.
-        Returns {ct: [law_change_dicts]}.
+        Returns {ct: [ProposedLawChange]}.
         """
         lc_dir = self.cache_dir / TISKY_META_DIR / str(period) / TISKY_LAW_CHANGES_DIR
-        changes: dict[int, list[dict]] = {}
+        changes: dict[int, list[ProposedLawChange]] = {}
         if not lc_dir.exists():
             return changes
 
@@ -167,7 +175,7 @@ class TiskCacheManager:
             try:
                 data = json.loads(json_path.read_text(encoding="utf-8"))
                 if data:  # only store non-empty
-                    changes[ct] = data
+                    changes[ct] = [ProposedLawChange(**d) for d in data]
             except Exception:
                 logger.opt(exception=True).warning(
                     "Failed to load law changes from {}",
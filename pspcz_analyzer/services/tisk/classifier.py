@@ -1,12 +1,13 @@
 """Topic classification and consolidation for parliamentary prints."""
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import polars as pl
 from loguru import logger
 
-from pspcz_analyzer.config import TISKY_META_DIR
+from pspcz_analyzer.config import LLM_CONCURRENCY, TISKY_META_DIR
 from pspcz_analyzer.services.llm import (
     LLMClient,
     create_llm_client,
@@ -14,6 +15,28 @@ from pspcz_analyzer.services.llm import (
     serialize_topics,
 )
 
+# Fixed column layout of topic_classifications.parquet
+_CLASSIFICATION_SCHEMA: dict[str, type[pl.DataType]] = {
+    "ct": pl.Int64,
+    "topic": pl.Utf8,
+    "topic_en": pl.Utf8,
+    "summary": pl.Utf8,
+    "summary_en": pl.Utf8,
+    "source": pl.Utf8,
+}
+
+
+def _write_classifications(records: list[dict], parquet_path: Path) -> None:
+    """Write classification records column-wise with an explicit schema.
+
+    Building one list per column and passing the schema up front skips
+    Polars' row-wise dict ingestion and schema inference, which otherwise
+    re-runs over every record on each incremental save.
+    """
+    columns = {name: [r.get(name) for r in records] for name in _CLASSIFICATION_SCHEMA}
+    df = pl.DataFrame(columns, schema=_CLASSIFICATION_SCHEMA)
+    df.write_parquet(parquet_path, compression="zstd", compression_level=3)
+
 
 def classify_and_save(
     period: int,
@@ -25,6 +48,8 @@ def classify_and_save(
     """Run topic classification on extracted texts, save parquet, return maps.
 
     Uses LLM when available (free-form topics), falls back to keyword matching.
+    Up to ``LLM_CONCURRENCY`` tisky are processed at once — the work is LLM
+    HTTP round-trips, so threads overlap them without contending for the GIL.
     Saves incrementally after each tisk and resumes from where it left off.
     Smart caching: tisks with topics but no summary are re-processed for
     summaries only (2 LLM calls instead of 4).
@@ -85,27 +110,36 @@ def classify_and_save(
         # Without LLM, return whatever we have cached
         return _build_topic_summary_maps(records, period)
 
-    for i, (ct, text_path) in enumerate(sorted(remaining.items()), fully_done + 1):
-        if cancel_check:
-            cancel_check()
-        record = _classify_single_tisk(
-            ct,
-            text_path,
-            llm,
-            use_ai,
-            i,
-            total,
-            existing_record=incomplete.get(ct),
-            cancel_check=cancel_check,
-        )
-        records.append(record)
-
-        # Save after every tisk so progress is never lost
-        df = pl.DataFrame(records)
-        df.write_parquet(parquet_path)
-
-        if progress_callback is not None:
-            progress_callback(i, total)
+    with ThreadPoolExecutor(max_workers=LLM_CONCURRENCY, thread_name_prefix="classify") as pool:
+        futures = [
+            pool.submit(
+                _classify_single_tisk,
+                ct,
+                text_path,
+                llm,
+                use_ai,
+                i,
+                total,
+                existing_record=incomplete.get(ct),
+                cancel_check=cancel_check,
+            )
+            for i, (ct, text_path) in enumerate(sorted(remaining.items()), fully_done + 1)
+        ]
+        try:
+            for done, future in enumerate(as_completed(futures), fully_done + 1):
+                records.append(future.result())
+
+                # Save after every tisk so progress is never lost
+                _write_classifications(records, parquet_path)
+
+                if progress_callback is not None:
+                    progress_callback(done, total)
+                if cancel_check:
+                    cancel_check()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
     # Build return maps from all records (existing + new)
     return _build_topic_summary_maps(records, period)
@@ -127,7 +161,6 @@ def _classify_single_tisk(
     generates the summary (2 LLM calls). If nothing exists, does a
     combined classify+summarize call (2 LLM calls instead of 4).
     """
-    text = text_path.read_text(encoding="utf-8")
     source = "unclassified"
 
     # Check what we already have from a previous run
@@ -142,6 +175,9 @@ def _classify_single_tisk(
     summary_en = ""
 
     if use_ai:
+        # Read the whole text only when an LLM will see it: the shortener
+        # mines headings from past the verbatim window, so a prefix won't do
+        text = text_path.read_text(encoding="utf-8")
         if has_topics and not has_summary:
             # Topics already cached — only generate summaries
             topics = deserialize_topics(existing_record["topic"])  # type: ignore[index]
@@ -287,8 +323,7 @@ def consolidate_topics(
         r["topic_en"] = serialize_topics(new_topics_en)
 
     # Re-write parquet
-    df = pl.DataFrame(records)
-    df.write_parquet(parquet_path)
+    _write_classifications(records, parquet_path)
 
     # Write marker so we don't re-consolidate on next startup
     consolidated_marker.touch()
@@ -1,19 +1,19 @@
 """Download tisk PDFs and extract text from them."""
 
-import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import httpx
 import pymupdf
 from loguru import logger
 
 from pspcz_analyzer.config import (
+    PSP_HOST,
     PSP_ORIG2_BASE_URL,
-    PSP_REQUEST_DELAY,
     TISKY_PDF_DIR,
     TISKY_TEXT_DIR,
 )
+from pspcz_analyzer.data.http_client import RateLimiter, download_to, host_limiter
 from pspcz_analyzer.services.tisk.io import get_best_pdf
 
 pymupdf.TOOLS.mupdf_display_warnings(False)
@@ -31,12 +31,7 @@ def download_one(period: int, ct: int, idd: int, cache_dir: Path, force: bool) -
 
     url = f"{PSP_ORIG2_BASE_URL}?idd={idd}"
     try:
-        with httpx.Client(timeout=60, follow_redirects=True) as client:
-            with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(dest, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=65536):
-                        f.write(chunk)
+        download_to(url, dest, timeout=60)
         return dest
     except Exception:
         logger.opt(exception=True).warning("Failed to download tisk {}/{}", period, ct)
@@ -69,6 +64,23 @@ def extract_one(pdf_path: Path, period: int, ct: int, cache_dir: Path, force: bo
     return dest
 
 
+def _fetch_pdf(
+    period: int,
+    ct: int,
+    cache_dir: Path,
+    force: bool,
+    limiter: RateLimiter,
+) -> Path | None:
+    """Scrape the best PDF for a tisk and download it."""
+    limiter.wait()
+    doc = get_best_pdf(period, ct, cache_dir)
+    if doc is None:
+        return None
+
+    limiter.wait()
+    return download_one(period, ct, doc.idd, cache_dir, force)
+
+
 def process_period_sync(
     period: int,
     ct_numbers: list[int],
@@ -76,21 +88,30 @@ def process_period_sync(
     force: bool = False,
     cancel_check: Callable[[], None] | None = None,
     progress_callback: Callable[[int, int], None] | None = None,
+    workers: int = 6,
 ) -> tuple[dict[int, Path], dict[int, Path]]:
     """Synchronous pipeline: scrape -> download -> extract for all ct numbers.
 
+    Cached tisky are resolved inline. The rest are fetched on a thread pool
+    so network latency overlaps, while request starts are paced by the
+    shared psp.cz host limiter. Text extraction stays on the calling
+    thread — PyMuPDF is not thread-safe — and overlaps with the downloads
+    still in flight.
+
     Returns (pdf_paths, text_paths).
     """
     pdf_paths: dict[int, Path] = {}
     text_paths: dict[int, Path] = {}
     total = len(ct_numbers)
+    done = 0
+    pdf_dir = cache_dir / TISKY_PDF_DIR / str(period)
+    text_dir = cache_dir / TISKY_TEXT_DIR / str(period)
+    to_fetch: list[int] = []
 
-    for i, ct in enumerate(ct_numbers, 1):
+    for ct in ct_numbers:
         if cancel_check:
             cancel_check()
         # Check caches first (fast path — no HTTP needed)
-        pdf_dir = cache_dir / TISKY_PDF_DIR / str(period)
-        text_dir = cache_dir / TISKY_TEXT_DIR / str(period)
         pdf_cached = pdf_dir / f"{ct}.pdf"
         text_cached = text_dir / f"{ct}.txt"
 
@@ -98,45 +119,48 @@ def process_period_sync(
             text_paths[ct] = text_cached
             if pdf_cached.exists():
                 pdf_paths[ct] = pdf_cached
-            if progress_callback:
-                progress_callback(i, total)
-            continue
-
-        if pdf_cached.exists() and not force:
+        elif pdf_cached.exists() and not force:
             pdf_paths[ct] = pdf_cached
             # Just need extraction
             txt = extract_one(pdf_cached, period, ct, cache_dir, force)
             if txt:
                 text_paths[ct] = txt
-            if progress_callback:
-                progress_callback(i, total)
-            continue
-
-        # Need to scrape + download
-        if i % 50 == 0 or i == 1:
-            logger.info("[tisk pipeline] Period {}: processing {}/{}", period, i, total)
-
-        doc = get_best_pdf(period, ct)
-        if doc is None:
-            time.sleep(PSP_REQUEST_DELAY)
-            if progress_callback:
-                progress_callback(i, total)
+        else:
+            to_fetch.append(ct)
             continue
 
-        pdf = download_one(period, ct, doc.idd, cache_dir, force)
-        time.sleep(PSP_REQUEST_DELAY)
-
-        if pdf is None:
-            if progress_callback:
-                progress_callback(i, total)
-            continue
-        pdf_paths[ct] = pdf
-
-        txt = extract_one(pdf, period, ct, cache_dir, force)
-        if txt:
-            text_paths[ct] = txt
-
+        done += 1
         if progress_callback:
-            progress_callback(i, total)
+            progress_callback(done, total)
+
+    if not to_fetch:
+        return pdf_paths, text_paths
+
+    logger.info("[tisk pipeline] Period {}: scraping + downloading {} PDFs", period, len(to_fetch))
+    limiter = host_limiter(PSP_HOST)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tisk-pdf") as pool:
+        futures = {
+            pool.submit(_fetch_pdf, period, ct, cache_dir, force, limiter): ct for ct in to_fetch
+        }
+        try:
+            for future in as_completed(futures):
+                if cancel_check:
+                    cancel_check()
+                ct = futures[future]
+                pdf = future.result()
+                if pdf:
+                    pdf_paths[ct] = pdf
+                    txt = extract_one(pdf, period, ct, cache_dir, force)
+                    if txt:
+                        text_paths[ct] = txt
+                done += 1
+                if done % 50 == 0:
+                    logger.info("[tisk pipeline] Period {}: processed {}/{}", period, done, total)
+                if progress_callback:
+                    progress_callback(done, total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
     return pdf_paths, text_paths
@@ -15,8 +15,11 @@ from pspcz_analyzer.services.tisk.io.history_scraper import (
     TiskHistoryStage,
     history_from_dict,
     history_to_dict,
+    load_histories_parquet,
     load_history_json,
+    save_histories_parquet,
     save_history_json,
+    scrape_tisk_histories,
     scrape_tisk_history,
 )
 from pspcz_analyzer.services.tisk.io.law_changes_scraper import (
@@ -53,9 +56,11 @@ __all__ = [
     "get_best_pdf",
     "history_from_dict",
     "history_to_dict",
+    "load_histories_parquet",
     "load_history_json",
     "load_law_changes_json",
     "load_related_bills_json",
+    "save_histories_parquet",
     "save_history_json",
     "save_law_changes_json",
     "save_related_bills_json",
@@ -63,5 +68,6 @@ __all__ = [
     "scrape_proposed_law_changes",
     "scrape_related_bills",
     "scrape_tisk_documents",
+    "scrape_tisk_histories",
     "scrape_tisk_history",
 ]
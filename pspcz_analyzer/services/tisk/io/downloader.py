@@ -1,6 +1,6 @@
 """Download tisk PDFs from psp.cz."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import httpx
@@ -8,10 +8,11 @@ from loguru import logger
 
 from pspcz_analyzer.config import (
     DEFAULT_CACHE_DIR,
+    PSP_HOST,
     PSP_ORIG2_BASE_URL,
-    PSP_REQUEST_DELAY,
     TISKY_PDF_DIR,
 )
+from pspcz_analyzer.data.http_client import download_to, host_limiter
 from pspcz_analyzer.services.tisk.io.scraper import get_best_pdf
 
 
@@ -30,7 +31,7 @@ def download_tisk_pdf(
         logger.debug("Cached PDF: {}", dest)
         return dest
 
-    doc = get_best_pdf(period, ct)
+    doc = get_best_pdf(period, ct, cache_dir)
     if doc is None:
         logger.warning("No PDF found for tisk {}/{}", period, ct)
         return None
@@ -39,12 +40,7 @@ def download_tisk_pdf(
     logger.info("Downloading PDF tisk {}/{} (idd={}) ...", period, ct, doc.idd)
 
     try:
-        with httpx.Client(timeout=60, follow_redirects=True) as client:
-            with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(dest, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=65536):
-                        f.write(chunk)
+        download_to(url, dest, timeout=60)
     except httpx.HTTPError:
         logger.exception("Failed to download tisk {}/{}", period, ct)
         dest.unlink(missing_ok=True)
@@ -75,12 +71,7 @@ def download_subtisk_pdf(
     logger.info("Downloading sub-tisk PDF {}/{}/{} (idd={}) ...", period, ct, ct1, idd)
 
     try:
-        with httpx.Client(timeout=60, follow_redirects=True) as client:
-            with client.stream("GET", url) as response:
-                response.raise_for_status()
-                with open(dest, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=65536):
-                        f.write(chunk)
+        download_to(url, dest, timeout=60)
     except httpx.HTTPError:
         logger.exception("Failed to download sub-tisk {}/{}/{}", period, ct, ct1)
         dest.unlink(missing_ok=True)
@@ -95,23 +86,32 @@ def download_period_tisky(
     tisk_numbers: list[int],
     cache_dir: Path = DEFAULT_CACHE_DIR,
     force: bool = False,
+    workers: int = 4,
 ) -> dict[int, Path]:
     """Download PDFs for multiple tisky with rate limiting.
 
+    Downloads run on a thread pool so network latency overlaps; request
+    starts are still paced by the shared psp.cz host limiter.
+
     Returns a mapping of ct -> downloaded PDF path (skips failures).
     """
     results: dict[int, Path] = {}
     total = len(tisk_numbers)
+    limiter = host_limiter(PSP_HOST)
 
-    for i, ct in enumerate(tisk_numbers, 1):
-        logger.info("[{}/{}] Tisk {}", i, total, ct)
-        path = download_tisk_pdf(period, ct, cache_dir, force)
-        if path is not None:
-            results[ct] = path
-
+    def _download(ct: int) -> Path | None:
         # Rate limit — be polite to psp.cz
-        if i < total:
-            time.sleep(PSP_REQUEST_DELAY)
+        limiter.wait()
+        return download_tisk_pdf(period, ct, cache_dir, force)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tisk-pdf") as pool:
+        futures = {pool.submit(_download, ct): ct for ct in tisk_numbers}
+        for i, future in enumerate(as_completed(futures), 1):
+            ct = futures[future]
+            path = future.result()
+            logger.info("[{}/{}] Tisk {}", i, total, ct)
+            if path is not None:
+                results[ct] = path
 
     logger.info("Downloaded {}/{} tisk PDFs for period {}", len(results), total, period)
     return results
@@ -5,8 +5,13 @@ When PyMuPDF fails or returns empty text, we check if the file is actually
 HTML and parse it with BeautifulSoup as a fallback.
 """
 
+import io
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import TextIO
 
 import pymupdf
 from bs4 import BeautifulSoup
@@ -74,17 +79,37 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     When PyMuPDF fails or returns empty text (common for HTML files saved
     as .pdf by psp.cz), falls back to BeautifulSoup HTML parsing.
     """
+    buf = io.StringIO()
+    if _write_pdf_pages(pdf_path, buf):
+        return buf.getvalue()
+    return _html_fallback_text(pdf_path)
+
+
+def _write_pdf_pages(pdf_path: Path, out: TextIO) -> bool:
+    """Stream page texts into ``out`` separated by blank lines.
+
+    Pages are written as they are extracted, so the full text never has to
+    be held in memory. Returns False when PyMuPDF fails or every page is
+    blank — ``out`` may then hold partial output the caller must discard.
+    """
+    has_text = False
     try:
-        doc = pymupdf.open(pdf_path)
-        pages = [str(page.get_text()) for page in doc]
-        doc.close()
-        text = "\n\n".join(pages)
-        if text.strip():
-            return text
+        with pymupdf.open(pdf_path) as doc:
+            sep = ""
+            for page in doc:
+                text = str(page.get_text())
+                out.write(sep)
+                out.write(text)
+                sep = "\n\n"
+                if text and not text.isspace():
+                    has_text = True
     except Exception:
-        pass
+        return False
+    return has_text
 
-    # Fallback: check if file is actually HTML
+
+def _html_fallback_text(pdf_path: Path) -> str:
+    """Fallback for files PyMuPDF could not read: check if file is actually HTML."""
     html_text = _extract_text_from_html(pdf_path)
     if html_text:
         return html_text
@@ -109,12 +134,20 @@ def extract_and_cache(
         logger.debug("Cached text: {}", dest)
         return dest
 
-    text = extract_text_from_pdf(pdf_path)
-    if not text.strip():
-        logger.warning("Empty text extracted from {} (scanned PDF?)", pdf_path.name)
-        return None
+    # Stream pages straight to disk; only the HTML fallback builds the text in memory
+    tmp = dest.with_suffix(".txt.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        has_text = _write_pdf_pages(pdf_path, f)
+    if has_text:
+        tmp.replace(dest)
+    else:
+        tmp.unlink()
+        text = _html_fallback_text(pdf_path)
+        if not text.strip():
+            logger.warning("Empty text extracted from {} (scanned PDF?)", pdf_path.name)
+            return None
+        dest.write_text(text, encoding="utf-8")
 
-    dest.write_text(text, encoding="utf-8")
     logger.info("Extracted text for tisk {} ({:.1f} KB)", ct, dest.stat().st_size / 1e3)
     return dest
 
@@ -124,19 +157,41 @@ def extract_period_texts(
     pdf_paths: dict[int, Path],
     cache_dir: Path = DEFAULT_CACHE_DIR,
     force: bool = False,
+    workers: int | None = None,
 ) -> dict[int, Path]:
     """Extract text from all PDFs for a period.
 
+    Extraction is CPU-bound and PyMuPDF is not thread-safe, so PDFs are
+    spread over a process pool (``workers`` defaults to the CPU count).
+    Workers come from a fork server rather than forking the caller, which
+    may be a threaded web server holding locks.
+
     Returns mapping of ct -> text file path (skips failures).
     """
     results: dict[int, Path] = {}
     total = len(pdf_paths)
-
-    for i, (ct, pdf_path) in enumerate(sorted(pdf_paths.items()), 1):
-        logger.info("[{}/{}] Extracting text from tisk {}", i, total, ct)
-        path = extract_and_cache(pdf_path, period, ct, cache_dir, force)
-        if path is not None:
-            results[ct] = path
+    items = sorted(pdf_paths.items())
+    workers = min(workers or os.cpu_count() or 1, total)
+
+    if workers <= 1:
+        for i, (ct, pdf_path) in enumerate(items, 1):
+            logger.info("[{}/{}] Extracting text from tisk {}", i, total, ct)
+            path = extract_and_cache(pdf_path, period, ct, cache_dir, force)
+            if path is not None:
+                results[ct] = path
+    else:
+        ctx = multiprocessing.get_context("forkserver")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            futures = {
+                pool.submit(extract_and_cache, pdf_path, period, ct, cache_dir, force): ct
+                for ct, pdf_path in items
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                ct = futures[future]
+                logger.info("[{}/{}] Extracted text from tisk {}", i, total, ct)
+                path = future.result()
+                if path is not None:
+                    results[ct] = path
 
     logger.info("Extracted text for {}/{} tisky in period {}", len(results), total, period)
     return results
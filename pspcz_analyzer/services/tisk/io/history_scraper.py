@@ -11,15 +11,20 @@ items. Each item has span.mark (PS, O, 1, V, 2, G, 3, S, P, VL) and <p> content.
 
 import json
 import re
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+import polars as pl
 from loguru import logger
+from selectolax.parser import HTMLParser, Node
 
-from pspcz_analyzer.config import PSP_HISTORIE_URL_TEMPLATE
+from pspcz_analyzer.config import PSP_HISTORIE_URL_TEMPLATE, PSP_HOST
+from pspcz_analyzer.data.http_cache import fetch_text
+from pspcz_analyzer.data.http_client import get_client, host_limiter
 
 # Mark text -> (stage_type, label)
 _MARK_MAP: dict[str, tuple[str, str]] = {
@@ -41,13 +46,19 @@ _SESSION_RE = re.compile(r"(\d+)\.\s*sch[ůu]zi")
 _VOTE_RE = re.compile(r"hlasov[áa]n[ií]\s*[čc]\.\s*(\d+)")
 _LAW_NUMBER_RE = re.compile(r"(?:pod\s+)?[čc][ií]slem\s+(\d+/\d+\s*Sb\.)")
 _LAW_NUMBER_ALT_RE = re.compile(r"(\d+/\d+\s*Sb\.)")
+# Submitter fallback when the page has no Předkladatel section
+_PREDLOZIL_RE = re.compile(
+    r"([\w\s]+?)\s+předlož\w+\s+.*?(\d{1,2}\.\s*\d{1,2}\.\s*\d{4})",
+    re.IGNORECASE,
+)
 
 _OUTCOME_PATTERNS = [
     ("schválen", "schválen"),
     ("zamítnut", "zamítnut"),
     ("přikázán", "přikázán výborům"),
-    ("doporučuje schválit", "doporučuje schválit"),
+    # Before "doporučuje schválit", which is a substring of the negation
     ("nedoporučuje", "nedoporučuje schválit"),
+    ("doporučuje schválit", "doporučuje schválit"),
     ("podepsal", "podepsal"),
     ("vrátil", "vrátil"),
     ("přerušuje", "přerušeno"),
@@ -113,8 +124,10 @@ def _build_stage(mark_text: str, content_text: str) -> TiskHistoryStage | None:
 
     stage_type, label = mapping
     date = _extract_first_date(content_text)
-    session_m = _SESSION_RE.search(content_text)
-    vote_m = _VOTE_RE.search(content_text)
+    # Literal pre-checks are C-level substring scans — far cheaper than
+    # running the regexes over stage texts that can't match
+    session_m = _SESSION_RE.search(content_text) if "sch" in content_text else None
+    vote_m = _VOTE_RE.search(content_text) if "hlasov" in content_text else None
     outcome = _extract_outcome(content_text)
 
     return TiskHistoryStage(
@@ -128,23 +141,33 @@ def _build_stage(mark_text: str, content_text: str) -> TiskHistoryStage | None:
     )
 
 
-def _parse_document_log_items(items: list[Tag]) -> list[TiskHistoryStage]:
+def _text(node: Node) -> str:
+    """Whitespace-stripped text of a node, joining non-empty text nodes with spaces.
+
+    Matches BeautifulSoup's ``get_text(" ", strip=True)`` — selectolax's own
+    ``strip=True`` keeps empty strings for whitespace-only nodes, so a
+    unit-separator sentinel is used to drop them.
+    """
+    return " ".join(s for s in node.text(separator="\x1f", strip=True).split("\x1f") if s)
+
+
+def _parse_document_log_items(items: list[Node]) -> list[TiskHistoryStage]:
     """Parse document-log-item elements into legislative stages."""
     stages: list[TiskHistoryStage] = []
     for item in items:
         try:
-            mark = item.find("span", class_="mark")
+            mark = item.css_first("span.mark")
             if not mark:
                 continue
-            mark_text = mark.get_text(strip=True)
+            mark_text = _text(mark)
 
             # Get content from <p> tag, or from sub-list for V/G stages
-            p = item.find("p")
+            p = item.css_first("p")
             if p:
-                text = p.get_text(" ", strip=True)
+                text = _text(p)
             else:
                 # V and G stages may have nested <ul> instead of <p>
-                text = item.get_text(" ", strip=True)
+                text = _text(item)
 
             stage = _build_stage(mark_text, text)
             if stage:
@@ -156,20 +179,20 @@ def _parse_document_log_items(items: list[Tag]) -> list[TiskHistoryStage]:
     return stages
 
 
-def _parse_simple_section(content_div: Tag) -> TiskHistoryStage | None:
+def _parse_simple_section(content_div: Node) -> TiskHistoryStage | None:
     """Try to parse a section without document-log items (e.g. simple content)."""
-    mark = content_div.find("span", class_="mark")
+    mark = content_div.css_first("span.mark")
     if not mark:
         return None
-    mark_text = mark.get_text(strip=True)
-    text = content_div.get_text(" ", strip=True)
+    mark_text = _text(mark)
+    text = _text(content_div)
     try:
         return _build_stage(mark_text, text)
     except Exception:
         return None
 
 
-def _parse_stages(soup: BeautifulSoup) -> list[TiskHistoryStage]:
+def _parse_stages(tree: HTMLParser) -> list[TiskHistoryStage]:
     """Extract legislative stages from the page.
 
     The page structure is:
@@ -182,12 +205,12 @@ def _parse_stages(soup: BeautifulSoup) -> list[TiskHistoryStage]:
     """
     stages: list[TiskHistoryStage] = []
 
-    for section in soup.find_all("div", class_="section"):
-        content_div = section.find("div", class_="section-content")
+    for section in tree.css("div.section"):
+        content_div = section.css_first("div.section-content")
         if not content_div:
             continue
 
-        items = content_div.find_all("li", class_="document-log-item")
+        items = content_div.css("li.document-log-item")
         if items:
             stages.extend(_parse_document_log_items(items))
         else:
@@ -198,15 +221,22 @@ def _parse_stages(soup: BeautifulSoup) -> list[TiskHistoryStage]:
     return stages
 
 
-def _extract_submitter(soup: BeautifulSoup) -> tuple[str, str | None]:
-    """Extract who submitted the tisk and when."""
+_HEADING_TAGS = frozenset({"h2", "h3", "h4", "strong", "b"})
+
+
+def _extract_submitter(tree: HTMLParser, full_text: str) -> tuple[str, str | None]:
+    """Extract who submitted the tisk and when.
+
+    ``full_text`` is the page text, searched when there is no Předkladatel section.
+    """
     # Look specifically in the Předkladatel section
-    for section in soup.find_all("div", class_="section"):
-        heading = section.find(["h2", "h3", "h4", "strong", "b"])
-        if heading and "Předkladatel" in heading.get_text():
-            content = section.find("div", class_="section-content")
+    for section in tree.css("div.section"):
+        # css("*") yields descendants in document order (a selector group doesn't)
+        heading = next((n for n in section.css("*") if n.tag in _HEADING_TAGS), None)
+        if heading and "Předkladatel" in (heading.text() or ""):
+            content = section.css_first("div.section-content")
             if content:
-                text = content.get_text(" ", strip=True)
+                text = _text(content)
                 date = _extract_first_date(text)
                 # Extract submitter name — typically "Vláda" or a person name
                 submitter = (
@@ -215,38 +245,30 @@ def _extract_submitter(soup: BeautifulSoup) -> tuple[str, str | None]:
                 return submitter, date
 
     # Fallback: search full text
-    text = soup.get_text(" ", strip=True)
-    predlozil_re = re.compile(
-        r"([\w\s]+?)\s+předlož\w+\s+.*?(\d{1,2}\.\s*\d{1,2}\.\s*\d{4})",
-        re.IGNORECASE,
-    )
-    m = predlozil_re.search(text)
+    m = _PREDLOZIL_RE.search(full_text)
     if m:
         return m.group(1).strip(), _extract_first_date(m.group(2))
     return "", None
 
 
-def _extract_government_opinion(soup: BeautifulSoup) -> str | None:
-    """Look for government opinion (souhlas/nesouhlas/neutrální)."""
-    text = soup.get_text(" ", strip=True).lower()
-    if "souhlas" in text and "nesouhlas" not in text:
+def _extract_government_opinion(full_text_lower: str) -> str | None:
+    """Look for government opinion (souhlas/nesouhlas/neutrální) in lowercased page text."""
+    if "souhlas" in full_text_lower and "nesouhlas" not in full_text_lower:
         return "souhlas"
-    if "nesouhlas" in text:
+    if "nesouhlas" in full_text_lower:
         return "nesouhlas"
-    if "neutrální" in text:
+    if "neutrální" in full_text_lower:
         return "neutrální"
     return None
 
 
-def _determine_status(stages: list[TiskHistoryStage], full_text: str) -> str:
-    """Determine current overall status from stages and page text."""
-    lower = full_text.lower()
-
+def _determine_status(stages: list[TiskHistoryStage], full_text_lower: str) -> str:
+    """Determine current overall status from stages and lowercased page text."""
     if any(s.stage_type == "sbirka" for s in stages):
         return "vyhlášeno"
-    if "zamítnut" in lower:
+    if "zamítnut" in full_text_lower:
         return "zamítnuto"
-    if "stažen" in lower or "vzat zpět" in lower:
+    if "stažen" in full_text_lower or "vzat zpět" in full_text_lower:
         return "staženo"
 
     # Check what the last meaningful stage outcome was
@@ -305,6 +327,7 @@ def _resolve_amendment_tisk_idd(
     period: int,
     ct: int,
     ct1: int,
+    cache_dir: Path | None = None,
 ) -> int | None:
     """Resolve the idd for a known amendment sub-tisk CT1.
 
@@ -314,6 +337,7 @@ def _resolve_amendment_tisk_idd(
         period: Electoral period number.
         ct: Parent tisk number.
         ct1: Sub-tisk version number.
+        cache_dir: When given, pages are revalidated via the on-disk HTTP cache.
 
     Returns:
         The idd for PDF download, or None if not found.
@@ -321,7 +345,7 @@ def _resolve_amendment_tisk_idd(
     from pspcz_analyzer.services.tisk.io import scrape_all_subtisk_documents
 
     try:
-        versions = scrape_all_subtisk_documents(period, ct, max_ct1=ct1 + 1)
+        versions = scrape_all_subtisk_documents(period, ct, max_ct1=ct1 + 1, cache_dir=cache_dir)
         for v in versions:
             if v.ct1 == ct1 and v.idd is not None:
                 return v.idd
@@ -335,18 +359,22 @@ def _resolve_amendment_tisk_idd(
     return None
 
 
-def scrape_tisk_history(period: int, ct: int) -> TiskHistory | None:
-    """Scrape the legislative history page for a tisk.
+def _fetch_history(
+    client: httpx.Client,
+    period: int,
+    ct: int,
+    cache_dir: Path | None = None,
+) -> TiskHistory | None:
+    """Fetch and parse the history page for a tisk using the given client.
 
-    Returns TiskHistory with stages, or None if the page couldn't be fetched.
+    With ``cache_dir``, the page is revalidated against the on-disk HTTP
+    cache instead of always being downloaded in full.
     """
     url = PSP_HISTORIE_URL_TEMPLATE.format(period=period, ct=ct)
     logger.debug("Scraping tisk history: {}", url)
 
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
+        html = fetch_text(client, url, cache_dir)
     except Exception:
         logger.opt(exception=True).warning(
             "Failed to fetch history for tisk {}/{}",
@@ -355,19 +383,23 @@ def scrape_tisk_history(period: int, ct: int) -> TiskHistory | None:
         )
         return None
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    full_text = soup.get_text(" ", strip=True)
+    tree = HTMLParser(html)
+    # BeautifulSoup's get_text() skipped script/style contents; match that
+    tree.strip_tags(["script", "style"])
+    # Page text is needed by several extractors — walk the tree only once
+    full_text = _text(tree.root) if tree.root else ""
+    full_text_lower = full_text.lower()
 
-    stages = _parse_stages(soup)
-    submitter, submitter_date = _extract_submitter(soup)
-    gov_opinion = _extract_government_opinion(soup)
+    stages = _parse_stages(tree)
+    submitter, submitter_date = _extract_submitter(tree, full_text)
+    gov_opinion = _extract_government_opinion(full_text_lower)
     law_number = _extract_law_number(full_text)
-    status = _determine_status(stages, full_text)
+    status = _determine_status(stages, full_text_lower)
 
     # Extract amendment sub-tisk reference (e.g. "tisk 410/4")
     amendment_ct1, amendment_idd = _extract_amendment_tisk_reference(full_text)
     if amendment_ct1 is not None and amendment_idd is None:
-        amendment_idd = _resolve_amendment_tisk_idd(period, ct, amendment_ct1)
+        amendment_idd = _resolve_amendment_tisk_idd(period, ct, amendment_ct1, cache_dir)
 
     return TiskHistory(
         ct=ct,
@@ -384,9 +416,83 @@ def scrape_tisk_history(period: int, ct: int) -> TiskHistory | None:
     )
 
 
+def scrape_tisk_history(
+    period: int,
+    ct: int,
+    cache_dir: Path | None = None,
+) -> TiskHistory | None:
+    """Scrape the legislative history page for a tisk.
+
+    Returns TiskHistory with stages, or None if the page couldn't be fetched.
+    """
+    return _fetch_history(get_client(), period, ct, cache_dir)
+
+
+def scrape_tisk_histories(
+    period: int,
+    cts: list[int],
+    workers: int = 6,
+    on_result: Callable[[int, TiskHistory | None], None] | None = None,
+    cancel_check: Callable[[], None] | None = None,
+    cache_dir: Path | None = None,
+) -> dict[int, TiskHistory]:
+    """Scrape history pages for many tisky concurrently over the shared client.
+
+    Requests are dispatched to a thread pool so network latency overlaps,
+    while request starts are paced by the shared psp.cz host limiter to
+    remain polite.
+
+    Args:
+        period: Electoral period number.
+        cts: Tisk numbers to scrape.
+        workers: Number of concurrent fetches.
+        on_result: Called on the calling thread as each tisk finishes
+            (with None when the page couldn't be fetched).
+        cancel_check: Called between results; raising from it cancels
+            all fetches that haven't started yet.
+        cache_dir: When given, pages are revalidated via the on-disk HTTP cache.
+
+    Returns:
+        {ct: TiskHistory} for every successfully scraped tisk.
+    """
+    results: dict[int, TiskHistory] = {}
+    if not cts:
+        return results
+
+    limiter = host_limiter(PSP_HOST)
+
+    def _task(client: httpx.Client, ct: int) -> TiskHistory | None:
+        limiter.wait()
+        return _fetch_history(client, period, ct, cache_dir)
+
+    client = get_client()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tisk-history") as pool:
+        futures = {pool.submit(_task, client, ct): ct for ct in cts}
+        try:
+            for future in as_completed(futures):
+                if cancel_check:
+                    cancel_check()
+                ct = futures[future]
+                h = future.result()
+                if h:
+                    results[ct] = h
+                if on_result:
+                    on_result(ct, h)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return results
+
+
 def history_to_dict(h: TiskHistory) -> dict:
-    """Serialize TiskHistory to a JSON-compatible dict."""
-    return asdict(h)
+    """Serialize TiskHistory to a JSON-compatible dict.
+
+    Shallow: unlike ``dataclasses.asdict`` nothing is deep-copied, so the
+    ``law_changes`` dicts are shared with ``h``.
+    """
+    return {**vars(h), "stages": [vars(s).copy() for s in h.stages]}
 
 
 def history_from_dict(d: dict) -> TiskHistory:
@@ -426,3 +532,65 @@ def load_history_json(path: Path) -> TiskHistory | None:
     except Exception:
         logger.opt(exception=True).warning("Failed to load history from {}", path)
         return None
+
+
+# Scalar TiskHistory fields stored as parquet columns; stages and law
+# changes are nested and go into JSON string columns
+_HISTORY_SCHEMA: dict[str, pl.DataType] = {
+    "ct": pl.Int64(),
+    "period": pl.Int64(),
+    "submitter": pl.Utf8(),
+    "submitter_date": pl.Utf8(),
+    "government_opinion": pl.Utf8(),
+    "current_status": pl.Utf8(),
+    "law_number": pl.Utf8(),
+    "scraped_at": pl.Utf8(),
+    "amendment_tisk_ct1": pl.Int64(),
+    "amendment_tisk_idd": pl.Int64(),
+    "stages": pl.Utf8(),
+    "law_changes": pl.Utf8(),
+}
+
+
+def save_histories_parquet(histories: Iterable[TiskHistory], path: Path) -> None:
+    """Save many TiskHistory objects as one parquet file.
+
+    Written to a temp file and renamed, so concurrent readers never see a
+    partial snapshot.
+    """
+    columns: dict[str, list] = {name: [] for name in _HISTORY_SCHEMA}
+    for h in histories:
+        d = history_to_dict(h)
+        d["stages"] = json.dumps(d["stages"], ensure_ascii=False)
+        d["law_changes"] = json.dumps(d["law_changes"], ensure_ascii=False)
+        for name, values in columns.items():
+            values.append(d[name])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    pl.DataFrame(columns, schema=_HISTORY_SCHEMA).write_parquet(
+        tmp_path, compression="zstd", compression_level=3
+    )
+    tmp_path.replace(path)
+
+
+def load_histories_parquet(path: Path) -> dict[int, TiskHistory]:
+    """Load a parquet snapshot written by ``save_histories_parquet``.
+
+    Returns {ct: TiskHistory}, or an empty dict if the file is missing or unreadable.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        rows = pl.read_parquet(path).to_dicts()
+    except Exception:
+        logger.opt(exception=True).warning("Failed to load histories from {}", path)
+        return {}
+    histories: dict[int, TiskHistory] = {}
+    for row in rows:
+        row["stages"] = json.loads(row["stages"])
+        row["law_changes"] = json.loads(row["law_changes"])
+        histories[row["ct"]] = history_from_dict(row)
+    return histories
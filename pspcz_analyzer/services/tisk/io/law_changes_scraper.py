@@ -7,12 +7,11 @@ Parses:
 
 import json
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 
-import httpx
-from bs4 import BeautifulSoup, Tag
 from loguru import logger
+from selectolax.parser import HTMLParser, Node
 
 from pspcz_analyzer.config import (
     PSP_LAW_CHANGES_URL_TEMPLATE,
@@ -21,14 +20,18 @@ from pspcz_analyzer.config import (
     TISKY_META_DIR,
     TISKY_RELATED_BILLS_DIR,
 )
+from pspcz_analyzer.data.http_cache import fetch_text
+from pspcz_analyzer.data.http_client import get_client
 
 # Regex to extract idsb parameter from tisky.sqw links
 _IDSB_RE = re.compile(r"idsb=(\d+)", re.IGNORECASE)
 # Regex to extract period and ct from historie.sqw links
 _HISTORIE_LINK_RE = re.compile(r"historie\.sqw\?o=(\d+)&t=(\d+)", re.IGNORECASE)
+# Header words that mark a law changes table
+_LAW_HEADER_RE = re.compile(r"předpis|citace|zákon", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposedLawChange:
     """A single proposed change to an existing law."""
 
@@ -39,7 +42,7 @@ class ProposedLawChange:
     idsb: int | None = None  # link to related bills page
 
 
-@dataclass
+@dataclass(slots=True)
 class RelatedBill:
     """A bill found via the related-bills page (tisky.sqw?idsb=...)."""
 
@@ -52,24 +55,36 @@ class RelatedBill:
     url: str = ""  # full URL to the bill's history page
 
 
-def _parse_law_changes_table(table: Tag) -> list[ProposedLawChange]:
+def _find_link(row: Node, href_re: re.Pattern[str]) -> tuple[str, re.Match[str]] | None:
+    """First link in any of the row's cells whose href matches, as (href, match).
+
+    One selector query covers the whole row instead of one per cell.
+    """
+    for link in row.css("td a[href]"):
+        href = link.attributes.get("href") or ""
+        m = href_re.search(href)
+        if m:
+            return href, m
+    return None
+
+
+def _parse_law_changes_table(table: Node) -> list[ProposedLawChange]:
     """Parse a single table for law change rows."""
     changes: list[ProposedLawChange] = []
-    rows = table.find_all("tr")
+    rows = table.css("tr")
     if len(rows) < 2:
         return changes
 
-    header = rows[0].get_text(strip=True).lower()
-    if "předpis" not in header and "citace" not in header and "zákon" not in header:
+    if not _LAW_HEADER_RE.search(rows[0].text(strip=True)):
         return changes
 
     for row in rows[1:]:
-        cells = row.find_all("td")
+        cells = row.css("td")
         if len(cells) < 2:
             continue
 
         change = ProposedLawChange()
-        texts = [c.get_text(strip=True) for c in cells]
+        texts = [c.text(strip=True) for c in cells]
         if len(texts) >= 1:
             change.citace = texts[0]
         if len(texts) >= 2:
@@ -78,13 +93,9 @@ def _parse_law_changes_table(table: Tag) -> list[ProposedLawChange]:
             change.predpis = texts[2]
 
         # Look for idsb link in any cell
-        for cell in cells:
-            link = cell.find("a", href=_IDSB_RE)
-            if link:
-                m = _IDSB_RE.search(str(link["href"]))
-                if m:
-                    change.idsb = int(m.group(1))
-                break
+        found = _find_link(row, _IDSB_RE)
+        if found:
+            change.idsb = int(found[1].group(1))
 
         if not change.citace and not change.predpis:
             continue
@@ -94,14 +105,14 @@ def _parse_law_changes_table(table: Tag) -> list[ProposedLawChange]:
     return changes
 
 
-def _fallback_extract_law_changes(soup: BeautifulSoup) -> list[ProposedLawChange]:
+def _fallback_extract_law_changes(tree: HTMLParser) -> list[ProposedLawChange]:
     """Fallback: extract law changes from any links with idsb parameter."""
     changes: list[ProposedLawChange] = []
-    for link in soup.find_all("a", href=_IDSB_RE):
-        m = _IDSB_RE.search(str(link["href"]))
+    for link in tree.css("a[href]"):
+        m = _IDSB_RE.search(link.attributes.get("href") or "")
         if m:
-            text = link.get_text(strip=True)
-            parent_text = link.parent.get_text(strip=True) if link.parent else text
+            text = link.text(strip=True)
+            parent_text = link.parent.text(strip=True) if link.parent else text
             changes.append(
                 ProposedLawChange(
                     citace=text or parent_text,
@@ -114,18 +125,18 @@ def _fallback_extract_law_changes(soup: BeautifulSoup) -> list[ProposedLawChange
 def scrape_proposed_law_changes(
     period: int,
     ct: int,
+    cache_dir: Path | None = None,
 ) -> list[ProposedLawChange]:
     """Parse the law changes table at ``historie.sqw?snzp=1``.
 
+    With ``cache_dir``, the page is revalidated against the on-disk HTTP cache.
     Returns list of ProposedLawChange or empty list on failure.
     """
     url = PSP_LAW_CHANGES_URL_TEMPLATE.format(period=period, ct=ct)
     logger.debug("Scraping law changes: {}", url)
 
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
+        html = fetch_text(get_client(), url, cache_dir)
     except Exception:
         logger.opt(exception=True).warning(
             "Failed to fetch law changes for tisk {}/{}",
@@ -134,33 +145,33 @@ def scrape_proposed_law_changes(
         )
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = HTMLParser(html)
     changes: list[ProposedLawChange] = []
 
-    for table in soup.find_all("table"):
+    for table in tree.css("table"):
         changes.extend(_parse_law_changes_table(table))
 
     if not changes:
-        changes = _fallback_extract_law_changes(soup)
+        changes = _fallback_extract_law_changes(tree)
 
     logger.debug("Tisk {}/{}: found {} law changes", period, ct, len(changes))
     return changes
 
 
-def _parse_related_bills_table(table: Tag) -> list[RelatedBill]:
+def _parse_related_bills_table(table: Node) -> list[RelatedBill]:
     """Parse a single table for related bill rows."""
     bills: list[RelatedBill] = []
-    rows = table.find_all("tr")
+    rows = table.css("tr")
     if len(rows) < 2:
         return bills
 
     for row in rows[1:]:
-        cells = row.find_all("td")
+        cells = row.css("td")
         if not cells:
             continue
 
         bill = RelatedBill()
-        texts = [c.get_text(strip=True) for c in cells]
+        texts = [c.text(strip=True) for c in cells]
 
         if len(texts) >= 1:
             bill.cislo = texts[0]
@@ -172,15 +183,12 @@ def _parse_related_bills_table(table: Tag) -> list[RelatedBill]:
             bill.stav = texts[3]
 
         # Extract period and ct from any historie.sqw link in the row
-        for cell in cells:
-            link = cell.find("a", href=_HISTORIE_LINK_RE)
-            if link:
-                m = _HISTORIE_LINK_RE.search(str(link["href"]))
-                if m:
-                    bill.period = int(m.group(1))
-                    bill.ct = int(m.group(2))
-                    bill.url = f"https://www.psp.cz/sqw/{str(link['href'])}"
-                break
+        found = _find_link(row, _HISTORIE_LINK_RE)
+        if found:
+            href, m = found
+            bill.period = int(m.group(1))
+            bill.ct = int(m.group(2))
+            bill.url = f"https://www.psp.cz/sqw/{href}"
 
         if not bill.cislo and not bill.kratky_nazev:
             continue
@@ -190,18 +198,17 @@ def _parse_related_bills_table(table: Tag) -> list[RelatedBill]:
     return bills
 
 
-def scrape_related_bills(idsb: int) -> list[RelatedBill]:
+def scrape_related_bills(idsb: int, cache_dir: Path | None = None) -> list[RelatedBill]:
     """Parse the related bills table at ``tisky.sqw?idsb={id}``.
 
+    With ``cache_dir``, the page is revalidated against the on-disk HTTP cache.
     Returns list of RelatedBill or empty list on failure.
     """
     url = PSP_RELATED_BILLS_URL_TEMPLATE.format(idsb=idsb)
     logger.debug("Scraping related bills: {}", url)
 
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
+        html = fetch_text(get_client(), url, cache_dir)
     except Exception:
         logger.opt(exception=True).warning(
             "Failed to fetch related bills for idsb={}",
@@ -209,10 +216,10 @@ def scrape_related_bills(idsb: int) -> list[RelatedBill]:
         )
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = HTMLParser(html)
     bills: list[RelatedBill] = []
 
-    for table in soup.find_all("table"):
+    for table in tree.css("table"):
         bills.extend(_parse_related_bills_table(table))
 
     logger.debug("idsb={}: found {} related bills", idsb, len(bills))
@@ -222,6 +229,17 @@ def scrape_related_bills(idsb: int) -> list[RelatedBill]:
 # --- JSON caching ---
 
 
+def _row_dict(row: ProposedLawChange | RelatedBill) -> dict:
+    """Shallow field dict — the rows hold only scalars, no ``asdict`` deep copy needed."""
+    return {name: getattr(row, name) for name in row.__slots__}
+
+
+def _write_json(dest: Path, rows: list[ProposedLawChange] | list[RelatedBill]) -> None:
+    """Write cache rows as compact UTF-8 JSON (no indent — these are never hand-edited)."""
+    text = json.dumps(rows, ensure_ascii=False, separators=(",", ":"), default=_row_dict)
+    dest.write_bytes(text.encode("utf-8"))
+
+
 def save_law_changes_json(
     changes: list[ProposedLawChange],
     period: int,
@@ -232,8 +250,7 @@ def save_law_changes_json(
     dest_dir = cache_dir / TISKY_META_DIR / str(period) / TISKY_LAW_CHANGES_DIR
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / f"{ct}.json"
-    data = [asdict(c) for c in changes]
-    dest.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(dest, changes)
     return dest
 
 
@@ -244,11 +261,11 @@ def load_law_changes_json(
 ) -> list[ProposedLawChange] | None:
     """Load cached law changes. Returns None if not cached."""
     path = cache_dir / TISKY_META_DIR / str(period) / TISKY_LAW_CHANGES_DIR / f"{ct}.json"
-    if not path.exists():
-        return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
         return [ProposedLawChange(**d) for d in data]
+    except FileNotFoundError:
+        return None
     except Exception:
         logger.opt(exception=True).warning("Failed to load law changes from {}", path)
         return None
@@ -263,8 +280,7 @@ def save_related_bills_json(
     dest_dir = cache_dir / TISKY_META_DIR / TISKY_RELATED_BILLS_DIR
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / f"{idsb}.json"
-    data = [asdict(b) for b in bills]
-    dest.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(dest, bills)
     return dest
 
 
@@ -274,11 +290,11 @@ def load_related_bills_json(
 ) -> list[RelatedBill] | None:
     """Load cached related bills. Returns None if not cached."""
     path = cache_dir / TISKY_META_DIR / TISKY_RELATED_BILLS_DIR / f"{idsb}.json"
-    if not path.exists():
-        return None
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
         return [RelatedBill(**d) for d in data]
+    except FileNotFoundError:
+        return None
     except Exception:
         logger.opt(exception=True).warning("Failed to load related bills from {}", path)
         return None
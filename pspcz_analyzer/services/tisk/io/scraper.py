@@ -1,19 +1,23 @@
 """Scrape psp.cz for PDF document links associated with parliamentary prints (tisky)."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 
-import httpx
-from bs4 import BeautifulSoup
 from loguru import logger
+from selectolax.parser import HTMLParser
 
 from pspcz_analyzer.config import (
+    PSP_HOST,
     PSP_SUBTISKT_URL_TEMPLATE,
     PSP_TISKT_URL_TEMPLATE,
 )
+from pspcz_analyzer.data.http_cache import fetch_page, fetch_text
+from pspcz_analyzer.data.http_client import get_client, host_limiter
 
 
-@dataclass
+@dataclass(slots=True)
 class TiskDocument:
     """A single document (PDF) associated with a parliamentary print."""
 
@@ -23,34 +27,22 @@ class TiskDocument:
     is_complete: bool  # True if this is the full print ("Celý sněmovní tisk")
 
 
+_IDD_MARKER = "orig2.sqw?idd="
 _IDD_RE = re.compile(r"orig2\.sqw\?idd=(\d+)")
 
 
-def scrape_tisk_documents(period: int, ct: int) -> list[TiskDocument]:
-    """Scrape the document listing page for a given tisk and return all PDF links.
-
-    Fetches ``tiskt.sqw?o={period}&ct={ct}&ct1=0`` and extracts ``orig2.sqw?idd=``
-    links along with their descriptions.
-    """
-    url = PSP_TISKT_URL_TEMPLATE.format(period=period, ct=ct)
-    logger.debug("Scraping tisk documents: {}", url)
-
-    with httpx.Client(timeout=30, follow_redirects=True) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _parse_documents(tree: HTMLParser) -> list[TiskDocument]:
+    """Collect ``orig2.sqw?idd=`` document links from a parsed tisk page."""
     documents: list[TiskDocument] = []
-
-    for link in soup.find_all("a", href=_IDD_RE):
-        href = str(link["href"])
+    for link in tree.css(f'a[href*="{_IDD_MARKER}"]'):
+        href = link.attributes.get("href") or ""
         match = _IDD_RE.search(href)
         if not match:
             continue
 
         idd = int(match.group(1))
-        desc = link.get_text(strip=True)
-        parent_text = link.parent.get_text(strip=True) if link.parent else desc
+        desc = link.text(strip=True)
+        parent_text = link.parent.text(strip=True) if link.parent else desc
 
         # Detect format from context — psp.cz labels PDFs
         fmt = "PDF" if "PDF" in parent_text.upper() or href.endswith(".pdf") else "unknown"
@@ -64,14 +56,33 @@ def scrape_tisk_documents(period: int, ct: int) -> list[TiskDocument]:
                 is_complete=is_complete,
             )
         )
+    return documents
+
 
+def scrape_tisk_documents(
+    period: int,
+    ct: int,
+    cache_dir: Path | None = None,
+) -> list[TiskDocument]:
+    """Scrape the document listing page for a given tisk and return all PDF links.
+
+    Fetches ``tiskt.sqw?o={period}&ct={ct}&ct1=0`` and extracts ``orig2.sqw?idd=``
+    links along with their descriptions. With ``cache_dir``, the page is
+    revalidated against the on-disk HTTP cache.
+    """
+    url = PSP_TISKT_URL_TEMPLATE.format(period=period, ct=ct)
+    logger.debug("Scraping tisk documents: {}", url)
+
+    html = fetch_text(get_client(), url, cache_dir)
+    # Pages without any document link need no DOM at all
+    documents = _parse_documents(HTMLParser(html)) if _IDD_MARKER in html else []
     logger.debug("Tisk {}/{}: found {} documents", period, ct, len(documents))
     return documents
 
 
-def get_best_pdf(period: int, ct: int) -> TiskDocument | None:
+def get_best_pdf(period: int, ct: int, cache_dir: Path | None = None) -> TiskDocument | None:
     """Return the best PDF document for a tisk — prefer complete prints."""
-    docs = scrape_tisk_documents(period, ct)
+    docs = scrape_tisk_documents(period, ct, cache_dir)
     if not docs:
         return None
 
@@ -80,7 +91,7 @@ def get_best_pdf(period: int, ct: int) -> TiskDocument | None:
     return complete[0] if complete else docs[0]
 
 
-@dataclass
+@dataclass(slots=True)
 class SubTiskVersion:
     """A sub-tisk version (CT1=0 original, CT1=1 gov opinion, CT1=2+ amendments)."""
 
@@ -94,18 +105,24 @@ class SubTiskVersion:
     llm_diff_summary: str = ""
 
 
-def _scrape_subtisk_page(period: int, ct: int, ct1: int) -> list[TiskDocument] | None:
+def _scrape_subtisk_page(
+    period: int,
+    ct: int,
+    ct1: int,
+    cache_dir: Path | None = None,
+) -> list[TiskDocument] | None:
     """Scrape a single sub-tisk page. Returns documents or None if page doesn't exist."""
     url = PSP_SUBTISKT_URL_TEMPLATE.format(period=period, ct=ct, ct1=ct1)
     logger.debug("Scraping sub-tisk page: {}", url)
 
+    # Probes run concurrently and their callers may already be parallel, so
+    # each one takes its own slot from the shared psp.cz budget
+    host_limiter(PSP_HOST).wait()
     try:
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            return None
+        # Probing past the last version is the normal way this loop ends, so
+        # missing pages are status checks, not HTTPStatusError round trips
+        page = fetch_page(get_client(), url, cache_dir, raise_for_status=False)
+    except Exception:
         logger.opt(exception=True).warning(
             "Failed to fetch sub-tisk {}/{}/{}",
             period,
@@ -113,53 +130,69 @@ def _scrape_subtisk_page(period: int, ct: int, ct1: int) -> list[TiskDocument] |
             ct1,
         )
         return None
-    except Exception:
-        logger.opt(exception=True).warning(
-            "Failed to fetch sub-tisk {}/{}/{}",
+
+    if page.status_code == 404:
+        return None
+    if page.status_code >= 400:
+        logger.warning(
+            "Failed to fetch sub-tisk {}/{}/{}: HTTP {}",
             period,
             ct,
             ct1,
+            page.status_code,
         )
         return None
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    tree = HTMLParser(page.text)
+    tree.strip_tags(["script", "style"])
 
     # Check for empty/error page — psp.cz returns 200 with minimal content
-    body_text = soup.get_text(strip=True)
+    body_text = tree.root.text(strip=True) if tree.root else ""
     if len(body_text) < 50 or "nebyl nalezen" in body_text.lower():
         return None
 
-    documents: list[TiskDocument] = []
-    for link in soup.find_all("a", href=_IDD_RE):
-        href = str(link["href"])
-        match = _IDD_RE.search(href)
-        if not match:
-            continue
-        idd = int(match.group(1))
-        desc = link.get_text(strip=True)
-        parent_text = link.parent.get_text(strip=True) if link.parent else desc
-        fmt = "PDF" if "PDF" in parent_text.upper() or href.endswith(".pdf") else "unknown"
-        is_complete = "cel" in desc.lower() or "úplné znění" in desc.lower()
-        documents.append(
-            TiskDocument(idd=idd, description=desc, format=fmt, is_complete=is_complete)
-        )
+    return _parse_documents(tree)
 
-    return documents
+
+# Sub-tisk pages probed concurrently per round. Most tisky have only a few
+# versions, so small rounds overlap latency without wasting many requests
+# past the last version.
+_SUBTISK_PROBE_BATCH = 4
+
+
+def _probe_subtisk_pages(
+    period: int,
+    ct: int,
+    max_ct1: int,
+    cache_dir: Path | None,
+) -> list[list[TiskDocument] | None]:
+    """Fetch sub-tisk pages CT1=0.. in concurrent rounds, up to the first missing one."""
+    pages: list[list[TiskDocument] | None] = []
+    with ThreadPoolExecutor(max_workers=_SUBTISK_PROBE_BATCH, thread_name_prefix="subtisk") as pool:
+        for start in range(0, max_ct1 + 1, _SUBTISK_PROBE_BATCH):
+            batch = range(start, min(start + _SUBTISK_PROBE_BATCH, max_ct1 + 1))
+            pages.extend(
+                pool.map(lambda ct1: _scrape_subtisk_page(period, ct, ct1, cache_dir), batch)
+            )
+            if any(docs is None for docs in pages):
+                break
+    return pages
 
 
 def scrape_all_subtisk_documents(
     period: int,
     ct: int,
     max_ct1: int = 20,
+    cache_dir: Path | None = None,
 ) -> list[SubTiskVersion]:
     """Iterate CT1=0..N for a tisk, collecting sub-tisk versions.
 
-    Stops when a page returns 404/empty. Returns list of SubTiskVersion.
+    Stops when a page returns 404/empty. With ``cache_dir``, pages are
+    revalidated against the on-disk HTTP cache. Returns list of SubTiskVersion.
     """
     versions: list[SubTiskVersion] = []
 
-    for ct1 in range(max_ct1 + 1):
-        docs = _scrape_subtisk_page(period, ct, ct1)
+    for ct1, docs in enumerate(_probe_subtisk_pages(period, ct, max_ct1, cache_dir)):
         if docs is None and ct1 > 0:
             # CT1=0 might legitimately have no PDFs, but once we hit empty
             # for ct1 > 0, we're past the last version
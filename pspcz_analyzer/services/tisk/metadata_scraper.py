@@ -1,29 +1,53 @@
 """Scrape legislative history and law changes from psp.cz."""
 
-import time
 from collections.abc import Callable
-from dataclasses import asdict
 from pathlib import Path
 
 from loguru import logger
 
 from pspcz_analyzer.config import (
-    PSP_REQUEST_DELAY,
+    PSP_HOST,
     TISKY_HISTORIE_DIR,
+    TISKY_HISTORIES_PARQUET,
     TISKY_LAW_CHANGES_DIR,
     TISKY_META_DIR,
 )
+from pspcz_analyzer.data.http_client import host_limiter
 from pspcz_analyzer.services.tisk.io import (
+    ProposedLawChange,
     TiskHistory,
+    load_histories_parquet,
     load_history_json,
     load_law_changes_json,
+    save_histories_parquet,
     save_history_json,
     save_law_changes_json,
     scrape_proposed_law_changes,
-    scrape_tisk_history,
+    scrape_tisk_histories,
 )
 
 
+def _update_history_snapshot(
+    hist_dir: Path, snapshot_path: Path, histories: dict[int, TiskHistory]
+) -> None:
+    """Merge histories into the period's parquet snapshot.
+
+    Per-tisk JSON files stay the incremental store; the snapshot lets loaders
+    read a whole period with one file read. Without an existing snapshot it
+    is rebuilt from every JSON file in ``hist_dir``.
+    """
+    if snapshot_path.exists():
+        merged = load_histories_parquet(snapshot_path)
+    else:
+        merged = {}
+        for json_path in hist_dir.glob("*.json"):
+            h = load_history_json(json_path)
+            if h:
+                merged[h.ct] = h
+    merged.update(histories)
+    save_histories_parquet(merged.values(), snapshot_path)
+
+
 def scrape_histories_sync(
     period: int,
     ct_numbers: list[int],
@@ -33,7 +57,9 @@ def scrape_histories_sync(
 ) -> dict:
     """Scrape legislative history pages for all tisky in a period.
 
-    Caches results as JSON files. Skips already-cached tisky.
+    Caches results as JSON files plus a per-period parquet snapshot. Skips
+    already-cached tisky; the rest are fetched concurrently via
+    ``scrape_tisk_histories``.
     Returns {ct: TiskHistory} dict.
     """
     hist_dir = cache_dir / TISKY_META_DIR / str(period) / TISKY_HISTORIE_DIR
@@ -41,48 +67,68 @@ def scrape_histories_sync(
 
     histories: dict[int, TiskHistory] = {}
     total = len(ct_numbers)
+    done = 0
     scraped = 0
+    to_scrape: list[int] = []
+    # Cached histories that predate amendment sub-tisk scraping — re-scraped,
+    # but only replaced if the fresh page yields an amendment reference
+    stale: set[int] = set()
 
-    for i, ct in enumerate(ct_numbers, 1):
+    for ct in ct_numbers:
         if cancel_check:
             cancel_check()
         json_path = hist_dir / f"{ct}.json"
-
-        # Load from cache if available
-        if json_path.exists():
-            h = load_history_json(json_path)
-            if h:
-                # Re-scrape if history predates amendment sub-tisk scraping
-                if h.amendment_tisk_ct1 is None and h.stages:
-                    h_fresh = scrape_tisk_history(period, ct)
-                    if h_fresh and h_fresh.amendment_tisk_ct1 is not None:
-                        save_history_json(h_fresh, json_path)
-                        h = h_fresh
-                        scraped += 1
-                        time.sleep(PSP_REQUEST_DELAY)
-                histories[ct] = h
-            if progress_callback:
-                progress_callback(i, total)
+        if not json_path.exists():
+            to_scrape.append(ct)
             continue
 
-        # Scrape from psp.cz
-        if i % 50 == 0 or i == 1:
+        h = load_history_json(json_path)
+        if h:
+            histories[ct] = h
+            if h.amendment_tisk_ct1 is None and h.stages:
+                stale.add(ct)
+                to_scrape.append(ct)
+                continue
+        done += 1
+        if progress_callback:
+            progress_callback(done, total)
+
+    if to_scrape:
+        logger.info(
+            "[tisk pipeline] Scraping history for period {}: {} tisky ({} cached)",
+            period,
+            len(to_scrape),
+            done,
+        )
+
+    def _on_result(ct: int, h: TiskHistory | None) -> None:
+        nonlocal done, scraped
+        if h and (ct not in stale or h.amendment_tisk_ct1 is not None):
+            save_history_json(h, hist_dir / f"{ct}.json")
+            histories[ct] = h
+            scraped += 1
+        done += 1
+        if done % 50 == 0:
             logger.info(
                 "[tisk pipeline] Scraping history for period {}: {}/{}",
                 period,
-                i,
+                done,
                 total,
             )
+        if progress_callback:
+            progress_callback(done, total)
 
-        h = scrape_tisk_history(period, ct)
-        if h:
-            save_history_json(h, json_path)
-            histories[ct] = h
-            scraped += 1
+    scrape_tisk_histories(
+        period,
+        to_scrape,
+        on_result=_on_result,
+        cancel_check=cancel_check,
+        cache_dir=cache_dir,
+    )
 
-        time.sleep(PSP_REQUEST_DELAY)
-        if progress_callback:
-            progress_callback(i, total)
+    snapshot_path = hist_dir.parent / TISKY_HISTORIES_PARQUET
+    if scraped or not snapshot_path.exists():
+        _update_history_snapshot(hist_dir, snapshot_path, histories)
 
     logger.info(
         "[tisk pipeline] History scraping for period {}: {} cached, {} new, {} total",
@@ -100,15 +146,15 @@ def scrape_law_changes_sync(
     cache_dir: Path,
     cancel_check: Callable[[], None] | None = None,
     progress_callback: Callable[[int, int], None] | None = None,
-) -> dict[int, list[dict]]:
+) -> dict[int, list[ProposedLawChange]]:
     """Scrape law change pages (snzp=1) for all tisky in a period.
 
-    Caches results as JSON. Returns {ct: [law_change_dicts]}.
+    Caches results as JSON. Returns {ct: [ProposedLawChange]} for tisky with changes.
     """
     law_changes_dir = cache_dir / TISKY_META_DIR / str(period) / TISKY_LAW_CHANGES_DIR
     law_changes_dir.mkdir(parents=True, exist_ok=True)
 
-    result: dict[int, list[dict]] = {}
+    result: dict[int, list[ProposedLawChange]] = {}
     total = len(ct_numbers)
     scraped = 0
 
@@ -118,7 +164,7 @@ def scrape_law_changes_sync(
         # Load from cache
         cached = load_law_changes_json(period, ct, cache_dir)
         if cached is not None:
-            result[ct] = [asdict(c) for c in cached]
+            result[ct] = cached
             if progress_callback:
                 progress_callback(i, total)
             continue
@@ -131,13 +177,13 @@ def scrape_law_changes_sync(
                 total,
             )
 
-        changes = scrape_proposed_law_changes(period, ct)
+        host_limiter(PSP_HOST).wait()
+        changes = scrape_proposed_law_changes(period, ct, cache_dir)
         save_law_changes_json(changes, period, ct, cache_dir)
         if changes:
-            result[ct] = [asdict(c) for c in changes]
+            result[ct] = changes
         scraped += 1
 
-        time.sleep(PSP_REQUEST_DELAY)
         if progress_callback:
             progress_callback(i, total)
 
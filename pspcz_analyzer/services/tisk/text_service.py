@@ -1,6 +1,7 @@
 """Service for querying cached tisk text files."""
 
 from pathlib import Path
+from typing import TextIO
 
 from pspcz_analyzer.config import DEFAULT_CACHE_DIR, TISKY_TEXT_DIR
 
@@ -16,10 +17,29 @@ class TiskTextService:
 
     def get_text(self, period: int, ct: int) -> str | None:
         """Read cached text for a tisk, or None if not available."""
-        path = self._text_dir(period) / f"{ct}.txt"
-        if not path.exists():
+        return self._read(self._text_dir(period) / f"{ct}.txt")
+
+    def get_subtisk_text(self, period: int, ct: int, ct1: int) -> str | None:
+        """Read cached text for a sub-tisk version ({ct}_{ct1}.txt), or None."""
+        return self._read(self._text_dir(period) / f"{ct}_{ct1}.txt")
+
+    def open_text(self, period: int, ct: int, ct1: int | None = None) -> TextIO | None:
+        """Open cached (sub-)tisk text for incremental reading, or None if not available.
+
+        The caller owns the returned file and must close it.
+        """
+        name = f"{ct}.txt" if ct1 is None else f"{ct}_{ct1}.txt"
+        try:
+            return (self._text_dir(period) / name).open(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _read(path: Path) -> str | None:
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             return None
-        return path.read_text(encoding="utf-8")
 
     def has_text(self, period: int, ct: int) -> bool:
         """Check whether extracted text exists for a tisk."""
@@ -1,7 +1,6 @@
 """Sub-tisk version downloading and LLM diff analysis."""
 
 import json
-import time
 from collections.abc import Callable
 from dataclasses import asdict
 from pathlib import Path
@@ -10,12 +9,13 @@ import pymupdf
 from loguru import logger
 
 from pspcz_analyzer.config import (
-    PSP_REQUEST_DELAY,
+    PSP_HOST,
     TISKY_META_DIR,
     TISKY_TEXT_DIR,
     TISKY_VERSION_DIFFS_DIR,
     VERSION_DIFF_MAX_PAIRS,
 )
+from pspcz_analyzer.data.http_client import host_limiter
 from pspcz_analyzer.services.llm import LLMClient, create_llm_client
 from pspcz_analyzer.services.tisk.io import (
     SubTiskVersion,
@@ -72,14 +72,13 @@ def download_subtisk_versions_sync(
                 total,
             )
 
-        # Scrape sub-tisk pages to find versions
-        versions_data = scrape_all_subtisk_documents(period, ct)
+        # Scrape sub-tisk pages to find versions (each probe is paced itself)
+        versions_data = scrape_all_subtisk_documents(period, ct, cache_dir=cache_dir)
         scraped += 1
 
         if len(versions_data) <= 1:
             # Only CT1=0 or nothing — save empty list to cache so we don't re-scrape
             scan_cache.write_text("[]", encoding="utf-8")
-            time.sleep(PSP_REQUEST_DELAY)
             if progress_callback:
                 progress_callback(i, total)
             continue
@@ -89,8 +88,8 @@ def download_subtisk_versions_sync(
 
         for v in versions_data:
             if v.idd and v.ct1 > 0:  # CT1=0 is already downloaded by main pipeline
+                host_limiter(PSP_HOST).wait()
                 pdf = download_subtisk_pdf(period, ct, v.ct1, v.idd, cache_dir)
-                time.sleep(PSP_REQUEST_DELAY)
 
                 # Extract text if PDF downloaded
                 if pdf:
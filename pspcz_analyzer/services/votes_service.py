@@ -91,40 +91,26 @@ def _apply_vote_filters(
     outcome_filter: str,
     topic_filter: str,
 ) -> pl.DataFrame:
-    """Apply text search, outcome, and topic filters to the votes DataFrame."""
-    # Fill nulls in description columns for display and searching
-    votes = votes.with_columns(
-        pl.col("nazev_dlouhy").fill_null("").alias("nazev_dlouhy"),
-        pl.col("nazev_kratky").fill_null("").alias("nazev_kratky"),
-    )
+    """Apply text search, outcome, and topic filters to the votes DataFrame.
 
+    Expects ``PeriodData.browsable_votes`` (filled titles, ``search_text``,
+    newest first) and keeps that order.
+    """
     if search.strip():
         q = normalize_czech(search.strip())
-        votes = votes.filter(
-            pl.col("nazev_dlouhy").map_elements(
-                lambda s: q in normalize_czech(s or ""),
-                return_dtype=pl.Boolean,
-            )
-            | pl.col("nazev_kratky").map_elements(
-                lambda s: q in normalize_czech(s or ""),
-                return_dtype=pl.Boolean,
-            )
-        )
+        votes = votes.filter(pl.col("search_text").str.contains(q, literal=True))
 
     if outcome_filter:
         votes = votes.filter(pl.col("vysledek") == outcome_filter)
 
     # Topic filter: only keep votes whose linked tisk has the specified topic
     if topic_filter:
-        allowed_keys = set()
-        for (schuze, bod), tisk in data.tisk_lookup.items():
-            if topic_filter in tisk.topics:
-                allowed_keys.add((schuze, bod))
-        if allowed_keys:
-            allowed_schuze = [k[0] for k in allowed_keys]
-            allowed_bod = [k[1] for k in allowed_keys]
-            key_df = pl.DataFrame({"schuze": allowed_schuze, "bod": allowed_bod})
-            votes = votes.join(key_df, on=["schuze", "bod"], how="inner")
+        key_df = data.get_topic_keys(topic_filter)
+        if key_df.height:
+            # Joins don't guarantee row order; the matched subset is small to re-sort
+            votes = votes.join(key_df, on=["schuze", "bod"], how="inner").sort(
+                "id_hlasovani", descending=True
+            )
         else:
             votes = votes.head(0)
 
@@ -163,16 +149,12 @@ def list_votes(
 
     Returns dict with keys: rows, total, page, per_page, total_pages.
     """
-    void_ids = data.void_votes.get_column("id_hlasovani")
-    votes = data.votes.filter(~pl.col("id_hlasovani").is_in(void_ids))
-
-    votes = _apply_vote_filters(votes, data, search, outcome_filter, topic_filter)
+    votes = _apply_vote_filters(data.browsable_votes, data, search, outcome_filter, topic_filter)
 
     total = votes.height
     total_pages = max(1, (total + per_page - 1) // per_page)
     page = max(1, min(page, total_pages))
 
-    votes = votes.sort("id_hlasovani", descending=True)
     offset = (page - 1) * per_page
     page_rows = votes.slice(offset, per_page)
 
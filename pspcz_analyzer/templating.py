@@ -0,0 +1,173 @@
+"""Shared Jinja2 environment for all public-frontend routers.
+
+Every router renders from the same ``templates`` instance, so each template
+is parsed and compiled once regardless of which router touches it first,
+and filters and i18n hooks are registered in exactly one place.
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import urlparse
+
+import markdown as _md
+import markupsafe
+import nh3
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from pspcz_analyzer.config import DEFAULT_CACHE_DIR, JINJA_BYTECODE_DIR
+from pspcz_analyzer.i18n import setup_jinja2_i18n
+from pspcz_analyzer.services.analysis_cache import analysis_cache
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+STATIC_DIR = Path(__file__).parent / "static"
+DEV_MODE = os.environ.get("PSPCZ_DEV", "1") == "1"
+
+
+# One converter reused across renders; building a Markdown instance (and its
+# extensions) is the dominant per-call cost of python-markdown
+_MD = _md.Markdown(extensions=["nl2br"])
+_md_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _render_md(text: str) -> str:
+    """Markdown → sanitized HTML, memoized since tisk summaries are re-rendered often."""
+    # Markdown instances carry parse state and are not thread-safe
+    with _md_lock:
+        raw_html = _MD.reset().convert(text)
+    return nh3.clean(raw_html)
+
+
+def _md_filter(text: str) -> markupsafe.Markup:
+    """Convert markdown to HTML, sanitized for safe Jinja2 rendering."""
+    if not text:
+        return markupsafe.Markup("")
+    return markupsafe.Markup(_render_md(text))
+
+
+def _safe_url(url: str) -> str:
+    """Return url only if scheme is http/https, else empty string."""
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https"):
+            return url
+    except ValueError:
+        pass
+    return ""
+
+
+@lru_cache(maxsize=64)
+def _static_digest(path: Path, mtime_ns: int) -> str:
+    """Short content hash of a static file (``mtime_ns`` only keys the cache)."""
+    return hashlib.sha1(path.read_bytes()).hexdigest()[:10]
+
+
+def static_url(name: str) -> str:
+    """URL of a static asset, stamped with its content hash for immutable caching."""
+    path = STATIC_DIR / name
+    try:
+        digest = _static_digest(path, path.stat().st_mtime_ns)
+    except OSError:
+        return f"/static/{name}"
+    return f"/static/{name}?v={digest}"
+
+
+templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates.env.filters["markdown"] = _md_filter
+templates.env.filters["safe_url"] = _safe_url
+templates.env.globals["static_url"] = static_url
+setup_jinja2_i18n(templates.env)
+
+# Compiled templates are kept on disk so they survive worker restarts.
+# Outside dev mode templates never change on disk, so skip the per-render
+# mtime check.
+_bytecode_dir = DEFAULT_CACHE_DIR / JINJA_BYTECODE_DIR
+_bytecode_dir.mkdir(parents=True, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(_bytecode_dir))
+templates.env.auto_reload = DEV_MODE
+
+
+def warm_templates() -> int:
+    """Load every template into the environment's cache; returns how many.
+
+    Run once at worker startup, so the first request for each page doesn't
+    pay for compilation (or the bytecode-cache read, when one exists).
+    """
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value covers ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {c.strip().removeprefix("W/") for c in if_none_match.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+class _RenderedPartial(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+
+async def cached_partial(
+    request: Request,
+    key: str,
+    template_name: str,
+    build_context: Callable[[], Awaitable[dict[str, Any]]],
+) -> Response:
+    """Render an HTMX partial, caching the finished HTML per key and language.
+
+    On a hit both the analysis and the Jinja2 render are skipped. The HTML
+    lives in ``analysis_cache`` under ``html:{lang}:{key}`` — a namespace no
+    ``cache_key`` analysis key can produce — so it shares the TTL, size cap
+    and data-reload invalidation of the analysis results.
+    ``build_context`` is only awaited on a miss.
+
+    A gzip copy is compressed once alongside the HTML and served to clients
+    that accept it, so ``GZipMiddleware`` doesn't recompress it per request.
+    Responses carry a weak content-hash ``ETag`` (shared by both encodings);
+    a request whose ``If-None-Match`` still matches gets an empty ``304``.
+    Browsers must revalidate each time (``no-cache``), since the language
+    comes from a cookie rather than the URL.
+    """
+    lang = getattr(request.state, "lang", "cs")
+    html_key = f"html:{lang}:{key}"
+    cached = analysis_cache.get(html_key)
+    if not isinstance(cached, _RenderedPartial):
+        context = await build_context()
+        body = (
+            templates.get_template(template_name)
+            .render({"request": request, "lang": lang, **context})
+            .encode()
+        )
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        cached = _RenderedPartial(body, gzip.compress(body), etag)
+        analysis_cache.set(html_key, cached)
+    body, gzipped, etag = cached
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Cookie, Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(gzipped, headers=headers)
+    return HTMLResponse(body, headers=headers)
@@ -1,5 +1,11 @@
 """Tests for HTMX partial endpoints and health check."""
 
+import asyncio
+
+from pspcz_analyzer.routes import voting
+from pspcz_analyzer.routes.utils import warm_period_analyses
+from pspcz_analyzer.services.analysis_cache import analysis_cache
+
 
 class TestHealthEndpoint:
     def test_health_returns_ok(self, client):
@@ -9,6 +15,14 @@ class TestHealthEndpoint:
         assert data["status"] == "ok"
         assert "periods_loaded" in data
 
+    def test_health_tracks_loaded_periods(self, client, mock_data_service):
+        mock_data_service.loaded_periods = [10, 9]
+        assert client.get("/api/health").json()["periods_loaded"] == [10, 9]
+        mock_data_service.loaded_periods = [10]
+        resp = client.get("/api/health")
+        assert resp.json()["periods_loaded"] == [10]
+        assert resp.headers["content-type"] == "application/json"
+
 
 class TestHTMXPartials:
     def test_loyalty_api(self, client):
@@ -34,3 +48,129 @@ class TestHTMXPartials:
     def test_invalid_period_returns_404(self, client):
         resp = client.get("/api/loyalty?period=999")
         assert resp.status_code == 404
+
+    def test_filter_values_cannot_forge_cache_keys(self, client):
+        analysis_cache.invalidate()
+        for forged in (":html:cs", "html:cs"):
+            assert client.get(f"/api/loyalty?period=1&party={forged}").status_code == 200
+            assert client.get("/api/loyalty?period=1").status_code == 200
+            assert client.get(f"/api/attendance?period=1&party={forged}").status_code == 200
+            assert client.get("/api/attendance?period=1").status_code == 200
+
+    def test_unchanged_partial_revalidates_to_304(self, client):
+        first = client.get("/api/attendance?period=1")
+        etag = first.headers["etag"]
+        resp = client.get("/api/attendance?period=1", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["x-frame-options"] == "DENY"
+
+
+class TestAnalysisWarmup:
+    def test_warmed_defaults_are_served_without_compute(
+        self, client, mock_period_data, monkeypatch
+    ):
+        analysis_cache.invalidate()
+        asyncio.run(warm_period_analyses(mock_period_data))
+
+        def no_compute(*args, **kwargs):
+            raise AssertionError("default page should come from the warmed cache")
+
+        for name in ("cached_loyalty", "compute_attendance", "compute_cross_party_similarity"):
+            monkeypatch.setattr(voting, name, no_compute)
+        for path in ("/api/loyalty", "/api/attendance", "/api/similarity"):
+            assert client.get(f"{path}?period=1").status_code == 200
+
+
+class TestTiskPartials:
+    def test_tisk_text_is_escaped(self, client, mock_data_service, tmp_path):
+        from pspcz_analyzer.config import TISKY_TEXT_DIR
+        from pspcz_analyzer.services.tisk.text_service import TiskTextService
+
+        text_dir = tmp_path / TISKY_TEXT_DIR / "1"
+        text_dir.mkdir(parents=True)
+        (text_dir / "5.txt").write_text("§ 1 <b>zákon</b> & spol.", encoding="utf-8")
+        mock_data_service.tisk_text = TiskTextService(tmp_path)
+        resp = client.get("/api/tisk-text?period=1&ct=5")
+        assert resp.status_code == 200
+        assert "<pre" in resp.text
+        assert "§ 1 &lt;b&gt;zákon&lt;/b&gt; &amp; spol." in resp.text
+
+    def test_tisk_text_streamed_across_chunks(self, client, mock_data_service, tmp_path):
+        from pspcz_analyzer.config import TISKY_TEXT_DIR
+        from pspcz_analyzer.routes import tisk
+        from pspcz_analyzer.services.tisk.text_service import TiskTextService
+
+        text_dir = tmp_path / TISKY_TEXT_DIR / "1"
+        text_dir.mkdir(parents=True)
+        text = "a<b>&č\n" * (tisk._TEXT_CHUNK_CHARS // 4)
+        (text_dir / "5.txt").write_text(text, encoding="utf-8")
+        mock_data_service.tisk_text = TiskTextService(tmp_path)
+        resp = client.get("/api/tisk-text?period=1&ct=5")
+        assert resp.status_code == 200
+        assert resp.text.rstrip().endswith("</article>")
+        assert resp.text.count("a&lt;b&gt;&amp;č") == text.count("a<b>&č")
+        assert "\x00" not in resp.text
+        # Streamed as-is rather than buffered through GZipMiddleware
+        assert resp.headers["content-encoding"] == "identity"
+
+    def test_tisk_text_missing(self, client, mock_data_service, tmp_path):
+        from pspcz_analyzer.services.tisk.text_service import TiskTextService
+
+        mock_data_service.tisk_text = TiskTextService(tmp_path)
+        resp = client.get("/api/tisk-text?period=1&ct=5")
+        assert resp.status_code == 200
+        assert "<pre" not in resp.text
+        assert "<article" in resp.text
+
+    def test_subtisk_text_read_from_cache_dir(self, client, mock_data_service, tmp_path):
+        from pspcz_analyzer.config import TISKY_TEXT_DIR
+        from pspcz_analyzer.services.tisk.text_service import TiskTextService
+
+        text_dir = tmp_path / TISKY_TEXT_DIR / "1"
+        text_dir.mkdir(parents=True)
+        (text_dir / "5_2.txt").write_text("verze 2", encoding="utf-8")
+        mock_data_service.tisk_text = TiskTextService(tmp_path)
+
+        assert "verze 2" in client.get("/api/tisk-text?period=1&ct=5&ct1=2").text
+        assert "<pre" not in client.get("/api/tisk-text?period=1&ct=5&ct1=3").text
+
+    def test_tisk_evolution_renders_law_changes(self, client, mock_period_data):
+        from pspcz_analyzer.models.tisk_models import TiskInfo
+        from pspcz_analyzer.services.tisk.io import ProposedLawChange
+
+        tisk = TiskInfo(id_tisk=1, ct=5, nazev="Novela", period=1)
+        tisk.law_changes = [ProposedLawChange(citace="89/2012 Sb.", zmena="mění", idsb=42)]
+        mock_period_data.tisk_lookup[(1, 1)] = tisk
+        mock_period_data.build_tisk_ct_index()
+
+        resp = client.get("/api/tisk-evolution?period=1&ct=5")
+        assert resp.status_code == 200
+        assert "89/2012 Sb." in resp.text
+        assert "/api/related-bills?idsb=42" in resp.text
+
+    def test_related_bills_table(self, client, monkeypatch):
+        from pspcz_analyzer.routes import tisk
+        from pspcz_analyzer.services.tisk.io import RelatedBill
+
+        bills = [
+            RelatedBill(cislo="12", kratky_nazev="Novela <x>", url="https://psp.cz/t?ct=12"),
+            RelatedBill(cislo="13", kratky_nazev="Jiná", url="javascript:alert(1)"),
+        ]
+        monkeypatch.setattr(tisk, "load_related_bills_json", lambda idsb, cache_dir: bills)
+        tisk._load_or_scrape_related_bills.cache_clear()
+        resp = client.get("/api/related-bills?idsb=7")
+        assert resp.status_code == 200
+        assert '<a href="https://psp.cz/t?ct=12" target="_blank" rel="noopener">12</a>' in resp.text
+        assert "Novela &lt;x&gt;" in resp.text
+        assert "javascript:" not in resp.text
+        assert "<td>13</td>" in resp.text
+
+    def test_related_bills_empty(self, client, monkeypatch):
+        from pspcz_analyzer.routes import tisk
+
+        monkeypatch.setattr(tisk, "load_related_bills_json", lambda idsb, cache_dir: [])
+        tisk._load_or_scrape_related_bills.cache_clear()
+        resp = client.get("/api/related-bills?idsb=7")
+        assert resp.status_code == 200
+        assert "<table" not in resp.text
@@ -9,6 +9,12 @@ class TestChartEndpoints:
         # PNG magic bytes
         assert resp.content[:4] == b"\x89PNG"
 
+    def test_png_not_recompressed(self, client):
+        resp = client.get("/charts/loyalty.png?period=1", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "identity"
+        assert resp.content[:4] == b"\x89PNG"
+
     def test_attendance_chart(self, client):
         resp = client.get("/charts/attendance.png?period=1")
         assert resp.status_code == 200
@@ -18,3 +24,35 @@ class TestChartEndpoints:
         resp = client.get("/charts/similarity.png?period=1")
         assert resp.status_code == 200
         assert resp.headers["content-type"] == "image/png"
+
+    def test_filter_values_cannot_forge_png_keys(self, client):
+        from pspcz_analyzer.services.analysis_cache import analysis_cache
+
+        analysis_cache.invalidate()
+        assert client.get("/api/loyalty?period=1&top=20&party=png:cs").status_code == 200
+        assert client.get("/api/attendance?period=1&top=20&party=:png:cs").status_code == 200
+        for path in ("/charts/loyalty.png?period=1", "/charts/attendance.png?period=1"):
+            resp = client.get(path)
+            assert resp.status_code == 200
+            assert resp.content[:4] == b"\x89PNG"
+
+    def test_png_cached_per_language(self, client, monkeypatch):
+        from pspcz_analyzer.routes import charts
+        from pspcz_analyzer.services.analysis_cache import analysis_cache
+
+        analysis_cache.invalidate()
+        renders: list[str] = []
+
+        async def fake_render(fn, *args, **kwargs):
+            renders.append(args[-1])  # chart title
+            return b"\x89PNG fake"
+
+        monkeypatch.setattr(charts, "run_in_process", fake_render)
+        for _ in range(2):
+            assert client.get("/charts/loyalty.png?period=1").content == b"\x89PNG fake"
+        assert len(renders) == 1
+
+        client.cookies.set("lang", "en")
+        client.get("/charts/loyalty.png?period=1")
+        assert len(renders) == 2
+        assert renders[0] != renders[1]
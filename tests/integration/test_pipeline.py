@@ -56,7 +56,7 @@ class TestAnalysisOnRealData:
         result = compute_loyalty(period_data, top=10)
         assert len(result) > 0
         for r in result:
-            assert 0 <= r["rebellion_pct"] <= 100
+            assert 0 <= r.rebellion_pct <= 100
 
     def test_attendance_produces_results(self, period_data):
         from pspcz_analyzer.services.attendance_service import compute_attendance
@@ -1,12 +1,14 @@
 """Tests for attendance service — vote breakdown and party filter (merged from activity)."""
 
+from dataclasses import fields
+
 from pspcz_analyzer.services.attendance_service import compute_attendance
 from tests.fixtures.sample_data import make_period_data
 
 
 class TestAttendanceVoteBreakdown:
     def test_includes_vote_breakdown_fields(self):
-        """Each result should have YES/NO/ABSTAINED breakdown keys."""
+        """Each result should have YES/NO/ABSTAINED breakdown fields."""
         data = make_period_data()
         result = compute_attendance(data, top=1)
         assert len(result) >= 1
@@ -23,31 +25,31 @@ class TestAttendanceVoteBreakdown:
             "excused",
             "attendance_pct",
         }
-        assert expected_keys.issubset(result[0].keys())
+        assert expected_keys.issubset(f.name for f in fields(result[0]))
 
     def test_party_filter(self):
         """Filtering by party should only return MPs from that party."""
         data = make_period_data()
         result = compute_attendance(data, party_filter="ANO")
-        assert all(r["party"] == "ANO" for r in result)
+        assert all(r.party == "ANO" for r in result)
 
     def test_party_filter_case_insensitive(self):
         data = make_period_data()
         result = compute_attendance(data, party_filter="ano")
-        assert all(r["party"] == "ANO" for r in result)
+        assert all(r.party == "ANO" for r in result)
 
     def test_sort_most_active(self):
         """sort=most_active should sort by active vote count descending."""
         data = make_period_data()
         result = compute_attendance(data, top=50, sort="most_active")
-        actives = [r["active"] for r in result]
+        actives = [r.active for r in result]
         assert actives == sorted(actives, reverse=True)
 
     def test_active_count_matches_data(self):
         """MP 1 (Jan Novák, ANO) votes YES on all 5 votes = 5 active."""
         data = make_period_data()
         result = compute_attendance(data, top=50, sort="most_active")
-        jan = [r for r in result if r["prijmeni"] == "Novák"]
+        jan = [r for r in result if r.prijmeni == "Novák"]
         assert len(jan) == 1
-        assert jan[0]["active"] == 5
-        assert jan[0]["yes_votes"] == 5
+        assert jan[0].active == 5
+        assert jan[0].yes_votes == 5
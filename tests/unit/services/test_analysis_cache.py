@@ -0,0 +1,182 @@
+"""Tests for the in-memory analysis cache and the cache-first route helper."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from pspcz_analyzer.routes import utils
+from pspcz_analyzer.services import loyalty_service
+from pspcz_analyzer.services.analysis_cache import AnalysisCache, cache_key
+from tests.fixtures.sample_data import make_period_data
+
+
+class TestAnalysisCache:
+    def test_cache_key_escapes_separator(self):
+        assert cache_key("loyalty", 10, 30, "") == "loyalty:10:30:"
+        assert cache_key("votes", 10, "a:b", "") != cache_key("votes", 10, "a", "b")
+        assert cache_key("loyalty", 10, 30, ":html:cs").count(":") == 3
+
+    def test_get_respects_ttl(self, monkeypatch):
+        cache = AnalysisCache(ttl=10)
+        assert cache.get("k") is None
+        assert cache.get_or_compute("k", lambda: [1]) == [1]
+        assert cache.get("k") == [1]
+
+        now = time.monotonic()
+        monkeypatch.setattr(
+            "pspcz_analyzer.services.analysis_cache.time.monotonic", lambda: now + 11
+        )
+        assert cache.get("k") is None
+
+    def test_size_cap_evicts_least_recently_used(self):
+        cache = AnalysisCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.get_or_compute("c", lambda: 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_concurrent_misses_compute_once(self):
+        cache = AnalysisCache()
+        calls = 0
+        release = threading.Event()
+
+        def compute() -> list[int]:
+            nonlocal calls
+            calls += 1
+            release.wait(2)
+            return [calls]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_compute, "k", compute) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == 1
+        assert results == [[1]] * 4
+
+    def test_failed_compute_does_not_poison_key(self):
+        cache = AnalysisCache()
+
+        def boom() -> list[int]:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute("k", boom)
+        assert cache.get_or_compute("k", lambda: [2]) == [2]
+
+
+class TestCachedAnalysis:
+    def test_hit_skips_executor(self, monkeypatch):
+        cache = AnalysisCache()
+        cache.get_or_compute("loyalty:1", lambda: ["row"])
+        monkeypatch.setattr(utils, "analysis_cache", cache)
+
+        async def no_pool(*args, **kwargs):
+            raise AssertionError("cache hit must not dispatch to the pool")
+
+        monkeypatch.setattr(utils, "run_with_timeout", no_pool)
+        result = asyncio.run(
+            utils.cached_analysis("loyalty:1", lambda: ["other"], timeout=1.0, label="t")
+        )
+        assert result == ["row"]
+
+    def test_miss_computes_and_stores(self, monkeypatch):
+        cache = AnalysisCache()
+        monkeypatch.setattr(utils, "analysis_cache", cache)
+        result = asyncio.run(
+            utils.cached_analysis("loyalty:2", lambda: ["fresh"], timeout=5.0, label="t")
+        )
+        assert result == ["fresh"]
+        assert cache.get("loyalty:2") == ["fresh"]
+
+    def test_concurrent_misses_share_one_dispatch(self, monkeypatch):
+        cache = AnalysisCache()
+        monkeypatch.setattr(utils, "analysis_cache", cache)
+        dispatches = 0
+
+        async def slow_pool(fn, *args, **kwargs):
+            nonlocal dispatches
+            dispatches += 1
+            await asyncio.sleep(0.01)
+            return fn()
+
+        monkeypatch.setattr(utils, "run_with_timeout", slow_pool)
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(
+                    utils.cached_analysis("loyalty:3", lambda: ["rows"], timeout=1.0, label="t")
+                    for _ in range(5)
+                )
+            )
+
+        assert asyncio.run(run()) == [["rows"]] * 5
+        assert dispatches == 1
+        assert utils._inflight == {}
+
+    def test_failure_propagates_to_waiters(self, monkeypatch):
+        monkeypatch.setattr(utils, "analysis_cache", AnalysisCache())
+
+        async def failing_pool(fn, *args, **kwargs):
+            await asyncio.sleep(0.01)
+            raise HTTPException(503, detail="timed out")
+
+        monkeypatch.setattr(utils, "run_with_timeout", failing_pool)
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(
+                    utils.cached_analysis("loyalty:4", lambda: [], timeout=1.0, label="t")
+                    for _ in range(3)
+                ),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, HTTPException) and r.status_code == 503 for r in results)
+        assert utils._inflight == {}
+
+    def test_single_flight_dedups_only_same_key(self):
+        calls: list[int] = []
+
+        async def scrape(idsb: int) -> list[int]:
+            calls.append(idsb)
+            await asyncio.sleep(0.01)
+            return [idsb]
+
+        async def run() -> list:
+            return await asyncio.gather(
+                *(
+                    utils.single_flight(f"related-bills:{i}", lambda i=i: scrape(i))
+                    for i in (7, 7, 7, 8)
+                )
+            )
+
+        assert asyncio.run(run()) == [[7], [7], [7], [8]]
+        assert sorted(calls) == [7, 8]
+        assert utils._inflight == {}
+
+
+class TestCachedLoyalty:
+    def test_rebellion_table_built_once_per_period(self, monkeypatch):
+        monkeypatch.setattr(utils, "analysis_cache", AnalysisCache())
+        builds = 0
+        real_table = loyalty_service.rebellion_table
+
+        def counting_table(data):
+            nonlocal builds
+            builds += 1
+            return real_table(data)
+
+        monkeypatch.setattr(utils, "rebellion_table", counting_table)
+        pd = make_period_data()
+        utils.cached_loyalty(pd, 30)
+        utils.cached_loyalty(pd, 5, "ANO")
+        assert builds == 1
@@ -1,15 +1,18 @@
 """Tests for attendance computation."""
 
+from dataclasses import fields
+
+from pspcz_analyzer.models.analysis_models import AttendanceRow
 from pspcz_analyzer.services.attendance_service import compute_attendance
 from tests.fixtures.sample_data import make_period_data
 
 
 class TestComputeAttendance:
-    def test_returns_list_of_dicts(self):
+    def test_returns_list_of_rows(self):
         data = make_period_data()
         result = compute_attendance(data)
         assert isinstance(result, list)
-        assert all(isinstance(r, dict) for r in result)
+        assert all(isinstance(r, AttendanceRow) for r in result)
 
     def test_attendance_pct_formula(self):
         """Verify: attendance = active / (total - excused) * 100.
@@ -19,24 +22,24 @@ class TestComputeAttendance:
         """
         data = make_period_data()
         result = compute_attendance(data, top=50)
-        marie = [r for r in result if r["prijmeni"] == "Nová"]
+        marie = [r for r in result if r.prijmeni == "Nová"]
         assert len(marie) == 1
-        assert marie[0]["attendance_pct"] == 50.0
-        assert marie[0]["active"] == 2
-        assert marie[0]["excused"] == 1
+        assert marie[0].attendance_pct == 50.0
+        assert marie[0].active == 2
+        assert marie[0].excused == 1
 
     def test_sort_worst(self):
         """sort='worst' should put lowest attendance first."""
         data = make_period_data()
         result = compute_attendance(data, sort="worst", top=50)
-        pcts = [r["attendance_pct"] for r in result]
+        pcts = [r.attendance_pct for r in result]
         assert pcts == sorted(pcts)
 
     def test_sort_best(self):
         """sort='best' should put highest attendance first."""
         data = make_period_data()
         result = compute_attendance(data, sort="best", top=50)
-        pcts = [r["attendance_pct"] for r in result]
+        pcts = [r.attendance_pct for r in result]
         assert pcts == sorted(pcts, reverse=True)
 
     def test_top_limits_results(self):
@@ -45,7 +48,7 @@ class TestComputeAttendance:
         assert len(result) <= 2
 
     def test_expected_fields(self):
-        """Each result should have the expected keys."""
+        """Each result should have the expected fields."""
         data = make_period_data()
         result = compute_attendance(data, top=1)
         assert len(result) >= 1
@@ -62,4 +65,4 @@ class TestComputeAttendance:
             "excused",
             "attendance_pct",
         }
-        assert expected_keys.issubset(result[0].keys())
+        assert expected_keys.issubset(f.name for f in fields(result[0]))
@@ -0,0 +1,34 @@
+"""Tests for DataReader file lookup helpers."""
+
+import os
+
+from pspcz_analyzer.services.data_reader import DataReader, _index_dir
+from tests.fixtures.sample_data import make_period_data
+
+
+class TestIndexDir:
+    def test_case_insensitive_nested_lookup(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "Osoby.UNL").write_text("x")
+
+        index = _index_dir(tmp_path, tmp_path.stat().st_mtime_ns)
+
+        assert index["osoby.unl"] == tmp_path / "sub" / "Osoby.UNL"
+
+    def test_touched_directory_is_reindexed(self, tmp_path):
+        mtime = tmp_path.stat().st_mtime_ns
+        assert "tisky.unl" not in _index_dir(tmp_path, mtime)
+
+        (tmp_path / "tisky.unl").write_text("x")
+        os.utime(tmp_path, ns=(mtime + 10**9, mtime + 10**9))
+
+        assert "tisky.unl" in _index_dir(tmp_path, tmp_path.stat().st_mtime_ns)
+
+
+class TestRefreshTiskData:
+    def test_topic_labels_survive_refresh_without_parquet(self, tmp_path):
+        reader = DataReader(tmp_path)
+        reader._periods[1] = make_period_data(period=1)
+
+        labels = reader.get_period(1).get_all_topic_labels()
+        assert reader.get_period(1).get_all_topic_labels() is labels
@@ -0,0 +1,71 @@
+"""Tests for the tisk PDF download + text extraction pipeline."""
+
+import threading
+
+import pytest
+
+from pspcz_analyzer.config import TISKY_PDF_DIR, TISKY_TEXT_DIR
+from pspcz_analyzer.data.http_client import RateLimiter
+from pspcz_analyzer.services.tisk import downloader_pipeline
+from pspcz_analyzer.services.tisk.downloader_pipeline import process_period_sync
+from pspcz_analyzer.services.tisk.io.scraper import TiskDocument
+
+
+class TestProcessPeriodSync:
+    @pytest.fixture(autouse=True)
+    def _fake_network(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(downloader_pipeline, "host_limiter", lambda host: RateLimiter(0))
+        self.scraped: list[int] = []
+        self.extract_threads: set[str] = set()
+
+        def fake_best_pdf(period, ct, cache_dir=None):
+            self.scraped.append(ct)
+            return None if ct == 3 else TiskDocument(ct * 10, "", "PDF", True)
+
+        def fake_download(period, ct, idd, cache_dir, force):
+            dest = cache_dir / TISKY_PDF_DIR / str(period) / f"{ct}.pdf"
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(b"%PDF")
+            return dest
+
+        def fake_extract(pdf_path, period, ct, cache_dir, force):
+            self.extract_threads.add(threading.current_thread().name)
+            dest = cache_dir / TISKY_TEXT_DIR / str(period) / f"{ct}.txt"
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_text("text", encoding="utf-8")
+            return dest
+
+        monkeypatch.setattr(downloader_pipeline, "get_best_pdf", fake_best_pdf)
+        monkeypatch.setattr(downloader_pipeline, "download_one", fake_download)
+        monkeypatch.setattr(downloader_pipeline, "extract_one", fake_extract)
+
+    def test_fetches_uncached_and_reports_progress(self, tmp_path):
+        cached = tmp_path / TISKY_TEXT_DIR / "10" / "1.txt"
+        cached.parent.mkdir(parents=True)
+        cached.write_text("cached", encoding="utf-8")
+        progress: list[tuple[int, int]] = []
+
+        pdfs, texts = process_period_sync(
+            10, [1, 2, 3, 4], tmp_path, progress_callback=lambda d, t: progress.append((d, t))
+        )
+
+        assert sorted(self.scraped) == [2, 3, 4]
+        assert sorted(pdfs) == [2, 4]
+        assert sorted(texts) == [1, 2, 4]
+        assert texts[1] == cached
+        assert [d for d, _ in progress] == [1, 2, 3, 4]
+        assert {t for _, t in progress} == {4}
+        # PyMuPDF is not thread-safe — extraction never runs on pool threads
+        assert self.extract_threads == {threading.current_thread().name}
+
+    def test_cancel_check_propagates(self, tmp_path):
+        calls = 0
+
+        def cancel() -> None:
+            nonlocal calls
+            calls += 1
+            if calls > 2:
+                raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            process_period_sync(10, [1, 2, 3], tmp_path, cancel_check=cancel)
@@ -0,0 +1,166 @@
+"""Tests for tisk legislative history scraping and parsing."""
+
+from dataclasses import asdict
+
+import pytest
+from selectolax.parser import HTMLParser
+
+from pspcz_analyzer.data.http_client import RateLimiter
+from pspcz_analyzer.services.tisk.io import history_scraper
+from pspcz_analyzer.services.tisk.io.history_scraper import (
+    TiskHistory,
+    TiskHistoryStage,
+    _build_stage,
+    _extract_submitter,
+    _parse_stages,
+    history_from_dict,
+    history_to_dict,
+    load_histories_parquet,
+    save_histories_parquet,
+    scrape_tisk_histories,
+)
+
+_HISTORY_HTML = """
+<html><body>
+<div class="section"><h2>Předkladatel</h2>
+  <div class="section-content"><p>Vláda předložila sněmovně dne 12. 3. 2024</p></div>
+</div>
+<div class="section"><h2>Poslanecká sněmovna</h2>
+  <div class="section-content"><ul class="document-log">
+    <li class="document-log-item"><span class="mark">1</span>
+      <p>Projednáno na 12. schůzi, <b>hlasování č. 57</b> — schválen</p></li>
+    <li class="document-log-item"><span class="mark">V</span>
+      <ul><li>Výbor nedoporučuje</li><li>schválit</li></ul></li>
+    <li class="document-log-item"><p>bez značky</p></li>
+  </ul></div>
+</div>
+<div class="section"><b>Senát</b>
+  <div class="section-content"><span class="mark">S</span> Senát zamítnut</div>
+</div>
+</body></html>
+"""
+
+
+class TestBuildStage:
+    def test_extracts_date_session_vote_outcome(self):
+        text = "Projednáno na 12. schůzi dne 3. 4. 2024, hlasování č. 57 — návrh schválen"
+        stage = _build_stage("3", text)
+        assert stage is not None
+        assert stage.stage_type == "3_cteni"
+        assert stage.date == "3. 4. 2024"
+        assert stage.session_number == 12
+        assert stage.vote_number == 57
+        assert stage.outcome == "schválen"
+
+    def test_first_outcome_pattern_wins(self):
+        stage = _build_stage("S", "Senát návrh zamítnut, vrátil sněmovně")
+        assert stage is not None
+        assert stage.outcome == "zamítnut"
+
+    def test_negated_recommendation_is_not_read_as_approval(self):
+        # "nedoporučuje schválit" contains "doporučuje schválit"
+        stage = _build_stage("V", "Výbor nedoporučuje schválit")
+        assert stage is not None
+        assert stage.outcome == "nedoporučuje schválit"
+
+    def test_recommendation_outcome(self):
+        stage = _build_stage("V", "Výbor doporučuje schválit")
+        assert stage is not None
+        assert stage.outcome == "doporučuje schválit"
+
+    def test_unknown_mark_returns_none(self):
+        assert _build_stage("XX", "cokoliv") is None
+
+    def test_missing_fields_are_none(self):
+        stage = _build_stage("PS", "Poslanecká sněmovna")
+        assert stage is not None
+        assert stage.date is None
+        assert stage.session_number is None
+        assert stage.vote_number is None
+        assert stage.outcome is None
+
+
+class TestParsePage:
+    def test_parse_stages(self):
+        stages = _parse_stages(HTMLParser(_HISTORY_HTML))
+        assert [s.stage_type for s in stages] == ["1_cteni", "vybor", "senat"]
+        assert stages[0].session_number == 12
+        assert stages[0].vote_number == 57
+        assert stages[0].details == "Projednáno na 12. schůzi, hlasování č. 57 — schválen"
+        assert stages[1].details == "V Výbor nedoporučuje schválit"
+        assert stages[2].outcome == "zamítnut"
+
+    def test_extract_submitter(self):
+        assert _extract_submitter(HTMLParser(_HISTORY_HTML), "") == ("Vláda", "12. 3. 2024")
+
+    def test_extract_submitter_falls_back_to_page_text(self):
+        text = "Petr Novák předložil návrh dne 1. 2. 2020"
+        tree = HTMLParser(f"<html><body>{text}</body></html>")
+        assert _extract_submitter(tree, text) == ("Petr Novák", "1. 2. 2020")
+
+
+class TestScrapeTiskHistories:
+    @pytest.fixture(autouse=True)
+    def _no_delay(self, monkeypatch):
+        monkeypatch.setattr(history_scraper, "host_limiter", lambda host: RateLimiter(0))
+
+    def test_collects_results_and_reports_each(self, monkeypatch):
+        def fake_fetch(client, period, ct, cache_dir=None):
+            return None if ct == 2 else TiskHistory(ct=ct, period=period)
+
+        monkeypatch.setattr(history_scraper, "_fetch_history", fake_fetch)
+        seen: list[tuple[int, bool]] = []
+
+        result = scrape_tisk_histories(
+            10, [1, 2, 3], on_result=lambda ct, h: seen.append((ct, h is not None))
+        )
+
+        assert sorted(result) == [1, 3]
+        assert sorted(seen) == [(1, True), (2, False), (3, True)]
+
+    def test_empty_input(self):
+        assert scrape_tisk_histories(10, []) == {}
+
+    def test_cancel_check_propagates(self, monkeypatch):
+        monkeypatch.setattr(
+            history_scraper,
+            "_fetch_history",
+            lambda c, p, ct, cache_dir=None: TiskHistory(ct=ct, period=p),
+        )
+
+        def cancel() -> None:
+            raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            scrape_tisk_histories(10, [1, 2], cancel_check=cancel)
+
+
+class TestHistoryDict:
+    def test_matches_asdict_and_round_trips(self):
+        h = TiskHistory(
+            ct=5,
+            period=10,
+            stages=[TiskHistoryStage("1_cteni", "1. čtení", session_number=3)],
+            law_changes=[{"law": "89/2012 Sb."}],
+        )
+        d = history_to_dict(h)
+        assert d == asdict(h)
+        assert history_from_dict(d) == h
+
+    def test_parquet_snapshot_round_trips(self, tmp_path):
+        histories = [
+            TiskHistory(
+                ct=ct,
+                period=10,
+                submitter="Vláda",
+                stages=[TiskHistoryStage("1_cteni", "1. čtení", outcome="schválen")],
+                law_changes=[{"law": "89/2012 Sb."}],
+                amendment_tisk_ct1=ct if ct > 1 else None,
+            )
+            for ct in (1, 2)
+        ]
+        path = tmp_path / "histories.parquet"
+        save_histories_parquet(histories, path)
+
+        assert load_histories_parquet(path) == {h.ct: h for h in histories}
+        assert load_histories_parquet(tmp_path / "missing.parquet") == {}
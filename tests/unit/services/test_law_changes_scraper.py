@@ -0,0 +1,110 @@
+"""Tests for proposed law change and related bill table parsing."""
+
+from selectolax.parser import HTMLParser
+
+from pspcz_analyzer.services.tisk.io.law_changes_scraper import (
+    ProposedLawChange,
+    RelatedBill,
+    _fallback_extract_law_changes,
+    _parse_law_changes_table,
+    _parse_related_bills_table,
+    load_law_changes_json,
+    load_related_bills_json,
+    save_law_changes_json,
+    save_related_bills_json,
+)
+
+_LAW_CHANGES_HTML = """
+<table>
+  <tr><th>Citace</th><th>Změna</th><th>Předpis</th></tr>
+  <tr><td><a href="tisky.sqw?idsb=55">89/2012 Sb.</a></td><td>mění</td>
+      <td>Občanský zákoník</td></tr>
+  <tr><td>262/2006 Sb.</td><td>ruší</td><td>Zákoník práce</td>
+      <td><a href="x.sqw?IDSB=7">s</a></td></tr>
+  <tr><td>jen jedna</td></tr>
+</table>
+"""
+
+_RELATED_BILLS_HTML = """
+<table>
+  <tr><th>Číslo</th><th>Název</th></tr>
+  <tr><td><a href="historie.sqw?o=9&amp;t=123">123/0</a></td><td>Novela</td>
+      <td>Návrh zákona</td><td>projednáno</td></tr>
+  <tr><td></td><td></td></tr>
+</table>
+"""
+
+
+def _table(html: str):
+    table = HTMLParser(html).css_first("table")
+    assert table is not None
+    return table
+
+
+class TestParseLawChangesTable:
+    def test_parses_rows_and_idsb_links(self):
+        changes = _parse_law_changes_table(_table(_LAW_CHANGES_HTML))
+        assert [(c.citace, c.zmena, c.predpis, c.idsb) for c in changes] == [
+            ("89/2012 Sb.", "mění", "Občanský zákoník", 55),
+            ("262/2006 Sb.", "ruší", "Zákoník práce", 7),
+        ]
+
+    def test_first_matching_link_in_row_cells_wins(self):
+        html = (
+            "<table><tr><th>Citace</th></tr>"
+            '<tr><th><a href="a?idsb=1">hlavička</a></th><td>1/2000 Sb.</td>'
+            '<td><a href="jinam.sqw">x</a><a href="b?idsb=2">y</a></td>'
+            '<td><a href="c?idsb=3">z</a></td></tr></table>'
+        )
+        changes = _parse_law_changes_table(_table(html))
+        assert [c.idsb for c in changes] == [2]
+
+    def test_header_match_is_case_insensitive(self):
+        html = "<table><tr><th>PŘEDPIS</th></tr><tr><td>1/2000 Sb.</td><td>mění</td></tr></table>"
+        changes = _parse_law_changes_table(_table(html))
+        assert [c.citace for c in changes] == ["1/2000 Sb."]
+
+    def test_table_without_law_header_is_ignored(self):
+        html = "<table><tr><td>nic</td></tr><tr><td>a</td><td>b</td></tr></table>"
+        assert _parse_law_changes_table(_table(html)) == []
+
+    def test_fallback_collects_idsb_links(self):
+        tree = HTMLParser(
+            '<p>Zákon <a href="tisky.sqw?idsb=9">89/2012</a></p>'
+            '<p><a href="tisky.sqw?idsb=10"></a>rodič</p><a href="jinam.sqw">x</a>'
+        )
+        changes = _fallback_extract_law_changes(tree)
+        assert [(c.citace, c.idsb) for c in changes] == [("89/2012", 9), ("rodič", 10)]
+
+
+class TestParseRelatedBillsTable:
+    def test_parses_bill_and_history_link(self):
+        bills = _parse_related_bills_table(_table(_RELATED_BILLS_HTML))
+        assert len(bills) == 1
+        bill = bills[0]
+        assert (bill.cislo, bill.kratky_nazev, bill.typ_tisku, bill.stav) == (
+            "123/0",
+            "Novela",
+            "Návrh zákona",
+            "projednáno",
+        )
+        assert (bill.period, bill.ct) == (9, 123)
+        assert bill.url == "https://www.psp.cz/sqw/historie.sqw?o=9&t=123"
+
+
+class TestJsonCache:
+    def test_law_changes_round_trip(self, tmp_path):
+        changes = [ProposedLawChange(citace="89/2012 Sb.", predpis="Občanský zákoník", idsb=5)]
+        path = save_law_changes_json(changes, 9, 1, tmp_path)
+        assert "Občanský" in path.read_text(encoding="utf-8")
+        assert load_law_changes_json(9, 1, tmp_path) == changes
+
+    def test_related_bills_round_trip(self, tmp_path):
+        bills = [RelatedBill(cislo="123/0", period=9, ct=123)]
+        save_related_bills_json(bills, 5, tmp_path)
+        assert load_related_bills_json(5, tmp_path) == bills
+
+    def test_missing_or_corrupt_cache(self, tmp_path):
+        assert load_law_changes_json(9, 1, tmp_path) is None
+        save_law_changes_json([], 9, 1, tmp_path).write_text("{broken", encoding="utf-8")
+        assert load_law_changes_json(9, 1, tmp_path) is None
@@ -3,6 +3,7 @@
 from pspcz_analyzer.models.amendment_models import AmendmentVote, BillAmendmentData
 from pspcz_analyzer.models.tisk_models import PeriodData, TiskInfo
 from pspcz_analyzer.services.law_service import (
+    _find_votes_for_ct,
     get_all_status_labels,
     law_detail,
     list_laws,
@@ -319,3 +320,21 @@ class TestLawDetail:
         result = law_detail(data, ct=200)
         assert result is not None
         assert "Ekonomika" in result["topics"]
+
+
+class TestFindVotesForCt:
+    def test_collects_votes_from_every_agenda_item(self):
+        tisk = _make_tisk(500, "Zákon o dopravě")
+        data = PeriodData(
+            period=10,
+            votes=make_votes(),
+            mp_votes=make_mp_votes(),
+            void_votes=make_void_votes(),
+            mp_info=make_mp_info(),
+            tisk_lookup={(1, 2): tisk, (1, 4): tisk},
+        )
+        votes = _find_votes_for_ct(data, 500)
+        assert [v["id_hlasovani"] for v in votes] == [4, 2]
+        assert all(v["schuze"] == 1 for v in votes)
+        assert all(v["result"] in {"passed", "rejected", "void"} for v in votes)
+        assert _find_votes_for_ct(data, 999) == []
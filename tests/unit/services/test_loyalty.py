@@ -1,51 +1,52 @@
 """Tests for loyalty (rebellion rate) computation."""
 
-from pspcz_analyzer.services.loyalty_service import compute_loyalty
+from pspcz_analyzer.models.analysis_models import LoyaltyRow
+from pspcz_analyzer.services.loyalty_service import compute_loyalty, rebellion_table
 from tests.fixtures.sample_data import make_period_data
 
 
 class TestComputeLoyalty:
-    def test_returns_list_of_dicts(self):
+    def test_returns_list_of_rows(self):
         data = make_period_data()
         result = compute_loyalty(data)
         assert isinstance(result, list)
-        assert all(isinstance(r, dict) for r in result)
+        assert all(isinstance(r, LoyaltyRow) for r in result)
 
     def test_rebellion_pct_range(self):
         """Rebellion percentages should be between 0 and 100."""
         data = make_period_data()
         result = compute_loyalty(data)
         for row in result:
-            assert 0 <= row["rebellion_pct"] <= 100
+            assert 0 <= row.rebellion_pct <= 100
 
     def test_rebel_mp_detected(self):
         """MP 3 (Karel Dvořák, ODS) votes NO on 3/5 votes against ODS majority YES."""
         data = make_period_data()
         result = compute_loyalty(data, top=50)
-        rebels = [r for r in result if r["prijmeni"] == "Dvořák"]
+        rebels = [r for r in result if r.prijmeni == "Dvořák"]
         assert len(rebels) == 1
         # 3 rebellions out of 5 active votes = 60%
-        assert rebels[0]["rebellion_pct"] == 60.0
+        assert rebels[0].rebellion_pct == 60.0
 
     def test_loyal_mp_zero_rebellion(self):
         """MPs 1 and 2 (ANO) always vote YES with party — 0% rebellion."""
         data = make_period_data()
         result = compute_loyalty(data, top=50)
-        loyal = [r for r in result if r["party"] == "ANO"]
+        loyal = [r for r in result if r.party == "ANO"]
         for mp in loyal:
-            assert mp["rebellion_pct"] == 0.0
+            assert mp.rebellion_pct == 0.0
 
     def test_party_filter(self):
         """Filtering by party should only return MPs from that party."""
         data = make_period_data()
         result = compute_loyalty(data, party_filter="ODS")
-        assert all(r["party"] == "ODS" for r in result)
+        assert all(r.party == "ODS" for r in result)
 
     def test_party_filter_case_insensitive(self):
         """Party filter should be case-insensitive."""
         data = make_period_data()
         result = compute_loyalty(data, party_filter="ods")
-        assert all(r["party"] == "ODS" for r in result)
+        assert all(r.party == "ODS" for r in result)
 
     def test_top_limits_results(self):
         """Top parameter should limit the number of results."""
@@ -92,12 +93,26 @@ class TestComputeLoyalty:
         data = make_period_data()
         result = compute_loyalty(data, top=50)
         for row in result:
-            assert "rebellion_votes" in row
-            assert isinstance(row["rebellion_votes"], list)
+            assert isinstance(row.rebellion_votes, list)
+
+    def test_rebellion_votes_match_counts_newest_first(self):
+        data = make_period_data()
+        for row in compute_loyalty(data, top=1):
+            ids = [v.id_hlasovani for v in row.rebellion_votes]
+            assert len(ids) == row.rebellions
+            assert ids == sorted(ids, reverse=True)
+
+    def test_precomputed_rebellion_table_gives_same_rows(self):
+        data = make_period_data()
+        table = rebellion_table(data)
+        for party in (None, "ANO"):
+            assert compute_loyalty(data, party_filter=party, rebellions=table) == compute_loyalty(
+                data, party_filter=party
+            )
 
     def test_sorted_by_rebellion_descending(self):
         """Results should be sorted by rebellion_pct descending."""
         data = make_period_data()
         result = compute_loyalty(data, top=50)
-        pcts = [r["rebellion_pct"] for r in result]
+        pcts = [r.rebellion_pct for r in result]
         assert pcts == sorted(pcts, reverse=True)
@@ -1,6 +1,10 @@
 """Tests for similarity (PCA + cosine) computation."""
 
+import numpy as np
+
+from pspcz_analyzer.models.analysis_models import SimilarPair
 from pspcz_analyzer.services.similarity_service import (
+    _build_vote_matrix,
     compute_cross_party_similarity,
     compute_pca_coords,
 )
@@ -41,33 +45,54 @@ class TestComputePcaCoords:
 
 
 class TestComputeCrossPartySimilarity:
-    def test_returns_list_of_dicts(self):
+    def test_returns_list_of_pairs(self):
         data = make_period_data()
         result = compute_cross_party_similarity(data)
         assert isinstance(result, list)
+        assert all(isinstance(p, SimilarPair) for p in result)
 
     def test_cross_party_only(self):
         """All pairs should be from different parties."""
         data = make_period_data()
         result = compute_cross_party_similarity(data)
         for pair in result:
-            assert pair["mp1_party"] != pair["mp2_party"]
+            assert pair.mp1_party != pair.mp2_party
 
     def test_similarity_range(self):
         """Cosine similarity should be between -1 and 1."""
         data = make_period_data()
         result = compute_cross_party_similarity(data)
         for pair in result:
-            assert -1.0 <= pair["similarity"] <= 1.0
+            assert -1.0 <= pair.similarity <= 1.0
 
     def test_sorted_by_similarity_descending(self):
         """Results should be sorted by similarity descending."""
         data = make_period_data()
         result = compute_cross_party_similarity(data)
-        sims = [p["similarity"] for p in result]
+        sims = [p.similarity for p in result]
         assert sims == sorted(sims, reverse=True)
 
     def test_top_limits_results(self):
         data = make_period_data()
         result = compute_cross_party_similarity(data, top=2)
         assert len(result) <= 2
+
+    def test_matches_pairwise_reference(self):
+        """Top pairs equal a brute-force scan of all cross-party pairs."""
+        data = make_period_data()
+        matrix, mp_info = _build_vote_matrix(data)
+        norms = np.linalg.norm(matrix, axis=1)
+        parties = mp_info.get_column("party").to_list()
+        expected = []
+        for i in range(len(parties)):
+            for j in range(i + 1, len(parties)):
+                if parties[i] and parties[j] and parties[i] != parties[j]:
+                    denom = (norms[i] or 1.0) * (norms[j] or 1.0)
+                    expected.append((float(matrix[i] @ matrix[j] / denom), parties[i], parties[j]))
+        expected.sort(key=lambda e: e[0], reverse=True)
+
+        result = compute_cross_party_similarity(data, top=3)
+        assert len(result) == min(3, len(expected))
+        for pair, (sim, p1, p2) in zip(result, expected, strict=False):
+            assert abs(pair.similarity - sim) < 1e-5
+            assert (pair.mp1_party, pair.mp2_party) == (p1, p2)
@@ -0,0 +1,84 @@
+"""Tests for bulk tisk PDF download and text extraction."""
+
+from pathlib import Path
+
+import pymupdf
+import pytest
+
+from pspcz_analyzer.config import TISKY_TEXT_DIR
+from pspcz_analyzer.data.http_client import RateLimiter
+from pspcz_analyzer.services.tisk.io import downloader
+from pspcz_analyzer.services.tisk.io.extractor import (
+    extract_and_cache,
+    extract_period_texts,
+    extract_text_from_pdf,
+)
+
+
+def _write_pdf(path: Path, text: str) -> Path:
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+class TestDownloadPeriodTisky:
+    @pytest.fixture(autouse=True)
+    def _no_delay(self, monkeypatch):
+        monkeypatch.setattr(downloader, "host_limiter", lambda host: RateLimiter(0))
+
+    def test_collects_successful_downloads(self, monkeypatch, tmp_path):
+        def fake_download(period, ct, cache_dir, force):
+            return None if ct == 2 else tmp_path / f"{ct}.pdf"
+
+        monkeypatch.setattr(downloader, "download_tisk_pdf", fake_download)
+        result = downloader.download_period_tisky(10, [1, 2, 3], tmp_path, workers=3)
+        assert result == {1: tmp_path / "1.pdf", 3: tmp_path / "3.pdf"}
+
+    def test_empty_input(self, tmp_path):
+        assert downloader.download_period_tisky(10, [], tmp_path) == {}
+
+
+class TestExtractPeriodTexts:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_extracts_and_caches_texts(self, tmp_path, workers):
+        pdfs = {ct: _write_pdf(tmp_path / f"{ct}.pdf", f"Tisk {ct}") for ct in (1, 2)}
+        (tmp_path / "3.pdf").write_bytes(b"not a pdf")
+        pdfs[3] = tmp_path / "3.pdf"
+
+        result = extract_period_texts(10, pdfs, tmp_path, workers=workers)
+
+        assert sorted(result) == [1, 2]
+        assert "Tisk 2" in result[2].read_text(encoding="utf-8")
+
+    def test_empty_input(self, tmp_path):
+        assert extract_period_texts(10, {}, tmp_path) == {}
+
+
+class TestExtractText:
+    def test_pages_are_joined_with_blank_lines(self, tmp_path):
+        doc = pymupdf.open()
+        for text in ("první", "druhá"):
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(tmp_path / "1.pdf")
+        doc.close()
+
+        text = extract_text_from_pdf(tmp_path / "1.pdf")
+        assert text == "první\n\n\ndruhá\n"
+
+    def test_html_saved_as_pdf_is_extracted(self, tmp_path):
+        path = tmp_path / "1.pdf"
+        path.write_text("<html><body><p>Návrh   zákona</p></body></html>", encoding="utf-8")
+        assert extract_text_from_pdf(path).strip() == "Návrh zákona"
+
+        dest = extract_and_cache(path, 10, 1, tmp_path)
+        assert dest is not None
+        assert dest.read_text(encoding="utf-8").strip() == "Návrh zákona"
+        assert not dest.with_suffix(".txt.tmp").exists()
+
+    def test_unreadable_file_is_not_cached(self, tmp_path):
+        path = tmp_path / "1.pdf"
+        path.write_bytes(b"garbage")
+        assert extract_and_cache(path, 10, 1, tmp_path) is None
+        assert list((tmp_path / TISKY_TEXT_DIR / "10").iterdir()) == []
@@ -0,0 +1,132 @@
+"""Tests for tisk document link scraping."""
+
+import httpx
+import pytest
+from selectolax.parser import HTMLParser
+
+from pspcz_analyzer.data.http_client import RateLimiter
+from pspcz_analyzer.services.tisk.io import scraper
+from pspcz_analyzer.services.tisk.io.scraper import (
+    TiskDocument,
+    _parse_documents,
+    scrape_all_subtisk_documents,
+    scrape_tisk_documents,
+)
+
+_TISKT_HTML = """
+<html><body><ul>
+  <li><a href="/sqw/text/orig2.sqw?idd=123">Celý <b>sněmovní</b> tisk</a> (PDF, 1 MB)</li>
+  <li><a href="orig2.sqw?idd=456">Důvodová zpráva</a> DOC</li>
+  <li><a href="orig2.sqw?idd=abc">bez čísla</a></li>
+  <li><a href="tiskt.sqw?o=9&ct=1">jiný odkaz</a></li>
+</ul></body></html>
+"""
+
+
+class TestParseDocuments:
+    def test_extracts_idd_links(self):
+        docs = _parse_documents(HTMLParser(_TISKT_HTML))
+        assert docs == [
+            TiskDocument(idd=123, description="Celýsněmovnítisk", format="PDF", is_complete=True),
+            TiskDocument(
+                idd=456, description="Důvodová zpráva", format="unknown", is_complete=False
+            ),
+        ]
+
+    def test_page_without_links(self):
+        assert _parse_documents(HTMLParser("<html><body><p>nic</p></body></html>")) == []
+
+
+class TestScrapeTiskDocuments:
+    def _serve(self, monkeypatch, html: str) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=html)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(scraper, "get_client", lambda: client)
+
+    def test_parses_listing_page(self, monkeypatch):
+        self._serve(monkeypatch, _TISKT_HTML)
+        assert [d.idd for d in scrape_tisk_documents(9, 1)] == [123, 456]
+
+    def test_page_without_document_links(self, monkeypatch):
+        self._serve(monkeypatch, '<html><body><a href="tiskt.sqw?o=9">x</a></body></html>')
+        assert scrape_tisk_documents(9, 1) == []
+
+
+class TestScrapeSubtiskPage:
+    @pytest.fixture(autouse=True)
+    def _no_delay(self, monkeypatch):
+        monkeypatch.setattr(scraper, "host_limiter", lambda host: RateLimiter(0))
+
+    def _serve(self, monkeypatch, status: int, html: str = "") -> None:
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(status, text=html))
+        )
+        monkeypatch.setattr(scraper, "get_client", lambda: client)
+
+    def test_missing_page_is_none(self, monkeypatch):
+        self._serve(monkeypatch, 404)
+        assert scraper._scrape_subtisk_page(9, 1, 3) is None
+
+    def test_server_error_is_none(self, monkeypatch):
+        self._serve(monkeypatch, 503)
+        assert scraper._scrape_subtisk_page(9, 1, 3) is None
+
+    def test_not_found_body_is_none(self, monkeypatch):
+        self._serve(monkeypatch, 200, "<html><body>Tisk nebyl nalezen</body></html>")
+        assert scraper._scrape_subtisk_page(9, 1, 3) is None
+
+    def test_parses_existing_page(self, monkeypatch):
+        self._serve(monkeypatch, 200, _TISKT_HTML)
+        docs = scraper._scrape_subtisk_page(9, 1, 3)
+        assert docs is not None
+        assert [d.idd for d in docs] == [123, 456]
+
+    def test_each_probe_waits_on_host_limiter(self, monkeypatch):
+        self._serve(monkeypatch, 404)
+        waits: list[str] = []
+
+        class CountingLimiter(RateLimiter):
+            def wait(self) -> None:
+                waits.append("wait")
+
+        monkeypatch.setattr(scraper, "host_limiter", lambda host: CountingLimiter(0))
+        scrape_all_subtisk_documents(9, 1, max_ct1=2)
+        assert len(waits) == 3
+
+
+class TestScrapeAllSubtiskDocuments:
+    def _fake_pages(self, monkeypatch, existing: int) -> list[int]:
+        calls: list[int] = []
+
+        def fake_page(period, ct, ct1, cache_dir=None):
+            calls.append(ct1)
+            if ct1 >= existing:
+                return None
+            return [
+                TiskDocument(idd=100 + ct1, description=f"v{ct1}", format="PDF", is_complete=False)
+            ]
+
+        monkeypatch.setattr(scraper, "_scrape_subtisk_page", fake_page)
+        return calls
+
+    def test_stops_at_first_missing_version(self, monkeypatch):
+        calls = self._fake_pages(monkeypatch, existing=6)
+        versions = scrape_all_subtisk_documents(10, 5)
+        assert [(v.ct1, v.idd) for v in versions] == [(ct1, 100 + ct1) for ct1 in range(6)]
+        # Probing stops after the round that hit the missing page
+        assert sorted(calls) == list(range(8))
+
+    def test_missing_original_is_recorded(self, monkeypatch):
+        self._fake_pages(monkeypatch, existing=0)
+        versions = scrape_all_subtisk_documents(10, 5)
+        assert len(versions) == 1
+        assert versions[0].ct1 == 0
+        assert not versions[0].has_pdf
+        assert versions[0].description == "Původní znění (original)"
+
+    def test_respects_max_ct1(self, monkeypatch):
+        calls = self._fake_pages(monkeypatch, existing=50)
+        assert len(scrape_all_subtisk_documents(10, 5, max_ct1=2)) == 3
+        assert sorted(calls) == [0, 1, 2]
@@ -1,5 +1,6 @@
 """Tests for vote search and detail service."""
 
+from pspcz_analyzer.models.tisk_models import TiskInfo
 from pspcz_analyzer.services.votes_service import list_votes, vote_detail
 from tests.fixtures.sample_data import make_period_data
 
@@ -45,6 +46,36 @@ class TestListVotes:
         ids2 = {r["id_hlasovani"] for r in page2["rows"]}
         assert ids1.isdisjoint(ids2)
 
+    def test_pages_are_newest_first_and_contiguous(self):
+        data = make_period_data()
+        ids = [
+            r["id_hlasovani"]
+            for page in (1, 2, 3)
+            for r in list_votes(data, per_page=2, page=page)["rows"]
+        ]
+        assert ids == sorted(ids, reverse=True)
+        assert len(ids) == 5
+
+    def test_search_ignores_case_and_diacritics(self):
+        data = make_period_data()
+        assert list_votes(data, search="TEST VÓTE 1")["total"] >= 1
+        assert list_votes(data, search="no such vote")["total"] == 0
+
+    def test_topic_filter_follows_topic_changes(self):
+        data = make_period_data()
+        health = TiskInfo(id_tisk=1, ct=10, nazev="A", period=1, topics=["Zdraví"])
+        transport = TiskInfo(id_tisk=2, ct=11, nazev="B", period=1, topics=["Doprava"])
+        data.tisk_lookup.update({(1, 2): health, (1, 4): transport})
+
+        rows = list_votes(data, topic_filter="Zdraví")["rows"]
+        assert [r["id_hlasovani"] for r in rows] == [2]
+        assert list_votes(data, topic_filter="Školství")["total"] == 0
+
+        transport.topics = ["Zdraví"]
+        data.invalidate_topic_labels()
+        rows = list_votes(data, topic_filter="Zdraví")["rows"]
+        assert [r["id_hlasovani"] for r in rows] == [4, 2]
+
     def test_outcome_label_present(self):
         """Each row should have an outcome_label."""
         data = make_period_data()
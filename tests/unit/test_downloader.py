@@ -0,0 +1,99 @@
+"""Tests for ZIP extraction in the open-data downloader."""
+
+import os
+import zipfile
+
+import pytest
+
+from pspcz_analyzer.data import downloader
+from pspcz_analyzer.data.downloader import _extract_zip
+
+
+def _make_zip(path, members: dict[str, bytes]) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+class TestExtractZip:
+    def test_extracts_all_members(self, tmp_path):
+        zip_path = tmp_path / "poslanci.zip"
+        payload = b"1|Novak|\n" * 50_000
+        _make_zip(zip_path, {"osoby.unl": payload, "sub/organy.unl": b"2|PS|\n"})
+
+        out = _extract_zip(zip_path, tmp_path / "extracted")
+
+        assert out == tmp_path / "extracted" / "poslanci"
+        assert (out / "osoby.unl").read_bytes() == payload
+        assert (out / "sub" / "organy.unl").read_bytes() == b"2|PS|\n"
+
+    def test_skips_when_already_extracted(self, tmp_path):
+        zip_path = tmp_path / "schuze.zip"
+        _make_zip(zip_path, {"schuze.unl": b"v1"})
+        out = _extract_zip(zip_path, tmp_path / "extracted")
+        (out / "schuze.unl").write_bytes(b"local")
+
+        _extract_zip(zip_path, tmp_path / "extracted")
+
+        assert (out / "schuze.unl").read_bytes() == b"local"
+
+    def test_newer_zip_with_same_content_is_not_reextracted(self, tmp_path, monkeypatch):
+        zip_path = tmp_path / "tisky.zip"
+        _make_zip(zip_path, {"tisky.unl": b"v1"})
+        out = _extract_zip(zip_path, tmp_path / "extracted")
+        (out / "tisky.unl").write_bytes(b"local")
+        dir_mtime = out.stat().st_mtime
+        # Simulate a forced re-download of an identical archive
+        os.utime(zip_path, (dir_mtime + 10, dir_mtime + 10))
+
+        _extract_zip(zip_path, tmp_path / "extracted")
+
+        assert (out / "tisky.unl").read_bytes() == b"local"
+        assert out.stat().st_mtime == dir_mtime
+
+        # The archive is now known to be unchanged, so later runs skip hashing
+        def fail_digest(path):
+            raise AssertionError(f"re-hashed {path}")
+
+        monkeypatch.setattr(downloader, "_file_digest", fail_digest)
+        _extract_zip(zip_path, tmp_path / "extracted")
+
+    def test_newer_zip_with_changed_content_is_reextracted(self, tmp_path):
+        zip_path = tmp_path / "tisky.zip"
+        _make_zip(zip_path, {"tisky.unl": b"v1"})
+        out = _extract_zip(zip_path, tmp_path / "extracted")
+        _make_zip(zip_path, {"tisky.unl": b"v2"})
+        dir_mtime = out.stat().st_mtime
+        os.utime(zip_path, (dir_mtime + 10, dir_mtime + 10))
+
+        _extract_zip(zip_path, tmp_path / "extracted")
+
+        assert (out / "tisky.unl").read_bytes() == b"v2"
+
+    def test_extracts_only_wanted_members(self, tmp_path):
+        zip_path = tmp_path / "schuze.zip"
+        _make_zip(zip_path, {"schuze.unl": b"1|", "sub/BOD_SCHUZE.unl": b"2|", "extra.unl": b"3|"})
+
+        out = _extract_zip(zip_path, tmp_path / "extracted", {"schuze.unl", "bod_schuze.unl"})
+
+        assert (out / "schuze.unl").exists()
+        assert (out / "sub" / "BOD_SCHUZE.unl").exists()
+        assert not (out / "extra.unl").exists()
+
+    def test_missing_wanted_member_triggers_extraction(self, tmp_path):
+        zip_path = tmp_path / "tisky.zip"
+        _make_zip(zip_path, {"tisky.unl": b"1|", "druh.unl": b"2|"})
+        out = _extract_zip(zip_path, tmp_path / "extracted", {"tisky.unl"})
+        assert not (out / "druh.unl").exists()
+
+        _extract_zip(zip_path, tmp_path / "extracted", {"tisky.unl", "druh.unl"})
+
+        assert (out / "druh.unl").exists()
+
+    def test_rejects_path_traversal(self, tmp_path):
+        zip_path = tmp_path / "evil.zip"
+        _make_zip(zip_path, {"../escape.unl": b"x"})
+
+        with pytest.raises(ValueError, match="outside"):
+            _extract_zip(zip_path, tmp_path / "extracted")
+        assert not (tmp_path / "extracted" / "escape.unl").exists()
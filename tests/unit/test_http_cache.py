@@ -0,0 +1,88 @@
+"""Tests for the conditional-GET page cache."""
+
+import httpx
+import pytest
+
+from pspcz_analyzer.data.http_cache import fetch_page, fetch_text
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestFetchPage:
+    def test_revalidates_with_etag_and_serves_304_from_disk(self, test_cache_dir):
+        seen_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            inm = request.headers.get("if-none-match")
+            seen_headers.append(inm)
+            if inm == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content="Sněmovna".encode("windows-1250"),
+                headers={"ETag": '"v1"', "Content-Type": "text/html; charset=windows-1250"},
+            )
+
+        with _client(handler) as client:
+            first = fetch_page(client, "https://psp.test/a", test_cache_dir)
+            second = fetch_page(client, "https://psp.test/a", test_cache_dir)
+
+        assert seen_headers == [None, '"v1"']
+        assert first.text == second.text == "Sněmovna"
+        assert not first.not_modified
+        assert second.not_modified
+
+    def test_pages_without_validators_are_not_stored(self, test_cache_dir):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            assert "if-none-match" not in request.headers
+            return httpx.Response(200, text="fresh")
+
+        with _client(handler) as client:
+            fetch_page(client, "https://psp.test/b", test_cache_dir)
+            page = fetch_page(client, "https://psp.test/b", test_cache_dir)
+
+        assert calls == 2
+        assert page.text == "fresh"
+        assert not page.not_modified
+
+    def test_error_status_raises(self, test_cache_dir):
+        with _client(lambda request: httpx.Response(500)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                fetch_page(client, "https://psp.test/c", test_cache_dir)
+
+
+class TestFetchText:
+    def test_uses_cache_only_with_cache_dir(self, test_cache_dir):
+        seen_headers: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(request.headers.get("if-none-match"))
+            return httpx.Response(200, text="page", headers={"ETag": '"v1"'})
+
+        with _client(handler) as client:
+            assert fetch_text(client, "https://psp.test/d") == "page"
+            assert fetch_text(client, "https://psp.test/d", test_cache_dir) == "page"
+            assert fetch_text(client, "https://psp.test/d", test_cache_dir) == "page"
+
+        assert seen_headers == [None, None, '"v1"']
+
+    def test_error_status_raises_without_cache(self):
+        with _client(lambda request: httpx.Response(404)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                fetch_text(client, "https://psp.test/e")
+
+    def test_error_status_can_be_returned_uncached(self, test_cache_dir):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, text="missing", headers={"ETag": '"x"'})
+
+        with _client(handler) as client:
+            page = fetch_page(client, "https://psp.test/f", test_cache_dir, raise_for_status=False)
+
+        assert page.status_code == 404
+        assert not (test_cache_dir / "http_cache").exists()
@@ -0,0 +1,57 @@
+"""Tests for the shared psp.cz HTTP client helpers."""
+
+import time
+
+import httpx
+import pytest
+
+from pspcz_analyzer.data import http_client
+from pspcz_analyzer.data.http_client import (
+    DOWNLOAD_CHUNK_SIZE,
+    RateLimiter,
+    close_clients,
+    download_to,
+    get_client,
+    host_limiter,
+)
+
+
+class TestRateLimiter:
+    def test_spaces_consecutive_waits(self):
+        limiter = RateLimiter(0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait()
+        assert time.monotonic() - start >= 0.1
+
+    def test_host_limiter_is_shared_per_host(self):
+        assert host_limiter("a.example", 0) is host_limiter("a.example", 0)
+        assert host_limiter("a.example", 0) is not host_limiter("b.example", 0)
+
+
+class TestSharedClient:
+    def test_client_is_reused_until_closed(self):
+        client = get_client()
+        assert get_client() is client
+        assert client.headers["User-Agent"].startswith("pspcz-analyzer")
+        close_clients()
+        assert client.is_closed
+        assert get_client() is not client
+
+
+class TestDownloadTo:
+    def _serve(self, monkeypatch, response: httpx.Response) -> None:
+        client = httpx.Client(transport=httpx.MockTransport(lambda request: response))
+        monkeypatch.setattr(http_client, "_client", client)
+
+    def test_streams_body_to_file(self, monkeypatch, tmp_path):
+        body = b"%PDF" + bytes(range(256)) * (DOWNLOAD_CHUNK_SIZE // 128)
+        self._serve(monkeypatch, httpx.Response(200, content=body))
+        dest = tmp_path / "1.pdf"
+        download_to("https://psp.test/1.pdf", dest)
+        assert dest.read_bytes() == body
+
+    def test_error_status_raises(self, monkeypatch, tmp_path):
+        self._serve(monkeypatch, httpx.Response(404))
+        with pytest.raises(httpx.HTTPStatusError):
+            download_to("https://psp.test/missing.pdf", tmp_path / "x.pdf")
@@ -0,0 +1,34 @@
+"""Tests for locale selection and translation lookup."""
+
+import contextvars
+
+from pspcz_analyzer.i18n import get_locale, gettext, ngettext, set_locale
+
+
+def _in_locale(lang: str, fn):
+    def run():
+        set_locale(lang)
+        return fn()
+
+    return contextvars.copy_context().run(run)
+
+
+class TestGettext:
+    def test_default_locale_is_czech(self):
+        ctx = contextvars.Context()
+        assert ctx.run(get_locale) == "cs"
+        assert ctx.run(gettext, "site.title") == "Poslanecká sněmovna"
+
+    def test_set_locale_switches_table(self):
+        assert _in_locale("en", get_locale) == "en"
+        assert _in_locale("en", lambda: gettext("site.title")) == "Czech Parliament"
+
+    def test_missing_key_and_unknown_locale_fall_back_to_key(self):
+        assert _in_locale("en", lambda: gettext("no.such.key")) == "no.such.key"
+        assert _in_locale("xx", lambda: gettext("site.title")) == "site.title"
+
+    def test_ngettext_picks_form(self):
+        assert _in_locale("en", lambda: ngettext("site.title", "no.such.key", 1)) == (
+            "Czech Parliament"
+        )
+        assert _in_locale("en", lambda: ngettext("site.title", "no.such.key", 2)) == ("no.such.key")
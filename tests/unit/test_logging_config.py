@@ -0,0 +1,33 @@
+"""Tests for routing standard-library logging into loguru."""
+
+import logging
+
+from loguru import logger
+
+from pspcz_analyzer.logging_config import _InterceptHandler
+
+
+def _log_from_caller(std_logger: logging.Logger) -> None:
+    std_logger.warning("hello %s", "world")
+
+
+class TestInterceptHandler:
+    def test_record_points_at_stdlib_caller(self):
+        std_logger = logging.getLogger("pspcz_test_intercept")
+        std_logger.propagate = False
+        handler = _InterceptHandler()
+        std_logger.addHandler(handler)
+        records: list[tuple[str, str, str]] = []
+        sink_id = logger.add(
+            lambda msg: records.append(
+                (msg.record["message"], msg.record["level"].name, msg.record["function"])
+            ),
+            level="DEBUG",
+        )
+        try:
+            _log_from_caller(std_logger)
+        finally:
+            logger.remove(sink_id)
+            std_logger.removeHandler(handler)
+
+        assert records == [("hello world", "WARNING", "_log_from_caller")]
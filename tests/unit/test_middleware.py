@@ -0,0 +1,111 @@
+"""Tests for the security headers middleware and request-time computation helper."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from fastapi import HTTPException
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from pspcz_analyzer.middleware import (
+    SecurityHeadersMiddleware,
+    VersionedStaticFiles,
+    run_in_process,
+    run_with_timeout,
+)
+
+
+async def _app_with_own_frame_header(scope, receive, send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"x-frame-options", b"SAMEORIGIN"), (b"content-type", b"text/plain")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+class TestRunWithTimeout:
+    def test_compute_and_io_use_separate_pools(self):
+        async def run() -> tuple[str, str]:
+            compute = await run_with_timeout(_thread_name)
+            io = await run_with_timeout(_thread_name, io_bound=True)
+            return compute, io
+
+        compute, io = asyncio.run(run())
+        assert compute.startswith("pspcz-compute")
+        assert io.startswith("pspcz-io")
+
+    def test_timeout_raises_503(self):
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(run_with_timeout(threading.Event().wait, 0.5, timeout=0.05))
+        assert exc_info.value.status_code == 503
+
+
+class TestRunInProcess:
+    def test_runs_in_worker_process(self):
+        pid = asyncio.run(run_in_process(os.getpid, timeout=30.0))
+        assert pid != os.getpid()
+
+
+class TestSecurityHeadersMiddleware:
+    def test_headers_added_and_overridden_once(self):
+        sent: list[dict] = []
+
+        async def send(message) -> None:
+            sent.append(message)
+
+        async def receive() -> dict:
+            return {"type": "http.request"}
+
+        middleware = SecurityHeadersMiddleware(_app_with_own_frame_header)
+        asyncio.run(middleware({"type": "http", "path": "/"}, receive, send))
+
+        headers = sent[0]["headers"]
+        assert [v for k, v in headers if k == b"x-frame-options"] == [b"DENY"]
+        assert (b"content-type", b"text/plain") in headers
+        assert (b"x-content-type-options", b"nosniff") in headers
+        assert sent[1]["body"] == b"ok"
+
+    def test_static_paths_pass_through(self):
+        sent: list[dict] = []
+
+        async def send(message) -> None:
+            sent.append(message)
+
+        async def receive() -> dict:
+            return {"type": "http.request"}
+
+        middleware = SecurityHeadersMiddleware(_app_with_own_frame_header)
+        asyncio.run(middleware({"type": "http", "path": "/static/style.css"}, receive, send))
+
+        assert sent[0]["headers"] == [
+            (b"x-frame-options", b"SAMEORIGIN"),
+            (b"content-type", b"text/plain"),
+        ]
+
+
+class TestVersionedStaticFiles:
+    @pytest.fixture()
+    def static_client(self, tmp_path):
+        (tmp_path / "style.css").write_text("body {}")
+        app = Starlette(routes=[Mount("/static", VersionedStaticFiles(directory=str(tmp_path)))])
+        return TestClient(app)
+
+    def test_versioned_url_is_immutable(self, static_client):
+        resp = static_client.get("/static/style.css?v=abc123")
+        assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert resp.headers["x-content-type-options"] == "nosniff"
+
+    def test_unversioned_url_revalidates(self, static_client):
+        resp = static_client.get("/static/style.css")
+        assert "cache-control" not in resp.headers
+        assert "etag" in resp.headers
@@ -1,9 +1,10 @@
 """Tests for UNL file parser."""
 
 import polars as pl
+import pytest
 
 from pspcz_analyzer.config import UNL_ENCODING
-from pspcz_analyzer.data.parser import parse_unl
+from pspcz_analyzer.data.parser import parse_unl, parse_unl_multi
 
 
 def _write_unl(tmp_path, filename, lines):
@@ -78,6 +79,13 @@ class TestParseUnl:
         assert df.height == 0
         assert df.columns == ["a", "b", "c"]
 
+    def test_whitespace_only_file(self, tmp_path):
+        path = tmp_path / "blank.unl"
+        path.write_bytes(b"\r\n  \n")
+        df = parse_unl(path, ["a", "b"])
+        assert df.height == 0
+        assert df.columns == ["a", "b"]
+
     def test_quote_char_none(self, tmp_path):
         """Literal double quotes in data should not be treated as CSV quoting."""
         path = _write_unl(
@@ -100,3 +108,20 @@ class TestParseUnl:
         )
         assert df["a"].to_list() == [42]
         assert df["b"].to_list() == [100]
+
+
+class TestParseUnlMulti:
+    def test_concatenates_matching_files(self, tmp_path):
+        _write_unl(tmp_path, "hl2021h1.unl", ["1|A|", "2|B|"])
+        _write_unl(tmp_path, "hl2021h2.unl", ["3|Č|"])
+        (tmp_path / "hl2021h3.unl").write_bytes(b"")
+        _write_unl(tmp_path, "hl2021s.unl", ["9|X|"])
+
+        df = parse_unl_multi(tmp_path, "hl2021h*.unl", ["id", "v"], {"id": pl.Int32})
+
+        assert df["id"].to_list() == [1, 2, 3]
+        assert df["v"].to_list() == ["A", "B", "Č"]
+
+    def test_no_matching_files(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            parse_unl_multi(tmp_path, "hl2021h*.unl", ["id"])
@@ -2,10 +2,9 @@
 
 import markupsafe
 
-from pspcz_analyzer.main_frontend import _md_filter
 from pspcz_analyzer.routes.pages import _safe_referer
-from pspcz_analyzer.routes.utils import _safe_url
 from pspcz_analyzer.services.llm import _sanitize_llm_input
+from pspcz_analyzer.templating import _md_filter, _safe_url
 
 
 class TestSafeUrl:
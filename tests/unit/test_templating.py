@@ -0,0 +1,160 @@
+"""Tests for the shared frontend Jinja2 environment."""
+
+import asyncio
+import gzip
+
+import markdown
+import nh3
+from starlette.requests import Request
+
+from pspcz_analyzer import templating
+from pspcz_analyzer.routes import amendments, feedback, laws, pages, tisk
+from pspcz_analyzer.services.analysis_cache import AnalysisCache
+from pspcz_analyzer.templating import (
+    STATIC_DIR,
+    _md_filter,
+    _render_md,
+    cached_partial,
+    static_url,
+    templates,
+    warm_templates,
+)
+
+
+class TestSharedTemplates:
+    def test_all_routers_share_one_environment(self):
+        for module in (amendments, feedback, laws, pages, tisk):
+            assert module.templates.env is templates.env
+
+    def test_filters_and_i18n_registered(self):
+        assert templates.env.filters["markdown"] is _md_filter
+        assert "_" in templates.env.globals
+        assert templates.env.bytecode_cache is not None
+
+    def test_warm_templates_loads_every_template(self):
+        count = warm_templates()
+        assert count == len(templates.env.list_templates(extensions=["html"]))
+        assert count > 0
+        assert templates.env.cache is not None
+        cached_names = {name for _, name in templates.env.cache}
+        assert "partials/loyalty_table.html" in cached_names
+
+    def test_static_url_stamped_with_content_hash(self):
+        url = static_url("style.css")
+        assert url.startswith("/static/style.css?v=")
+        assert url == static_url("style.css")
+        assert (STATIC_DIR / "style.css").exists()
+        assert static_url("missing.css") == "/static/missing.css"
+
+
+class TestMarkdownFilter:
+    def test_matches_fresh_converter(self):
+        texts = ["# Nadpis\n\n- a\n- b", "řádek 1\nřádek 2", "[odkaz][1]\n\n[1]: https://psp.cz"]
+        for text in texts:
+            assert str(_md_filter(text)) == nh3.clean(markdown.markdown(text, extensions=["nl2br"]))
+
+    def test_state_does_not_leak_between_inputs(self):
+        # Reference-style link definitions are per-document parse state
+        _md_filter("[x][1]\n\n[1]: https://psp.cz")
+        assert "href" not in str(_md_filter("[x][1]"))
+
+    def test_repeat_renders_hit_cache(self):
+        _render_md.cache_clear()
+        _md_filter("**tučně**")
+        _md_filter("**tučně**")
+        assert _render_md.cache_info().hits == 1
+
+
+def _request(lang: str, if_none_match: str = "") -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+    request.state.lang = lang
+    return request
+
+
+class TestCachedPartial:
+    def test_hit_skips_context_and_render(self, monkeypatch):
+        monkeypatch.setattr(templating, "analysis_cache", AnalysisCache())
+        builds = 0
+
+        async def build_context() -> dict:
+            nonlocal builds
+            builds += 1
+            return {"rows": []}
+
+        async def render_twice() -> tuple[bytes, bytes]:
+            first = await cached_partial(
+                _request("cs"), "loyalty:1", "partials/loyalty_table.html", build_context
+            )
+            second = await cached_partial(
+                _request("cs"), "loyalty:1", "partials/loyalty_table.html", build_context
+            )
+            return bytes(first.body), bytes(second.body)
+
+        first, second = asyncio.run(render_twice())
+        assert first == second
+        assert builds == 1
+
+    def test_cached_per_language(self, monkeypatch):
+        cache = AnalysisCache()
+        monkeypatch.setattr(templating, "analysis_cache", cache)
+
+        async def build_context() -> dict:
+            return {"rows": []}
+
+        for lang in ("cs", "en"):
+            asyncio.run(
+                cached_partial(
+                    _request(lang), "loyalty:1", "partials/loyalty_table.html", build_context
+                )
+            )
+        assert cache.get("html:cs:loyalty:1") is not None
+        assert cache.get("html:en:loyalty:1") is not None
+        assert cache.invalidate("html:") == 2
+
+    def test_matching_etag_returns_304(self, monkeypatch):
+        monkeypatch.setattr(templating, "analysis_cache", AnalysisCache())
+
+        async def build_context() -> dict:
+            return {"rows": []}
+
+        async def render(if_none_match: str):
+            return await cached_partial(
+                _request("cs", if_none_match),
+                "loyalty:1",
+                "partials/loyalty_table.html",
+                build_context,
+            )
+
+        first = asyncio.run(render(""))
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        # Weak tags compare equal with or without the W/ prefix
+        revalidated = asyncio.run(render(f'{etag.removeprefix("W/")}, "other"'))
+        assert revalidated.status_code == 304
+        assert revalidated.body == b""
+        assert revalidated.headers["etag"] == etag
+
+        assert asyncio.run(render('"stale"')).status_code == 200
+
+    def test_gzip_copy_served_when_accepted(self, monkeypatch):
+        monkeypatch.setattr(templating, "analysis_cache", AnalysisCache())
+
+        async def build_context() -> dict:
+            return {"rows": []}
+
+        async def render(accept_encoding: str):
+            request = _request("cs")
+            request.scope["headers"] = [(b"accept-encoding", accept_encoding.encode())]
+            return await cached_partial(
+                request, "loyalty:1", "partials/loyalty_table.html", build_context
+            )
+
+        plain = asyncio.run(render("identity"))
+        compressed = asyncio.run(render("gzip, br"))
+        assert "content-encoding" not in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(compressed.body) == plain.body
+        assert compressed.headers["etag"] == plain.headers["etag"]
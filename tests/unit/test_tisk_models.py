@@ -0,0 +1,74 @@
+"""Tests for PeriodData derived properties and lookups."""
+
+import polars as pl
+
+from pspcz_analyzer.models.tisk_models import PeriodData, TiskInfo
+from tests.fixtures.sample_data import make_mp_info, make_mp_votes, make_void_votes
+
+
+class TestPeriodStats:
+    def test_date_range_is_chronological_and_cached(self):
+        votes = pl.DataFrame({"datum": [" 05.03.2022", "28.11.2021", None, "bad", "01.02.2023 "]})
+        pd = PeriodData(
+            period=9,
+            votes=votes,
+            mp_votes=make_mp_votes(),
+            void_votes=make_void_votes(),
+            mp_info=make_mp_info(),
+        )
+
+        stats = pd.stats
+        assert stats["date_min"] == "28.11.2021"
+        assert stats["date_max"] == "01.02.2023"
+        assert stats["total_votes"] == 5
+        assert pd.stats is stats
+
+    def test_no_parseable_dates(self):
+        pd = PeriodData(
+            period=9,
+            votes=pl.DataFrame({"datum": pl.Series([], dtype=pl.Utf8)}),
+            mp_votes=make_mp_votes(),
+            void_votes=make_void_votes(),
+            mp_info=make_mp_info(),
+        )
+        assert (pd.stats["date_min"], pd.stats["date_max"]) == ("N/A", "N/A")
+
+
+class TestTiskCtIndex:
+    def test_first_entry_per_ct_wins(self):
+        first = TiskInfo(id_tisk=1, ct=100, nazev="A", period=9)
+        second = TiskInfo(id_tisk=2, ct=100, nazev="B", period=9)
+        other = TiskInfo(id_tisk=3, ct=200, nazev="C", period=9)
+        pd = PeriodData(
+            period=9,
+            votes=pl.DataFrame({"datum": pl.Series([], dtype=pl.Utf8)}),
+            mp_votes=make_mp_votes(),
+            void_votes=make_void_votes(),
+            mp_info=make_mp_info(),
+            tisk_lookup={(1, 1): first, (1, 2): second, (2, 1): other},
+        )
+        assert pd.get_tisk_by_ct(100) is first
+        assert pd.get_tisk_by_ct(200) is other
+        assert pd.get_tisk_by_ct(300) is None
+
+
+class TestTopicLabels:
+    def test_cached_per_language_until_invalidated(self):
+        tisk = TiskInfo(
+            id_tisk=1, ct=1, nazev="A", period=9, topics=["Zdraví"], topics_en=["Health"]
+        )
+        pd = PeriodData(
+            period=9,
+            votes=pl.DataFrame({"datum": pl.Series([], dtype=pl.Utf8)}),
+            mp_votes=make_mp_votes(),
+            void_votes=make_void_votes(),
+            mp_info=make_mp_info(),
+            tisk_lookup={(1, 1): tisk},
+        )
+        assert pd.get_all_topic_labels("cs") == ["Zdraví"]
+        assert pd.get_all_topic_labels("en") == ["Health"]
+
+        tisk.topics = ["Doprava", "Zdraví"]
+        assert pd.get_all_topic_labels("cs") == ["Zdraví"]
+        pd.invalidate_topic_labels()
+        assert pd.get_all_topic_labels("cs") == ["Doprava", "Zdraví"]